@@ -1,42 +1,72 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
+import time
 import warnings
 from abc import ABC, abstractmethod
-from typing import Callable, Literal, Optional, Tuple, Union, overload
+from typing import Any, Awaitable, Callable, Coroutine, Literal, Optional, Tuple, overload
 
 import pygame
-from OpenGL.GL import glTranslatef  # type: ignore
-from OpenGL.GL import (GL_COLOR_BUFFER_BIT,  # type: ignore
-                       GL_DEPTH_BUFFER_BIT, GL_DEPTH_TEST, GL_LESS,  # type: ignore
-                       GL_LINE_SMOOTH, GL_LINE_SMOOTH_HINT, GL_NICEST,  # type: ignore
-                       GL_SMOOTH, glClear, glClearColor, glClearDepth,  # type: ignore
-                       glDepthFunc, glEnable, glHint, glRotatef, glShadeModel)  # type: ignore
-from OpenGL.GLU import gluPerspective  # type: ignore
 
 import GraphicEngine._common as _common
-import GraphicEngine.shapes as shapes
+import GraphicEngine._paint as _paint
 from GraphicEngine._baseButton import BaseButtonAbstract
+from GraphicEngine._canvas import Canvas
+from GraphicEngine._drawLog import DrawLogWriter, DrawOp
+from GraphicEngine._frameRecorder import FrameRecorder
+from GraphicEngine._layer import Layer, LayerStack
+from GraphicEngine._listView import ListViewAbstract
+from GraphicEngine._postProcess import PostFilter, PostProcessChain
 from GraphicEngine._processColor import getColor_Int
+from GraphicEngine._resolutionScaler import ResolutionScaler
+from GraphicEngine._rollingStats import RollingStats
+from GraphicEngine._stripChart import StripChartAbstract
+from GraphicEngine._textEditor import TextEditorAbstract
 from GraphicEngine._textInput import TextInputAbstract
 
 warnings.simplefilter("once", category=(PendingDeprecationWarning, DeprecationWarning))  # type: ignore
 
 
-class PygameGFX(ABC):
-    __height: int
-    __width: int
+def _openGL():
+    """
+    OpenGL helpers, imported on first use so 2D sketches never load PyOpenGL
+    """
+    import GraphicEngine._openGL as openGL
+    return openGL
+
+
+def _resolve(waiter: asyncio.Future[None]):
+    # the awaiting task may have been cancelled in the meantime
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+# events whose latency from arrival to the presented frame is measured
+_INPUT_EVENTS = frozenset((
+    pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+    pygame.MOUSEMOTION, pygame.MOUSEWHEEL, pygame.TEXTINPUT,
+))
+
+# posted by redraw() and Stop() to wake up a loop blocked in pygame.event.wait
+_WAKE_EVENT = pygame.event.custom_type()
+
+
+class PygameGFX(Canvas, ABC):
+    """
+    Sketch drawing on the pygame window, Setup() runs once and Draw() every frame.
+    """
     __mousePosition: Tuple[int, int]
     __backgroundSurface: pygame.surface.Surface
-    __displaySurface: pygame.surface.Surface
     __running: bool
     __fps: int
     __keyCode: int
-    __translationMatrix: list[tuple[float, float]] = [(0.0, 0.0)]
-    __fill: Optional[_common.ColorValue] = None
-    __stroke: Optional[_common.ColorValue] = None
-    __strokeWeight: int = 0
+    __frameCount: int = 0
+    __frameTime: float = 0.0
+    __recorder: Optional[FrameRecorder] = None
+    __snapshotRecorder: Optional[FrameRecorder] = None
+    __upscaleSurface: Optional[pygame.Surface] = None
     fieldOfView: int = 45
-    drawShapes = shapes
 
     @property
     def BackgroundSurface(self):
@@ -44,48 +74,81 @@ class PygameGFX(ABC):
 
     @property
     def DisplaySurface(self):
-        return self.__displaySurface
+        """
+        Full resolution surface for widgets and shapes, the frame drawn by the
+        drawing methods while the resolution is scaled, otherwise Surface
+        """
+        return self.__widgetSurface if self.__widgetSurface is not None else self.Surface
 
     @property
-    def Width(self):
-        return self.__width
+    def IsRunning(self):
+        return self.__running
 
     @property
-    def Height(self):
-        return self.__height
+    def IsLooping(self) -> bool:
+        return self.__looping
 
     @property
-    def Font(self):
-        return self.__font
+    def frameCount(self) -> int:
+        return self.__frameCount
 
     @property
-    def IsRunning(self):
-        return self.__running
+    def frameTime(self) -> float:
+        """
+        Seconds since the first frame, fixed at frameCount / fps when rendering offline
+        """
+        return self.__frameTime
 
     @property
-    def keyCode(self) -> int:
-        return self.__keyCode
+    def fps(self) -> int:
+        return self.__fps
 
     @property
-    def mousePosition(self):
-        self.__mousePosition = pygame.mouse.get_pos()
-        return self.__mousePosition
+    def frameStats(self) -> RollingStats:
+        """
+        Duration of the recent frames in ms, from Draw() until the flip returned
+        """
+        return self.__frameStats
 
     @property
-    def aspectRatio(self):
-        return self.Width / self.Height
+    def inputLatency(self) -> RollingStats:
+        """
+        Estimated time in ms from the arrival of each recent input event until
+        the frame handling it was presented. pygame events carry no arrival time,
+        so an event is taken to have arrived halfway between the poll that read
+        it and the previous one. The time it waited in the queue, which
+        lateSampling shortens, is included.
+        """
+        return self.__inputLatency
+
+    @property
+    def filterStats(self) -> dict[str, RollingStats]:
+        """
+        Time in ms of each post-processing filter over the recent frames
+        """
+        return self.__postProcess.Stats
 
     @property
-    def __xTranslation(self) -> float:
-        return self.__translationMatrix[self.__translationIndex][0]
+    def Recorder(self) -> Optional[FrameRecorder]:
+        return self.__recorder
 
     @property
-    def __yTranslation(self) -> float:
-        return self.__translationMatrix[self.__translationIndex][1]
+    def keyCode(self) -> int:
+        return self.__keyCode
 
     @property
-    def __translationIndex(self) -> int:
-        return len(self.__translationMatrix)-1
+    def mousePosition(self):
+        x, y = pygame.mouse.get_pos()
+        if self.__sdlScaled:
+            x, y = int(x / self.renderScale), int(y / self.renderScale)
+        self.__mousePosition = (x, y)
+        return self.__mousePosition
+
+    def __renderSize(self, renderScale: float) -> Tuple[int, int]:
+        width, height = self.__backgroundSurface.get_size()
+        if self.__sdlScaled:
+            return width, height
+        return max(1, round(width * renderScale)), max(1, round(height * renderScale))
 
     class Button(BaseButtonAbstract):
         def __init__(
@@ -141,6 +204,61 @@ class PygameGFX(ABC):
                 surface, rect, text, background, foreground, justify, font, padX, padY
             )
 
+    class TextEditor(TextEditorAbstract):
+        def __init__(
+            self,
+            surface: pygame.Surface,
+            rect: pygame.Rect,
+            text: str = "",
+            background: _common.ColorValue = (255, 255, 255),
+            foreground: _common.ColorValue = (0, 0, 0),
+            selection: _common.ColorValue = (0xB4, 0xD5, 0xFE),
+            font: Optional[pygame.font.Font] = None,
+            padX: int = 4,
+            padY: int = 2,
+        ):
+            super(PygameGFX.TextEditor, self).__init__(
+                surface, rect, text, background, foreground, selection, font, padX, padY
+            )
+
+    class ListView(ListViewAbstract):
+        def __init__(
+            self,
+            surface: pygame.Surface,
+            rect: pygame.Rect,
+            data: Any,
+            columns: Optional[list[str]] = None,
+            columnWidths: Optional[list[int]] = None,
+            formatters: Optional[dict[str, Callable[[Any], str]]] = None,
+            font: Optional[pygame.font.Font] = None,
+            background: _common.ColorValue = (255, 255, 255),
+            alternate: _common.ColorValue = (0xF2, 0xF2, 0xF2),
+            foreground: _common.ColorValue = (0, 0, 0),
+            selection: _common.ColorValue = (0xB4, 0xD5, 0xFE),
+            header: _common.ColorValue = (0xDC, 0xDC, 0xDC),
+            onSelect: Optional[Callable[[int], None]] = None,
+            padX: int = 4,
+        ):
+            super(PygameGFX.ListView, self).__init__(
+                surface, rect, data, columns, columnWidths, formatters, font,
+                background, alternate, foreground, selection, header, onSelect, padX
+            )
+
+    class StripChart(StripChartAbstract):
+        def __init__(
+            self,
+            surface: pygame.Surface,
+            rect: pygame.Rect,
+            channels: int = 1,
+            samplesPerPixel: int = 1,
+            colors: Optional[list[_common.ColorValue]] = None,
+            background: _common.ColorValue = (0, 0, 0),
+            yRange: Optional[Tuple[float, float]] = None,
+        ):
+            super(PygameGFX.StripChart, self).__init__(
+                surface, rect, channels, samplesPerPixel, colors, background, yRange
+            )
+
     def __init__(
         self,
         width: int = 0,
@@ -148,55 +266,298 @@ class PygameGFX(ABC):
         caption: Optional[str] = None,
         fps: Optional[int] = None,
         flags: int = pygame.SRCALPHA,
+        renderScale: float = 1.0,
+        renderScaleBounds: Optional[Tuple[float, float]] = None,
+        scaleFilter: Literal["nearest"] | Literal["smooth"] | Literal["scaled"] = "nearest",
+        opaque: bool = False,
+        lateSampling: bool = False,
     ) -> None:
+        """
+        renderScale renders the frame (Surface) at a fraction of the canvas size and
+        upscales it on presentation with scaleFilter, "scaled" lets SDL scale the
+        window (pygame.SCALED) and keeps the scale fixed. With renderScaleBounds
+        (min, max) the scale follows the measured frame time. DisplaySurface then
+        stays a full resolution surface, cleared by background() and shown over
+        the frame, so widgets built on it keep working when the scale changes.
+
+        opaque is for sketches without transparency in their frame: DisplaySurface
+        is then the display itself (or a display format surface when scaled), so
+        there is no full screen alpha blend on presentation.
+
+        lateSampling waits for the next frame before reading events instead of
+        after the flip, so input is sampled right before Draw().
+        """
         self.__running = True
+        self.__looping = True
+        self.__redrawRequested = True
+        self.__idleTimeout: Optional[int] = None
+        self.__lateSampling = lateSampling
+        self.__frameStats = RollingStats()
+        self.__inputLatency = RollingStats()
+        self.__inputTimes: list[float] = []
+        self.__lastPoll: Optional[int] = None
+        self.__tasks: set[asyncio.Task[Any]] = set()
+        self.__frameDeadline = 0.0
+        self.__frameWaiters: list[asyncio.Future[None]] = []
+        self.__opaque = opaque
+        self.__pendingSnapshots: list[str] = []
         self.__flags = pygame.DOUBLEBUF | flags
-        if height and width:
+        self.__scaleFilter = scaleFilter
+        self.__sdlScaled = scaleFilter == "scaled" and renderScale != 1.0 and bool(width and height)
+        if height and width and self.__sdlScaled:
+            self.__backgroundSurface = pygame.display.set_mode(
+                (round(width * renderScale), round(height * renderScale)), self.__flags | pygame.SCALED
+            )
+        elif height and width:
             self.__backgroundSurface = pygame.display.set_mode(
                 (width, height), self.__flags
             )
-            self.__height = height
-            self.__width = width
         else:
             self.__backgroundSurface = pygame.display.set_mode(
                 (0, 0), self.__flags, pygame.FULLSCREEN
             )
-            self.__height = self.__backgroundSurface.get_width()
-            self.__width = self.__backgroundSurface.get_height()
-        self.__displaySurface = pygame.Surface(self.__backgroundSurface.get_rect().size, pygame.SRCALPHA)
+            height = self.__backgroundSurface.get_width()
+            width = self.__backgroundSurface.get_height()
+        super().__init__(width, height, self.__backgroundSurface, renderScale)
+        self.__createDisplaySurface(renderScale)
+        self.__widgetSurface: Optional[pygame.Surface] = None
+        if (renderScale != 1.0 or renderScaleBounds is not None) and not self.__sdlScaled:
+            self.__widgetSurface = pygame.Surface(self.__backgroundSurface.get_size(), pygame.SRCALPHA)
+        self.__layers = LayerStack(self.__backgroundSurface.get_size())
+        self.__postProcess = PostProcessChain()
         self.__fps = fps if fps is not None else 60
+        self.__scaler = ResolutionScaler(
+            1000 / (self.__fps or 60), renderScale, *renderScaleBounds
+        ) if renderScaleBounds is not None and not self.__sdlScaled else None
+        if self.__scaler is not None:
+            self.__createDisplaySurface(self.__scaler.Scale)
         self.FramePerSec = pygame.time.Clock()
         if caption:
             pygame.display.set_caption(caption)
 
     def _checkForEvents(self):
         events = pygame.event.get()
+        readTime = pygame.time.get_ticks()
+        # the events arrived some time since the previous poll
+        arrival = readTime if self.__lastPoll is None else (self.__lastPoll + readTime) / 2
+        self.__lastPoll = readTime
         for event in events:
-            match event.type:  # type: ignore
-                case pygame.QUIT:
-                    self.__running = False
-                case pygame.KEYDOWN:
-                    self.__keyCode = event.key
-                    self.keyPressed()
-                case pygame.KEYUP:
-                    self.__keyCode = event.key
-                    self.keyReleased()
-                case pygame.MOUSEBUTTONDOWN:
-                    self.__mousePosition = pygame.mouse.get_pos()
-                    self.mousePressed()
-                case pygame.MOUSEBUTTONUP:
-                    self.__mousePosition = pygame.mouse.get_pos()
-                    self.mouseReleased()
+            self.__handleEvent(event, arrival)
+
+    def __waitForEvents(self):
+        # blocks until an event arrives or the idle timeout passes, which also redraws
+        event = pygame.event.wait(self.__idleTimeout or 0)
+        self.__lastPoll = pygame.time.get_ticks()
+        if event.type == pygame.NOEVENT:
+            self.__redrawRequested = True
+        else:
+            # wait() returns as soon as the event arrives
+            self.__handleEvent(event, self.__lastPoll)
+        self._checkForEvents()
+
+    def __handleEvent(self, event: pygame.event.Event, arrival: float):
+        self.__redrawRequested = True
+        if event.type in _INPUT_EVENTS:
+            self.__inputTimes.append(arrival)
+        match event.type:  # type: ignore
+            case pygame.QUIT:
+                self.__running = False
+            case pygame.KEYDOWN:
+                self.__keyCode = event.key
+                self.keyPressed()
+            case pygame.KEYUP:
+                self.__keyCode = event.key
+                self.keyReleased()
+            case pygame.MOUSEBUTTONDOWN:
+                self.__mousePosition = pygame.mouse.get_pos()
+                self.mousePressed()
+            case pygame.MOUSEBUTTONUP:
+                self.__mousePosition = pygame.mouse.get_pos()
+                self.mouseReleased()
+        self.eventReceived(event)
 
     def setCanvasSize(self, width: int, height: int):
-        self.__height = height
-        self.__width = width
+        self._setSize(width, height)
         self.__backgroundSurface = pygame.display.set_mode(
-            (self.__width, self.__height), pygame.SRCALPHA
+            (width, height), pygame.SRCALPHA
         )
+        self.__layers.resize(self.__backgroundSurface.get_size())
+        self.__createDisplaySurface()
+        if self.__widgetSurface is not None:
+            self.__widgetSurface = pygame.Surface(self.__backgroundSurface.get_size(), pygame.SRCALPHA)
 
     def Stop(self):
         self.__running = False
+        self.__wake()
+
+    def noLoop(self, timeout: Optional[int] = None):
+        """
+        Stops calling Draw() every frame, the loop sleeps until redraw() is called
+        or an event arrives. With timeout (ms) a frame is also drawn after that
+        much idle time.
+        """
+        self.__looping = False
+        self.__idleTimeout = timeout
+
+    def loop(self):
+        self.__looping = True
+        self.__wake()
+
+    def redraw(self):
+        """
+        Requests a frame while not looping, safe to call from other threads
+        (e.g. when a data source changed).
+        """
+        self.__redrawRequested = True
+        self.__wake()
+
+    def __wake(self):
+        if pygame.display.get_init():
+            pygame.event.post(pygame.event.Event(_WAKE_EVENT))
+
+    def createLayer(self, name: str, draw: Callable[[], None], z: int = -1, opaque: bool = False) -> Layer:
+        """
+        Adds a cached layer, draw uses the regular drawing methods and is only called
+        again after the layer is invalidated. Layers with z < 0 are shown under
+        the frame drawn in Draw(), the others over it.
+        """
+        return self.__layers.add(name, draw, z, opaque)
+
+    def addFilter(self, postFilter: PostFilter, name: Optional[str] = None) -> PostFilter:
+        """
+        Appends a filter (Blur, Bloom, Vignette, ColorGrade or a PostFilter subclass)
+        run on every composited frame before it is shown
+        """
+        return self.__postProcess.add(postFilter, name)
+
+    def removeFilter(self, postFilter: PostFilter):
+        self.__postProcess.remove(postFilter)
+
+    def clearFilters(self):
+        self.__postProcess.clear()
+
+    def layer(self, name: str) -> Layer:
+        return self.__layers[name]
+
+    def removeLayer(self, name: str):
+        self.__layers.remove(name)
+        if self.drawLog is not None:
+            self.drawLog.writeLayerRemoved(name)
+
+    def invalidateLayer(self, name: str):
+        self.__layers[name].invalidate()
+
+    def startDrawLog(self, output: str = "draw.gedl") -> DrawLogWriter:
+        drawLog = super().startDrawLog(output)
+        # the first logged frame redraws every layer, so the log holds their contents
+        for layer in self.__layers:
+            layer.invalidate()
+        return drawLog
+
+    def __updateLayers(self):
+        if self.drawLog is not None:
+            for layer in self.__layers:
+                self.drawLog.writeLayer(layer.Name, layer.Z, layer.Opaque, layer.Visible)
+        self.__layers.update(self.__redrawLayer)
+
+    def __redrawLayer(self, layer: Layer):
+        drawLog = self.drawLog
+        if drawLog is not None:
+            drawLog.writeText(DrawOp.LAYER_DRAW, layer.Name)
+        # layers have the size of BackgroundSurface and are drawn at full resolution
+        with self._drawingOn(layer.Surface, self.renderScale if self.__sdlScaled else 1.0, logged=True):
+            layer.redraw()
+        if drawLog is not None:
+            drawLog.write(DrawOp.LAYER_END)
+
+    def __createDisplaySurface(self, renderScale: Optional[float] = None):
+        renderScale = self.renderScale if renderScale is None else renderScale
+        size = self.__renderSize(renderScale)
+        if not self.__opaque:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+        elif size == self.__backgroundSurface.get_size():
+            surface = self.__backgroundSurface
+        else:
+            surface = pygame.Surface(size).convert(self.__backgroundSurface)
+        self._setTarget(surface, renderScale)
+
+    def __presentDisplay(self):
+        self.__presentFrame()
+        if self.__widgetSurface is not None:
+            self.BackgroundSurface.blit(self.__widgetSurface, (0, 0))
+
+    def __presentFrame(self):
+        size = self.__backgroundSurface.get_size()
+        if self.Surface is self.__backgroundSurface:
+            return
+        if self.Surface.get_size() == size:
+            self.BackgroundSurface.blit(self.Surface, (0, 0))
+            return
+        if self.__opaque:
+            if self.__scaleFilter == "smooth":
+                pygame.transform.smoothscale(self.Surface, size, self.BackgroundSurface)
+            else:
+                pygame.transform.scale(self.Surface, size, self.BackgroundSurface)
+            return
+        if self.__upscaleSurface is None or self.__upscaleSurface.get_size() != size:
+            self.__upscaleSurface = pygame.Surface(size, pygame.SRCALPHA)
+        if self.__scaleFilter == "smooth":
+            pygame.transform.smoothscale(self.Surface, size, self.__upscaleSurface)
+        else:
+            pygame.transform.scale(self.Surface, size, self.__upscaleSurface)
+        self.BackgroundSurface.blit(self.__upscaleSurface, (0, 0))
+
+    def __adjustRenderScale(self, frameTime: float):
+        if self.__scaler is not None and self.__scaler.update(frameTime):
+            self.__createDisplaySurface(self.__scaler.Scale)
+
+    def startRecording(
+        self,
+        output: str = "frame-#####.png",
+        mode: Literal["frames"] | Literal["raw"] = "frames",
+        queueSize: int = 8,
+        backpressure: Literal["drop"] | Literal["block"] = "drop",
+    ) -> FrameRecorder:
+        """
+        Captures every composited frame on a background encoder until stopRecording
+        """
+        self.stopRecording()
+        self.__recorder = FrameRecorder(output, mode, queueSize, backpressure)
+        return self.__recorder
+
+    def stopRecording(self) -> Optional[FrameRecorder]:
+        recorder, self.__recorder = self.__recorder, None
+        if recorder is not None:
+            recorder.close()
+        return recorder
+
+    def saveFrame(self, fileName: str = "screen-####.png"):
+        """
+        Saves the current frame once it is composited, without blocking the loop
+        """
+        self.__pendingSnapshots.append(_common.frameFileName(fileName, self.__frameCount))
+
+    def __captureFrame(self):
+        if self.__recorder is not None:
+            self.__recorder.capture(self.BackgroundSurface, self.__frameCount)
+        if self.__pendingSnapshots:
+            if self.__snapshotRecorder is None:
+                self.__snapshotRecorder = FrameRecorder("", backpressure="block")
+            for fileName in self.__pendingSnapshots:
+                self.__snapshotRecorder.capture(self.BackgroundSurface, fileName=fileName)
+            self.__pendingSnapshots.clear()
+
+    def _shutdown(self):
+        # the recorders raise their write errors on close, the other outputs are still closed
+        snapshotRecorder, self.__snapshotRecorder = self.__snapshotRecorder, None
+        try:
+            self.stopRecording()
+        finally:
+            try:
+                self.stopDrawLog()
+            finally:
+                if snapshotRecorder is not None:
+                    snapshotRecorder.close()
 
     def setPerspective(
         self, fieldOfView: Optional[int] = None, near: Optional[float] = 0.1, far: Optional[float] = None
@@ -210,7 +571,7 @@ class PygameGFX(ABC):
             self.fieldOfView = fieldOfView
         nearVal = 0.1 if near is None else near
         farVal = max([self.Width, self.Height]) * 2 if far is None else far
-        gluPerspective(self.fieldOfView, self.aspectRatio, nearVal, farVal)
+        _openGL().perspective(self.fieldOfView, self.aspectRatio, nearVal, farVal)
 
     @overload
     def translate(self, x: float, y: float) -> None:
@@ -222,35 +583,11 @@ class PygameGFX(ABC):
 
     def translate(self, x: float, y: float, z: Optional[float] = None) -> None:
         """
-        Only for OpenGL now
+        z is only used with OpenGL
         """
         if (z is not None):
-            glTranslatef(x, y, z)
-        newX = self.__xTranslation + x
-        newY = self.__yTranslation + y
-        self.__translationMatrix[self.__translationIndex] = (newX, newY)
-
-    def push(self):
-        self.__translationMatrix.append((self.__xTranslation, self.__yTranslation))
-
-    def pop(self):
-        if (self.__translationIndex > 0):
-            self.__translationMatrix.pop()
-
-    def fill(self, color: _common.ColorValue):
-        self.__fill = color
-
-    def noFill(self):
-        self.__fill = None
-
-    def stroke(self, color: _common.ColorValue):
-        self.__stroke = color
-
-    def noStroke(self):
-        self.__stroke = None
-
-    def strokeWeight(self, value: int):
-        self.__strokeWeight = value
+            _openGL().translate(x, y, z)
+        super().translate(x, y, z)
 
     def rotate(
         self,
@@ -262,53 +599,198 @@ class PygameGFX(ABC):
         """
         Only for OpenGL now
         """
+        super().rotate(angle, x, y, z)
         if pygame.OPENGL & self.__flags != pygame.OPENGL:
             return
-        glRotatef(angle, x, y, z)
+        _openGL().rotate(angle, x, y, z)
 
-    def Run(self):
+    def __prepare(self):
         pygame.init()
         self.setFont()
         if pygame.OPENGL & self.__flags == pygame.OPENGL:
-            glClearDepth(1.0)
-            glDepthFunc(GL_LESS)  # type: ignore
-            glEnable(GL_DEPTH_TEST)  # type: ignore
-            glShadeModel(GL_SMOOTH)  # type: ignore
+            _openGL().initialize()
             self.setPerspective()
+
+    def _initialize(self):
+        self.__prepare()
         self.Setup()
+
+    def __beginFrame(self, frameCount: int, frameTime: float):
+        self.__frameCount = frameCount
+        self.__frameTime = frameTime
+        self._resetTranslation()
+
+    def _renderFrame(self, frameCount: int, frameTime: float):
+        self.__beginFrame(frameCount, frameTime)
+        self.Draw()
+        self.__endFrame()
+
+    def __endFrame(self):
+        if self.__layers.IsEmpty:
+            self.__presentDisplay()
+        else:
+            self.__updateLayers()
+            if not self.__opaque:
+                self.__layers.blitBelow(self.BackgroundSurface)
+            self.__presentDisplay()
+            self.__layers.blitAbove(self.BackgroundSurface)
+        if not self.__postProcess.IsEmpty and pygame.OPENGL & self.__flags != pygame.OPENGL:
+            self.__postProcess.apply(self.BackgroundSurface)
+        self.__captureFrame()
+        if self.drawLog is not None:
+            self.drawLog.endFrame()
+
+    def Run(self):
+        self._initialize()
+        frameCount = 0
+        startTicks = pygame.time.get_ticks()
         while self.IsRunning:
-            self._checkForEvents()
-            self.__translationMatrix[self.__translationIndex] = (0.0, 0.0)
-            self.Draw()
-            self.BackgroundSurface.blit(self.DisplaySurface, (0, 0))
-            pygame.display.flip()
-            pygame.time.wait(int(1000 / self.__fps))
-            if self.__fps:
-                self.FramePerSec.tick(self.__fps)
+            if self.__lateSampling and self.__looping:
+                self.__waitForFrame()
+            if self.__looping:
+                self._checkForEvents()
             else:
+                self.__waitForEvents()
+                if not self.__redrawRequested or not self.IsRunning:
+                    continue
+            self.__redrawRequested = False
+            frameStart = time.perf_counter()
+            self._renderFrame(frameCount, (pygame.time.get_ticks() - startTicks) / 1000)
+            frameCount += 1
+            pygame.display.flip()
+            self.__recordInputLatency()
+            frameDuration = (time.perf_counter() - frameStart) * 1000
+            self.__frameStats.add(frameDuration)
+            self.__adjustRenderScale(frameDuration)
+            if not self.__lateSampling or not self.__looping:
+                self.__waitForFrame()
+        self._shutdown()
+
+    async def RunAsync(self):
+        """
+        Run() for asyncio, between frames the loop awaits instead of sleeping so
+        tasks scheduled on the same event loop keep running. Setup() and Draw()
+        may be coroutines. Use asyncio.run(sketch.RunAsync()).
+        """
+        self.__prepare()
+        try:
+            await self.__call(self.Setup)
+            frameCount = 0
+            startTicks = pygame.time.get_ticks()
+            period = 1 / self.__fps if self.__fps else 0.0
+            self.__frameDeadline = time.perf_counter()
+            while self.IsRunning:
+                # sleeping first samples input as late as possible before Draw()
+                await asyncio.sleep(max(self.__frameDeadline - time.perf_counter(), 0))
+                frameStart = time.perf_counter()
+                self.__frameDeadline = max(self.__frameDeadline + period, frameStart)
+                self._checkForEvents()
+                if not self.IsRunning:
+                    break
+                if not self.__looping and not self.__redrawRequested:
+                    self.__resumeWaiters()
+                    continue
+                self.__redrawRequested = False
+                self.__beginFrame(frameCount, (pygame.time.get_ticks() - startTicks) / 1000)
+                await self.__call(self.Draw)
+                self.__endFrame()
+                frameCount += 1
+                pygame.display.flip()
+                self.__recordInputLatency()
+                frameDuration = (time.perf_counter() - frameStart) * 1000
+                self.__frameStats.add(frameDuration)
+                self.__adjustRenderScale(frameDuration)
                 self.FramePerSec.tick()
+                self.__resumeWaiters()
+        finally:
+            for task in list(self.__tasks):
+                task.cancel()
+            await asyncio.gather(*self.__tasks, return_exceptions=True)
+            self.__resumeWaiters()
+            self._shutdown()
+
+    async def __call(self, method: Callable[[], Any]):
+        result = method()
+        if inspect.isawaitable(result):
+            await result
+
+    def __resumeWaiters(self):
+        waiters, self.__frameWaiters = self.__frameWaiters, []
+        for waiter in waiters:
+            _resolve(waiter)
+
+    def createTask(self, coroutine: Coroutine[Any, Any, Any]) -> asyncio.Task[Any]:
+        """
+        Schedules coroutine next to RunAsync(), it is cancelled when the sketch stops
+        """
+        task = asyncio.get_running_loop().create_task(coroutine)
+        self.__tasks.add(task)
+        task.add_done_callback(self.__tasks.discard)
+        return task
+
+    def cooperate(self) -> Awaitable[None]:
+        """
+        For long running tasks, await it between steps: while there is time left
+        before the next frame it only lets the other ready tasks run once,
+        otherwise it resumes after that frame was drawn, so tasks cannot hold
+        back rendering or each other.
+        """
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        if time.perf_counter() < self.__frameDeadline or not self.IsRunning:
+            # a done future would not suspend the awaiting task at all
+            loop.call_soon(_resolve, waiter)
+        else:
+            self.__frameWaiters.append(waiter)
+        return waiter
+
+    def __waitForFrame(self):
+        if not self.__lateSampling:
+            pygame.time.wait(int(1000 / self.__fps))
+        if self.__fps:
+            self.FramePerSec.tick(self.__fps)
+        else:
+            self.FramePerSec.tick()
 
-    def background(self, color: _common.ColorValue):
+    def __recordInputLatency(self):
+        if self.__inputTimes:
+            presented = pygame.time.get_ticks()
+            for timestamp in self.__inputTimes:
+                self.__inputLatency.add(presented - timestamp)
+            self.__inputTimes.clear()
+
+    def _fillBackground(self, color: _common.ColorValue, paint: Optional[_paint.Paint]):
         def bg_2d(r: int, g: int, b: int):
-            self.__backgroundSurface.fill((r, g, b))
-            self.__displaySurface = pygame.Surface(self.__backgroundSurface.get_rect().size, pygame.SRCALPHA)
+            if paint is None:
+                self.__backgroundSurface.fill((r, g, b))
+            else:
+                self.__backgroundSurface.blit(self._paintSurface(paint, self.__backgroundSurface.get_size()), (0, 0))
+            self.Surface.fill((0, 0, 0, 0))
+
+        def bg_opaque(r: int, g: int, b: int):
+            # the frame covers the display, so layers under it are composited here
+            if paint is None:
+                self.Surface.fill((r, g, b))
+            else:
+                self.Surface.blit(self._paintSurface(paint, self.Surface.get_size()), (0, 0))
+            if not self.__layers.IsEmpty:
+                self.__updateLayers()
+                self.__layers.blitBelow(self.Surface)
 
         def bg_3d(r: int, g: int, b: int, a: int):
-            glClearColor(r / 255, g / 255, b / 255, a / 255)
-            glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)  # type: ignore
-            glEnable(GL_LINE_SMOOTH)  # type: ignore
-            glHint(GL_LINE_SMOOTH_HINT, GL_NICEST)  # type: ignore
+            _openGL().background(r, g, b, a)
 
         r, g, b, a = getColor_Int(color)  # type: ignore
+        if self.__widgetSurface is not None:
+            self.__widgetSurface.fill((0, 0, 0, 0))
 
         if pygame.OPENGL & self.__flags == pygame.OPENGL:
             bg_3d(r, g, b, a)
+        elif self.__opaque:
+            bg_opaque(r, g, b)
         else:
             bg_2d(r, g, b)
 
-    def setFont(self, fontName: str = '', fontSize: int = 24):
-        self.__font = pygame.font.SysFont(fontName, fontSize)
-
     def keyPressed(self):
         pass
 
@@ -321,129 +803,11 @@ class PygameGFX(ABC):
     def mouseReleased(self):
         pass
 
-    def rect(self,
-             rect: pygame._RectValue,
-             borderRadius: int = -1,
-             borderTopLeftRadius: int = -1,
-             borderTopRightRadius: int = -1,
-             borderBottomLeftRadius: int = -1,
-             borderBottmRightRadius: int = -1,
-             ):
-        color: _common.ColorValue = (255, 255, 255) if (
-            self.__stroke is None and self.__fill is None) else self.__fill if (self.__fill is not None) else self.__stroke if (self.__stroke is not None) else (255, 255, 255)
-        width = 1 if self.__fill is None and self.__strokeWeight == 0 else self.__strokeWeight if self.__fill is None else 0
-        newRect = pygame.Rect(self.__xTranslation+rect.left, self.__yTranslation+rect.top, rect.width, rect.height)
-        pygame.draw.rect(
-            self.DisplaySurface,
-            color,  # type: ignore
-            newRect,
-            width,
-            borderRadius,
-            borderTopLeftRadius,
-            borderTopRightRadius,
-            borderBottomLeftRadius,
-            borderBottmRightRadius,
-        )
-
-    def ellipse(self,
-                rect: pygame._RectValue):
-        color: _common.ColorValue = (255, 255, 255) if (
-            self.__stroke is None and self.__fill is None) else self.__fill if (self.__fill is not None) else self.__stroke if (self.__stroke is not None) else (255, 255, 255)
-        width = 1 if self.__fill is None and self.__strokeWeight == 0 else self.__strokeWeight if self.__fill is None else 0
-        newRect = pygame.Rect(self.__xTranslation+rect[0]-rect[2]/2,
-                              self.__yTranslation+rect[1]-rect[3] / 2, rect[2], rect[3])
-        pygame.draw.ellipse(
-            self.DisplaySurface,
-            color,  # type: ignore
-            newRect,
-            width
-        )
-
-    def circle(self,
-               center: _common.Coordinate,
-               radius: float,
-               ):
-
-        def getVector2d(Pos: _common.Coordinate):
-            if isinstance(Pos, tuple) and len(Pos) >= 2:
-                v1 = pygame.Vector2(Pos[0], Pos[1])
-            elif isinstance(Pos, pygame.Vector2):
-                v1 = Pos
-            else:
-                v1 = pygame.Vector2(0, 0)
-            return v1
-        vect = getVector2d(center)
-        color: _common.ColorValue = (255, 255, 255) if (
-            self.__stroke is None and self.__fill is None) else self.__fill if (self.__fill is not None) else self.__stroke if (self.__stroke is not None) else (255, 255, 255)
-        width = 1 if self.__fill is None and self.__strokeWeight == 0 else self.__strokeWeight if self.__fill is None else 0
-        pygame.draw.circle(self.DisplaySurface,
-                           color,  # type: ignore
-                           (vect.x+self.__xTranslation, vect.y+self.__yTranslation),
-                           radius,
-                           width)
-
-    def line(self,
-             startPos: _common.Coordinate,
-             endPos: _common.Coordinate,
-             ):
-        def getVector2d(Pos: _common.Coordinate):
-            if isinstance(Pos, tuple) and len(Pos) >= 2:
-                v1 = pygame.Vector2(Pos[0], Pos[1])
-            elif isinstance(Pos, pygame.Vector2):
-                v1 = Pos
-            else:
-                v1 = pygame.Vector2(0, 0)
-            return v1
-        start = getVector2d(startPos)
-        end = getVector2d(endPos)
-        color: _common.ColorValue = (255, 255, 255) if (
-            self.__stroke is None and self.__fill is None) else self.__fill if (self.__fill is not None) else self.__stroke if (self.__stroke is not None) else (255, 255, 255)
-        width = 1 if self.__strokeWeight == 0 else self.__strokeWeight
-        pygame.draw.line(self.DisplaySurface,
-                         color,  # type: ignore
-                         (self.__xTranslation + start.x, self.__yTranslation + start.y),
-                         (self.__xTranslation + end.x, self.__yTranslation + end.y),
-                         width)
-
-    def point(self, pos: _common.Coordinate):
-        def getVector2d(Pos: _common.Coordinate):
-            if isinstance(Pos, tuple) and len(Pos) >= 2:
-                v1 = pygame.Vector2(Pos[0], Pos[1])
-            elif isinstance(Pos, pygame.Vector2):
-                v1 = Pos
-            else:
-                v1 = pygame.Vector2(0, 0)
-            return v1
-        vector = getVector2d(pos)
-        color: _common.ColorValue = (255, 255, 255) if (
-            self.__stroke is None and self.__fill is None) else self.__fill if (self.__fill is not None) else self.__stroke if (self.__stroke is not None) else (255, 255, 255)
-        width = 1 if self.__strokeWeight == 0 else self.__strokeWeight
-        pygame.draw.circle(self.DisplaySurface,
-                           color,  # type: ignore
-                           (vector.x+self.__xTranslation, vector.y+self.__yTranslation),
-                           width,
-                           width)
-
-    def polygon(self, points: Union[list[_common.Coordinate], list[tuple[float, float]]]):
-        def getVector2d(Pos: _common.Coordinate):
-            if isinstance(Pos, tuple) and len(Pos) >= 2:
-                v1 = pygame.Vector2(Pos[0], Pos[1])
-            elif isinstance(Pos, pygame.Vector2):
-                v1 = Pos
-            else:
-                v1 = pygame.Vector2(0, 0)
-            return v1
-        if (len(points) > 2):
-            newPoints = [getVector2d(x) for x in points]
-            translatedPoints = [pygame.Vector2(x.x + self.__xTranslation, x.y + self.__yTranslation) for x in newPoints]
-            color: _common.ColorValue = (255, 255, 255) if (
-                self.__stroke is None and self.__fill is None) else self.__fill if (self.__fill is not None) else self.__stroke if (self.__stroke is not None) else (255, 255, 255)
-            width = 1 if self.__fill is None and self.__strokeWeight == 0 else self.__strokeWeight if self.__fill is None else 0
-            pygame.draw.aalines(self.DisplaySurface, color, False, translatedPoints)  # type: ignore
-        elif (len(points) == 2):
-            self.line(points[0], points[1])
-        elif (len(points) == 1):
-            self.point(points[0])
+    def eventReceived(self, event: pygame.event.Event):
+        """
+        Called with every event, e.g. to pass them to a TextEditor's handleEvent
+        """
+        pass
 
     @abstractmethod
     def Setup(self):
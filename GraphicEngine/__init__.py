@@ -1,11 +1,24 @@
 from GraphicEngine.constrain import constrain
 from GraphicEngine.mathMap import mathMap
 from GraphicEngine.random2DVector import random2DVector
+from GraphicEngine._canvas import Canvas, SharedCache, clearSharedCaches
 from GraphicEngine._PygameGFX import PygameGFX
+from GraphicEngine._tileRenderer import TileRenderer
+from GraphicEngine._offlineRenderer import renderOffline
+from GraphicEngine._frameRecorder import FrameRecorder
+from GraphicEngine._layer import Layer
+from GraphicEngine._rollingStats import RollingStats
+from GraphicEngine._sharedData import SharedArray, SharedRingBuffer
+from GraphicEngine._paint import Gradient, Pattern
+from GraphicEngine._postProcess import Bloom, Blur, ColorGrade, PostFilter, Vignette
+from GraphicEngine._scene import Scene, SceneItem
+from GraphicEngine._tileMap import TileMap
+from GraphicEngine._drawLogReplay import replayDrawLog
 
 
 if __name__ == "__main__":
     help(PygameGFX)
+    help(Canvas)
     help(constrain)
     help(mathMap)
     help(random2DVector)
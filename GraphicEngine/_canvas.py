@@ -0,0 +1,662 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Hashable, Iterator, Optional, Tuple, TypeVar, Union, overload
+
+import numpy as np
+import pygame
+
+import GraphicEngine._common as _common
+import GraphicEngine._paint as _paint
+import GraphicEngine._polyline as _polyline
+import GraphicEngine.shapes as shapes
+from GraphicEngine._drawLog import GRADIENT_KINDS, DrawLogWriter, DrawOp
+from GraphicEngine._scene import Scene, SceneItem
+from GraphicEngine._tileMap import TileMap
+
+_Value = TypeVar("_Value")
+
+
+class SharedCache:
+    """
+    Bounded LRU cache that can be used from several threads at once, the
+    least recently used entries are dropped beyond maxSize.
+    """
+
+    @property
+    def Size(self) -> int:
+        return len(self.__entries)
+
+    def __init__(self, maxSize: int = 256):
+        self.__maxSize = maxSize
+        self.__entries: OrderedDict[Hashable, object] = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self, key: Hashable, create: Callable[[], _Value]) -> _Value:
+        with self.__lock:
+            if key in self.__entries:
+                self.__entries.move_to_end(key)
+                return self.__entries[key]  # type: ignore
+        # created outside of the lock, two threads missing the same key both create it
+        value = create()
+        with self.__lock:
+            self.__entries[key] = value
+            if len(self.__entries) > self.__maxSize:
+                self.__entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+
+
+# shared by every Canvas (and sketch) of the process
+_fonts = SharedCache(64)
+_sprites = SharedCache(256)
+_colors = SharedCache(1024)
+# pygame.font.Font objects are shared, rendering with one is not thread safe
+_fontLock = threading.RLock()
+
+
+def resolveColor(color: _common.ColorValue) -> _common.RgbaOutput:
+    """
+    Color as an RGBA tuple, parsed once per distinct value for the whole process
+    """
+    # sequences pygame accepts may be unhashable (lists, NumPy arrays), they are keyed as tuples
+    key = color if isinstance(color, (str, int, tuple)) or not hasattr(color, "__iter__") else tuple(color)
+    return _colors.get(key, lambda: _common.toRGBA(key))
+
+
+def loadFont(fontName: str = "", fontSize: int = 24) -> pygame.font.Font:
+    def create() -> pygame.font.Font:
+        with _fontLock:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            return pygame.font.SysFont(fontName, fontSize)
+    return _fonts.get((fontName, fontSize), create)
+
+
+def loadImage(path: str) -> pygame.Surface:
+    """
+    Image file loaded once for the whole process, do not draw on the returned surface
+    """
+    return _sprites.get(path, lambda: pygame.image.load(path))
+
+
+def clearSharedCaches():
+    _fonts.clear()
+    _sprites.clear()
+    _colors.clear()
+
+
+class Canvas:
+    """
+    Drawing state and the drawing API over a target surface.
+
+    Every canvas has its own fill, stroke, font and translation stack, fonts,
+    images and parsed colors are shared by all canvases, so many offscreen
+    canvases (thumbnails, report panels) can be drawn at once, one per thread.
+    PygameGFX is the canvas of the window. Coordinates are in canvas units,
+    the target surface is renderScale times the canvas size.
+    """
+
+    drawShapes = shapes
+
+    @property
+    def Surface(self) -> pygame.Surface:
+        return self.__surface
+
+    @property
+    def Width(self):
+        return self.__width
+
+    @property
+    def Height(self):
+        return self.__height
+
+    @property
+    def Font(self):
+        return self.__font
+
+    @property
+    def renderScale(self) -> float:
+        """
+        Size of the target surface relative to the canvas, drawing coordinates stay in canvas units
+        """
+        return self.__renderScale
+
+    @property
+    def drawLog(self) -> Optional[DrawLogWriter]:
+        return self.__drawLog
+
+    @property
+    def translation(self) -> Tuple[float, float]:
+        """
+        Current offset set by translate(), in canvas units
+        """
+        return self.__xTranslation, self.__yTranslation
+
+    @property
+    def viewport(self) -> pygame.Rect:
+        """
+        Area of the translated coordinate space that lands on the canvas
+        """
+        return pygame.Rect(-self.__xTranslation, -self.__yTranslation, self.__width, self.__height)
+
+    @property
+    def aspectRatio(self):
+        return self.Width / self.Height
+
+    @property
+    def __xTranslation(self) -> float:
+        return self.__translationMatrix[self.__translationIndex][0]
+
+    @property
+    def __yTranslation(self) -> float:
+        return self.__translationMatrix[self.__translationIndex][1]
+
+    @property
+    def __translationIndex(self) -> int:
+        return len(self.__translationMatrix)-1
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        surface: Optional[pygame.Surface] = None,
+        renderScale: float = 1.0,
+    ):
+        """
+        Draws on surface, without one on a new transparent surface of the
+        canvas size times renderScale.
+        """
+        self.__width = width
+        self.__height = height
+        self.__renderScale = renderScale
+        self.__surface = surface if surface is not None else pygame.Surface(
+            (max(1, round(width * renderScale)), max(1, round(height * renderScale))), pygame.SRCALPHA
+        )
+        self.__translationMatrix: list[tuple[float, float]] = [(0.0, 0.0)]
+        self.__fill: Optional[_common.ColorValue] = None
+        self.__fillPaint: Optional[_paint.Paint] = None
+        self.__stroke: Optional[_common.ColorValue] = None
+        self.__strokeWeight = 0
+        self.__drawLog: Optional[DrawLogWriter] = None
+        self.__polygonCache = _polyline.PolygonCache()
+        self.__paintCache = _paint.PaintCache()
+        self.__pixelSurface: Optional[pygame.Surface] = None
+        self.__font = loadFont()
+
+    @classmethod
+    def fromArray(cls, array: np.ndarray, renderScale: float = 1.0) -> Canvas:
+        """
+        Canvas drawing straight into a C contiguous uint8 array shaped
+        (height, width, 3) for RGB or (height, width, 4) for RGBA.
+        """
+        if array.dtype != np.uint8 or array.ndim != 3 or array.shape[2] not in (3, 4) or not array.flags.c_contiguous:
+            raise ValueError("Expected a C contiguous uint8 array shaped (height, width, 3 or 4)")
+        height, width = array.shape[:2]
+        surface = pygame.image.frombuffer(array, (width, height), "RGB" if array.shape[2] == 3 else "RGBA")
+        return cls(round(width / renderScale), round(height / renderScale), surface, renderScale)
+
+    def toArray(self) -> np.ndarray:
+        """
+        Copy of the target surface as a (height, width, 3) uint8 RGB array
+        """
+        return pygame.surfarray.array3d(self.__surface).transpose(1, 0, 2).copy()
+
+    def save(self, fileName: str):
+        pygame.image.save(self.__surface, fileName)
+
+    def _setTarget(self, surface: pygame.Surface, renderScale: float):
+        self.__surface = surface
+        self.__renderScale = renderScale
+
+    def _setSize(self, width: int, height: int):
+        self.__width = width
+        self.__height = height
+
+    def _resetTranslation(self):
+        self.__translationMatrix[self.__translationIndex] = (0.0, 0.0)
+
+    @contextmanager
+    def _drawingOn(self, surface: pygame.Surface, renderScale: float, logged: bool = False) -> Iterator[None]:
+        """
+        Redirects the drawing methods to surface with the default drawing state
+        (no translation, fill, stroke and the default font), logged only when
+        asked. The canvas' own state is restored afterwards.
+        """
+        previous = (
+            self.__surface, self.__renderScale, self.__drawLog, self.__translationMatrix,
+            self.__fill, self.__fillPaint, self.__stroke, self.__strokeWeight, self.__font,
+        )
+        self.__surface, self.__renderScale = surface, renderScale
+        if not logged:
+            self.__drawLog = None
+        self.__translationMatrix = [(0.0, 0.0)]
+        self.__fill = self.__fillPaint = self.__stroke = None
+        self.__strokeWeight = 0
+        self.__font = loadFont()
+        try:
+            yield
+        finally:
+            (
+                self.__surface, self.__renderScale, self.__drawLog, self.__translationMatrix,
+                self.__fill, self.__fillPaint, self.__stroke, self.__strokeWeight, self.__font,
+            ) = previous
+
+    def _paintSurface(self, paint: _paint.Paint, size: Tuple[int, int]) -> pygame.Surface:
+        return self.__paintCache.get(paint, size)
+
+    def __toScreen(self, x: float, y: float) -> Tuple[float, float]:
+        return (x + self.__xTranslation) * self.__renderScale, (y + self.__yTranslation) * self.__renderScale
+
+    def __scaleWidth(self, width: int) -> int:
+        if width <= 0 or self.__renderScale == 1.0:
+            return width
+        return max(1, round(width * self.__renderScale))
+
+    def startDrawLog(self, output: str = "draw.gedl") -> DrawLogWriter:
+        """
+        Logs every drawing call (state, paints, translations, primitives, text
+        and layer redraws) to a binary file that replayDrawLog() plays back
+        without the sketch's code. Widgets and images are not captured.
+        """
+        self.stopDrawLog()
+        self.__drawLog = DrawLogWriter(output, (self.__width, self.__height))
+        return self.__drawLog
+
+    def stopDrawLog(self) -> Optional[DrawLogWriter]:
+        drawLog, self.__drawLog = self.__drawLog, None
+        if drawLog is not None:
+            drawLog.close()
+        return drawLog
+
+    @overload
+    def translate(self, x: float, y: float) -> None:
+        ...
+
+    @overload
+    def translate(self, x: float, y: float, z: float) -> None:
+        ...
+
+    def translate(self, x: float, y: float, z: Optional[float] = None) -> None:
+        """
+        z is only used with OpenGL
+        """
+        if self.__drawLog is not None:
+            self.__drawLog.write(DrawOp.TRANSLATE, x, y, *(() if z is None else (z,)))
+        newX = self.__xTranslation + x
+        newY = self.__yTranslation + y
+        self.__translationMatrix[self.__translationIndex] = (newX, newY)
+
+    def push(self):
+        if self.__drawLog is not None:
+            self.__drawLog.write(DrawOp.PUSH)
+        self.__translationMatrix.append((self.__xTranslation, self.__yTranslation))
+
+    def pop(self):
+        if self.__drawLog is not None:
+            self.__drawLog.write(DrawOp.POP)
+        if (self.__translationIndex > 0):
+            self.__translationMatrix.pop()
+
+    def fill(self, color: _common.ColorValue | _paint.Paint):
+        """
+        A Gradient or Pattern fills rect, ellipse and circle, other shapes use its first color
+        """
+        if isinstance(color, (_paint.Gradient, _paint.Pattern)):
+            self.__fillPaint = color
+            self.__fill = color.FirstColor
+        else:
+            self.__fillPaint = None
+            self.__fill = resolveColor(color)
+        if self.__drawLog is not None:
+            if self.__fillPaint is None:
+                self.__drawLog.write(DrawOp.FILL, *self.__fill)
+            else:
+                self.__logPaint(self.__drawLog, self.__fillPaint, DrawOp.FILL_GRADIENT, DrawOp.FILL_PATTERN)
+
+    def noFill(self):
+        if self.__drawLog is not None:
+            self.__drawLog.write(DrawOp.NO_FILL)
+        self.__fill = None
+        self.__fillPaint = None
+
+    def stroke(self, color: _common.ColorValue):
+        self.__stroke = resolveColor(color)
+        if self.__drawLog is not None:
+            self.__drawLog.write(DrawOp.STROKE, *self.__stroke)
+
+    def noStroke(self):
+        if self.__drawLog is not None:
+            self.__drawLog.write(DrawOp.NO_STROKE)
+        self.__stroke = None
+
+    def strokeWeight(self, value: int):
+        if self.__drawLog is not None:
+            self.__drawLog.write(DrawOp.STROKE_WEIGHT, value)
+        self.__strokeWeight = value
+
+    def rotate(
+        self,
+        angle: float,
+        x: _common.Direction,
+        y: _common.Direction,
+        z: _common.Direction,
+    ):
+        """
+        Only for OpenGL now
+        """
+        if self.__drawLog is not None:
+            self.__drawLog.write(DrawOp.ROTATE, angle, x, y, z)
+
+    def background(self, color: _common.ColorValue | _paint.Paint):
+        paint = color if isinstance(color, (_paint.Gradient, _paint.Pattern)) else None
+        if self.__drawLog is not None:
+            if paint is None:
+                self.__drawLog.write(DrawOp.BACKGROUND, *resolveColor(color))
+            else:
+                self.__logPaint(self.__drawLog, paint, DrawOp.BACKGROUND_GRADIENT, DrawOp.BACKGROUND_PATTERN)
+        self._fillBackground(color if paint is None else paint.FirstColor, paint)
+
+    @staticmethod
+    def __logPaint(drawLog: DrawLogWriter, paint: _paint.Paint, gradientOp: DrawOp, patternOp: DrawOp):
+        if isinstance(paint, _paint.Gradient):
+            stops = [(position, *color) for position, color in paint.Stops]
+            drawLog.writePoints(
+                gradientOp, np.array(stops), GRADIENT_KINDS.index(paint.Kind), paint.Angle, paint.Offset, paint.Repeat,
+            )
+        else:
+            drawLog.write(patternOp, drawLog.tileIndex(paint.Tile), *paint.Offset)
+
+    def _fillBackground(self, color: _common.ColorValue, paint: Optional[_paint.Paint]):
+        if paint is None:
+            self.__surface.fill(resolveColor(color))
+        else:
+            self.__surface.blit(self.__paintCache.get(paint, self.__surface.get_size()), (0, 0))
+
+    def setFont(self, fontName: str = '', fontSize: int = 24):
+        if self.__drawLog is not None:
+            self.__drawLog.writeText(DrawOp.SET_FONT, fontName, fontSize)
+        self.__font = loadFont(fontName, fontSize)
+
+    def rect(self,
+             rect: pygame._RectValue,
+             borderRadius: int = -1,
+             borderTopLeftRadius: int = -1,
+             borderTopRightRadius: int = -1,
+             borderBottomLeftRadius: int = -1,
+             borderBottmRightRadius: int = -1,
+             ):
+        color: _common.ColorValue = (255, 255, 255) if (
+            self.__stroke is None and self.__fill is None) else self.__fill if (self.__fill is not None) else self.__stroke if (self.__stroke is not None) else (255, 255, 255)
+        width = 1 if self.__fill is None and self.__strokeWeight == 0 else self.__strokeWeight if self.__fill is None else 0
+        if self.__drawLog is not None:
+            self.__drawLog.write(DrawOp.RECT, rect.left, rect.top, rect.width, rect.height, borderRadius,
+                                 borderTopLeftRadius, borderTopRightRadius, borderBottomLeftRadius, borderBottmRightRadius)
+        left, top = self.__toScreen(rect.left, rect.top)
+        newRect = pygame.Rect(left, top, rect.width * self.__renderScale, rect.height * self.__renderScale)
+        if self.__fillPaint is not None:
+            radii = tuple(self.__scaleWidth(radius) for radius in (
+                borderRadius, borderTopLeftRadius, borderTopRightRadius, borderBottomLeftRadius, borderBottmRightRadius))
+            if all(radius <= 0 for radius in radii):
+                self.__paintShape(newRect, None, lambda mask: None)
+            else:
+                self.__paintShape(newRect, ("rect",) + radii, lambda mask: pygame.draw.rect(
+                    mask, (255, 255, 255), mask.get_rect(), 0, *radii))
+            return
+        pygame.draw.rect(
+            self.__surface,
+            color,  # type: ignore
+            newRect,
+            self.__scaleWidth(width),
+            self.__scaleWidth(borderRadius),
+            self.__scaleWidth(borderTopLeftRadius),
+            self.__scaleWidth(borderTopRightRadius),
+            self.__scaleWidth(borderBottomLeftRadius),
+            self.__scaleWidth(borderBottmRightRadius),
+        )
+
+    def ellipse(self,
+                rect: pygame._RectValue):
+        color: _common.ColorValue = (255, 255, 255) if (
+            self.__stroke is None and self.__fill is None) else self.__fill if (self.__fill is not None) else self.__stroke if (self.__stroke is not None) else (255, 255, 255)
+        width = 1 if self.__fill is None and self.__strokeWeight == 0 else self.__strokeWeight if self.__fill is None else 0
+        if self.__drawLog is not None:
+            self.__drawLog.write(DrawOp.ELLIPSE, rect[0], rect[1], rect[2], rect[3])
+        left, top = self.__toScreen(rect[0]-rect[2]/2, rect[1]-rect[3] / 2)
+        newRect = pygame.Rect(left, top, rect[2] * self.__renderScale, rect[3] * self.__renderScale)
+        if self.__fillPaint is not None:
+            self.__paintShape(newRect, "ellipse", lambda mask: pygame.draw.ellipse(mask, (255, 255, 255), mask.get_rect()))
+            return
+        pygame.draw.ellipse(
+            self.__surface,
+            color,  # type: ignore
+            newRect,
+            self.__scaleWidth(width)
+        )
+
+    def circle(self,
+               center: _common.Coordinate,
+               radius: float,
+               ):
+
+        def getVector2d(Pos: _common.Coordinate):
+            if isinstance(Pos, tuple) and len(Pos) >= 2:
+                v1 = pygame.Vector2(Pos[0], Pos[1])
+            elif isinstance(Pos, pygame.Vector2):
+                v1 = Pos
+            else:
+                v1 = pygame.Vector2(0, 0)
+            return v1
+        vect = getVector2d(center)
+        if self.__drawLog is not None:
+            self.__drawLog.write(DrawOp.CIRCLE, vect.x, vect.y, radius)
+        color: _common.ColorValue = (255, 255, 255) if (
+            self.__stroke is None and self.__fill is None) else self.__fill if (self.__fill is not None) else self.__stroke if (self.__stroke is not None) else (255, 255, 255)
+        width = 1 if self.__fill is None and self.__strokeWeight == 0 else self.__strokeWeight if self.__fill is None else 0
+        if self.__fillPaint is not None:
+            x, y = self.__toScreen(vect.x, vect.y)
+            scaledRadius = radius * self.__renderScale
+            box = pygame.Rect(round(x - scaledRadius), round(y - scaledRadius), round(2 * scaledRadius), round(2 * scaledRadius))
+            self.__paintShape(box, "ellipse", lambda mask: pygame.draw.ellipse(mask, (255, 255, 255), mask.get_rect()))
+            return
+        pygame.draw.circle(self.__surface,
+                           color,  # type: ignore
+                           self.__toScreen(vect.x, vect.y),
+                           radius * self.__renderScale,
+                           self.__scaleWidth(width))
+
+    def line(self,
+             startPos: _common.Coordinate,
+             endPos: _common.Coordinate,
+             ):
+        def getVector2d(Pos: _common.Coordinate):
+            if isinstance(Pos, tuple) and len(Pos) >= 2:
+                v1 = pygame.Vector2(Pos[0], Pos[1])
+            elif isinstance(Pos, pygame.Vector2):
+                v1 = Pos
+            else:
+                v1 = pygame.Vector2(0, 0)
+            return v1
+        start = getVector2d(startPos)
+        end = getVector2d(endPos)
+        if self.__drawLog is not None:
+            self.__drawLog.write(DrawOp.LINE, start.x, start.y, end.x, end.y)
+        color: _common.ColorValue = (255, 255, 255) if (
+            self.__stroke is None and self.__fill is None) else self.__fill if (self.__fill is not None) else self.__stroke if (self.__stroke is not None) else (255, 255, 255)
+        width = 1 if self.__strokeWeight == 0 else self.__strokeWeight
+        pygame.draw.line(self.__surface,
+                         color,  # type: ignore
+                         self.__toScreen(start.x, start.y),
+                         self.__toScreen(end.x, end.y),
+                         self.__scaleWidth(width))
+
+    def point(self, pos: _common.Coordinate):
+        def getVector2d(Pos: _common.Coordinate):
+            if isinstance(Pos, tuple) and len(Pos) >= 2:
+                v1 = pygame.Vector2(Pos[0], Pos[1])
+            elif isinstance(Pos, pygame.Vector2):
+                v1 = Pos
+            else:
+                v1 = pygame.Vector2(0, 0)
+            return v1
+        vector = getVector2d(pos)
+        if self.__drawLog is not None:
+            self.__drawLog.write(DrawOp.POINT, vector.x, vector.y)
+        color: _common.ColorValue = (255, 255, 255) if (
+            self.__stroke is None and self.__fill is None) else self.__fill if (self.__fill is not None) else self.__stroke if (self.__stroke is not None) else (255, 255, 255)
+        width = 1 if self.__strokeWeight == 0 else self.__strokeWeight
+        pygame.draw.circle(self.__surface,
+                           color,  # type: ignore
+                           self.__toScreen(vector.x, vector.y),
+                           self.__scaleWidth(width),
+                           self.__scaleWidth(width))
+
+    def polygon(self,
+                points: Union[list[_common.Coordinate], list[tuple[float, float]], np.ndarray],
+                closed: bool = False,
+                cacheKey: Optional[Hashable] = None,
+                ):
+        """
+        Filled when a fill color is set, otherwise an outline (open unless closed).
+        points may be a (n, 2) NumPy array. Shapes drawn with the same cacheKey are
+        rasterized once and blitted afterwards, the points are then only read on
+        the first call. They look like the uncached shape except where it crosses
+        the canvas border, and antialiased outlines may differ by rounding.
+        """
+        if (len(points) > 2):
+            color: _common.ColorValue = (255, 255, 255) if (
+                self.__stroke is None and self.__fill is None) else self.__fill if (self.__fill is not None) else self.__stroke if (self.__stroke is not None) else (255, 255, 255)
+            width = 1 if self.__fill is None and self.__strokeWeight == 0 else self.__strokeWeight if self.__fill is None else 0
+            pointArray = _polyline.asPointArray(points)
+            if self.__drawLog is not None:
+                self.__drawLog.writePoints(DrawOp.POLYGON, pointArray, closed)
+            width = self.__scaleWidth(width)
+            if cacheKey is not None:
+                surface, (left, top) = self.__polygonCache.get(
+                    (cacheKey, self.__renderScale), pointArray * self.__renderScale, color, width, closed
+                )
+                self.__surface.blit(surface, (left + self.__xTranslation * self.__renderScale,
+                                              top + self.__yTranslation * self.__renderScale))
+                return
+            translatedPoints = (
+                (pointArray + (self.__xTranslation, self.__yTranslation)) * self.__renderScale
+            ).tolist()
+            if width == 0:
+                pygame.draw.polygon(self.__surface, color, translatedPoints)  # type: ignore
+            elif width == 1:
+                pygame.draw.aalines(self.__surface, color, closed, translatedPoints)  # type: ignore
+            else:
+                pygame.draw.lines(self.__surface, color, closed, translatedPoints, width)  # type: ignore
+        elif (len(points) == 2):
+            self.line(points[0], points[1])
+        elif (len(points) == 1):
+            self.point(points[0])
+
+    def polyline(self, points: Union[list[_common.Coordinate], np.ndarray]):
+        """
+        Open line through points, for large traces pass a (n, 2) NumPy array sorted
+        by x, it is translated in one step and reduced to min/max per pixel column.
+        Thick lines keep their exact pixels, the antialiased 1 px line of a dense
+        trace (more than 4 points per column) only approximates the full trace's
+        edge shading.
+        """
+        if len(points) < 2:
+            return
+        color: _common.ColorValue = (255, 255, 255) if (
+            self.__stroke is None and self.__fill is None) else self.__fill if (self.__fill is not None) else self.__stroke if (self.__stroke is not None) else (255, 255, 255)
+        width = self.__scaleWidth(1 if self.__strokeWeight == 0 else self.__strokeWeight)
+        pointArray = _polyline.asPointArray(points)
+        if self.__drawLog is not None:
+            self.__drawLog.writePoints(DrawOp.POLYLINE, pointArray)
+        translatedPoints = (pointArray + (self.__xTranslation, self.__yTranslation)) * self.__renderScale
+        translatedPoints = _polyline.decimateColumns(translatedPoints, 0, self.__surface.get_width())
+        if width == 1:
+            pygame.draw.aalines(self.__surface, color, False, translatedPoints.tolist())  # type: ignore
+        else:
+            pygame.draw.lines(self.__surface, color, False, translatedPoints.tolist(), width)  # type: ignore
+
+    def __paintShape(self, rect: pygame.Rect, shape: Hashable, drawMask: Callable[[pygame.Surface], None]):
+        # shape None is the whole rect, which needs no mask
+        if rect.width <= 0 or rect.height <= 0 or self.__fillPaint is None:
+            return
+        if shape is None:
+            surface = self.__paintCache.get(self.__fillPaint, rect.size)
+        else:
+            surface = self.__paintCache.masked(self.__fillPaint, rect.size, shape, drawMask)
+        self.__surface.blit(surface, rect.topleft)
+
+    def drawScene(self, scene: Scene, drawItem: Callable[[SceneItem], None]) -> int:
+        """
+        Draws only the scene items inside the current viewport, returns how many were drawn
+        """
+        return scene.draw((-self.__xTranslation, -self.__yTranslation, self.__width, self.__height), drawItem)
+
+    def drawTileMap(self, tileMap: TileMap):
+        """
+        Draws the chunks of tileMap visible under the current translation, the map's origin at (0, 0)
+        """
+        tileMap.draw(self.__surface, (self.__xTranslation, self.__yTranslation), self.__renderScale)
+
+    def text(self, value: str, x: float, y: float):
+        """
+        Draws value with Font in the fill color (stroke color without fill), top left at x, y
+        """
+        if self.__drawLog is not None:
+            self.__drawLog.writeText(DrawOp.TEXT, value, x, y)
+        color: _common.ColorValue = (255, 255, 255) if (
+            self.__stroke is None and self.__fill is None) else self.__fill if (self.__fill is not None) else self.__stroke if (self.__stroke is not None) else (255, 255, 255)
+        with _fontLock:
+            surface = self.__font.render(value, True, color)  # type: ignore
+        if self.__renderScale != 1.0:
+            width, height = surface.get_size()
+            surface = pygame.transform.smoothscale(surface, (max(round(width * self.__renderScale), 1), max(round(height * self.__renderScale), 1)))
+        self.__surface.blit(surface, self.__toScreen(x, y))
+
+    def image(self, source: str | pygame.Surface, x: float, y: float,
+              width: Optional[float] = None, height: Optional[float] = None):
+        """
+        Draws an image file (loaded once per process) or a surface with its top
+        left at x, y, scaled to width and height when given. Scaled versions of
+        image files are shared between canvases as well.
+        """
+        surface = loadImage(source) if isinstance(source, str) else source
+        size = (
+            max(round((surface.get_width() if width is None else width) * self.__renderScale), 1),
+            max(round((surface.get_height() if height is None else height) * self.__renderScale), 1),
+        )
+        if size != surface.get_size():
+            if isinstance(source, str):
+                original = surface
+                surface = _sprites.get((source, size), lambda: pygame.transform.smoothscale(original, size))
+            else:
+                surface = pygame.transform.smoothscale(surface, size)
+        self.__surface.blit(surface, self.__toScreen(x, y))
+
+    def clearPaintCache(self):
+        self.__paintCache.clear()
+
+    def clearPolygonCache(self):
+        self.__polygonCache.clear()
+
+    def pixels(self, array: np.ndarray, x: float = 0, y: float = 0):
+        """
+        Draws a pixel array indexed [x, y] like pygame.surfarray, (w, h, 3) RGB
+        or (w, h) mapped colors, with its top left corner at x, y.
+        """
+        size = array.shape[:2]
+        if self.__pixelSurface is None or self.__pixelSurface.get_size() != size:
+            self.__pixelSurface = pygame.Surface(size)
+        pygame.surfarray.blit_array(self.__pixelSurface, array)
+        surface = self.__pixelSurface
+        if self.__renderScale != 1.0:
+            surface = pygame.transform.scale(surface, (round(size[0] * self.__renderScale), round(size[1] * self.__renderScale)))
+        self.__surface.blit(surface, self.__toScreen(x, y))
+
+
+if __name__ == "__main__":
+    help(Canvas)
@@ -20,6 +20,20 @@ def deprecate(msg: str, klass: Warning | None | type = PendingDeprecationWarning
     return decorator
 
 
+def frameFileName(pattern: str, index: int) -> str:
+    """
+    Replaces the last run of '#' in pattern with the zero padded frame index,
+    "frame-####.png" -> "frame-0042.png"
+    """
+    end = pattern.rfind("#") + 1
+    if not end:
+        return pattern
+    start = end
+    while start > 0 and pattern[start - 1] == "#":
+        start -= 1
+    return f"{pattern[:start]}{index:0{end - start}d}{pattern[end:]}"
+
+
 Direction = Literal[-1, 0, 1]
 
 
@@ -34,12 +48,8 @@ Coordinate = Union[Tuple[float, float], Sequence[float], Vector2]
 
 # This typehint is used when a function would return an RGBA tuble
 RgbaOutput = Tuple[int, int, int, int]
-<<<<<<< HEAD
 ColorValue = Union[Color, int, str, Tuple[int, int, int],
                    Tuple[int, int], Tuple[int, int, int, int], List[int], RgbaOutput]
-=======
-ColorValue = Union[Color, int, str, Tuple[int, int, int], Tuple[int, int], List[int], RgbaOutput]
->>>>>>> f672c54ae07b0cf59fef274fabec6df188648091
 
 CanBeRect = Union[
     Rect,
@@ -55,3 +65,14 @@ class HasRectAttribute(Protocol):
 
 
 RectValue = Union[CanBeRect, HasRectAttribute]
+
+
+def toRGBA(color: ColorValue) -> RgbaOutput:
+    """
+    Color as an RGBA tuple the way pygame reads it, ints and (gray, alpha) pairs as gray
+    """
+    if isinstance(color, int):
+        return color, color, color, 255
+    if isinstance(color, (tuple, list)) and len(color) <= 2:
+        return color[0], color[0], color[0], color[-1] if len(color) == 2 else 255
+    return tuple(Color(color))  # type: ignore
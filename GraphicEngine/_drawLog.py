@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import struct
+from enum import IntEnum
+from typing import BinaryIO, Iterator, Optional, Tuple, Union
+
+import numpy as np
+import pygame
+
+_MAGIC = b"GEDL"
+_VERSION = 2
+# version 1 logs have no layer and paint records and are read the same way
+_READABLE_VERSIONS = (1, 2)
+_HEADER = struct.Struct("<4sHHII")
+_RECORD = struct.Struct("<BB")
+_LENGTH = struct.Struct("<I")
+
+Command = Tuple["DrawOp", Tuple[float, ...], Union[None, str, bytes, np.ndarray]]
+
+
+class DrawOp(IntEnum):
+    FRAME = 0
+    BACKGROUND = 1
+    FILL = 2
+    NO_FILL = 3
+    STROKE = 4
+    NO_STROKE = 5
+    STROKE_WEIGHT = 6
+    TRANSLATE = 7
+    PUSH = 8
+    POP = 9
+    ROTATE = 10
+    RECT = 11
+    ELLIPSE = 12
+    CIRCLE = 13
+    LINE = 14
+    POINT = 15
+    POLYGON = 16
+    POLYLINE = 17
+    TEXT = 18
+    SET_FONT = 19
+    # z, opaque and visibility of a named layer, written when they change
+    LAYER = 20
+    # a layer redraw, the commands up to LAYER_END draw the named layer
+    LAYER_DRAW = 21
+    LAYER_END = 22
+    LAYER_REMOVE = 23
+    FILL_GRADIENT = 24
+    BACKGROUND_GRADIENT = 25
+    # RGBA pixels of a pattern tile, written once and referenced by index
+    PATTERN_TILE = 26
+    FILL_PATTERN = 27
+    BACKGROUND_PATTERN = 28
+
+
+# gradient kinds by the index logged for them
+GRADIENT_KINDS = ("linear", "radial", "conic")
+
+# columns of the float32 rows that follow the numbers
+_WITH_ROWS = {
+    DrawOp.POLYGON: 2,
+    DrawOp.POLYLINE: 2,
+    # stops as position, r, g, b, a
+    DrawOp.FILL_GRADIENT: 5,
+    DrawOp.BACKGROUND_GRADIENT: 5,
+}
+_WITH_TEXT = frozenset((DrawOp.TEXT, DrawOp.SET_FONT, DrawOp.LAYER, DrawOp.LAYER_DRAW, DrawOp.LAYER_REMOVE))
+_WITH_BYTES = frozenset((DrawOp.PATTERN_TILE,))
+
+
+class DrawLogWriter:
+    """
+    Appends drawing commands to a binary log, numbers stored as float32.
+
+    Records are an opcode byte, a count byte and the numbers, polygons and
+    gradients add a row count and the rows, text and pattern tiles add their
+    length and bytes. The buffer goes to the file at frame ends once it holds
+    flushSize bytes, so long sessions stream to disk.
+    """
+
+    @property
+    def Frames(self) -> int:
+        return self.__frames
+
+    @property
+    def BytesWritten(self) -> int:
+        return self.__written + len(self.__buffer)
+
+    def __init__(self, output: str, size: Tuple[int, int], flushSize: int = 1 << 16):
+        self.__stream: Optional[BinaryIO] = open(output, "wb")
+        self.__stream.write(_HEADER.pack(_MAGIC, _VERSION, 0, size[0], size[1]))
+        self.__buffer = bytearray()
+        self.__flushSize = flushSize
+        self.__structs: dict[int, struct.Struct] = {}
+        self.__frames = 0
+        self.__written = _HEADER.size
+        # index of every pattern tile written so far, the surfaces are kept so ids stay unique
+        self.__tiles: dict[int, Tuple[int, pygame.Surface]] = {}
+        self.__layers: dict[str, Tuple[int, bool, bool]] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args: object):
+        self.close()
+
+    def __numbers(self, op: DrawOp, numbers: Tuple[float, ...]):
+        packer = self.__structs.get(len(numbers))
+        if packer is None:
+            packer = self.__structs[len(numbers)] = struct.Struct(f"<BB{len(numbers)}f")
+        self.__buffer += packer.pack(op, len(numbers), *numbers)
+
+    def write(self, op: DrawOp, *numbers: float):
+        self.__numbers(op, numbers)
+
+    def writePoints(self, op: DrawOp, points: np.ndarray, *numbers: float):
+        self.__numbers(op, numbers)
+        self.__buffer += _LENGTH.pack(len(points))
+        self.__buffer += np.ascontiguousarray(points, dtype="<f4").tobytes()
+
+    def writeText(self, op: DrawOp, text: str, *numbers: float):
+        self.writeBytes(op, text.encode(), *numbers)
+
+    def writeBytes(self, op: DrawOp, data: bytes, *numbers: float):
+        self.__numbers(op, numbers)
+        self.__buffer += _LENGTH.pack(len(data))
+        self.__buffer += data
+
+    def tileIndex(self, tile: pygame.Surface) -> int:
+        """
+        Index of a pattern tile, its pixels are written on first use
+        """
+        entry = self.__tiles.get(id(tile))
+        if entry is None:
+            entry = self.__tiles[id(tile)] = (len(self.__tiles), tile)
+            width, height = tile.get_size()
+            self.writeBytes(DrawOp.PATTERN_TILE, pygame.image.tobytes(tile, "RGBA"), entry[0], width, height)
+        return entry[0]
+
+    def writeLayer(self, name: str, z: int, opaque: bool, visible: bool):
+        """
+        Logs the state of a layer unless it is unchanged since it was last logged
+        """
+        if self.__layers.get(name) != (z, opaque, visible):
+            self.__layers[name] = (z, opaque, visible)
+            self.writeText(DrawOp.LAYER, name, z, opaque, visible)
+
+    def writeLayerRemoved(self, name: str):
+        if self.__layers.pop(name, None) is not None:
+            self.writeText(DrawOp.LAYER_REMOVE, name)
+
+    def endFrame(self):
+        self.__numbers(DrawOp.FRAME, ())
+        self.__frames += 1
+        if len(self.__buffer) >= self.__flushSize:
+            self.flush()
+
+    def flush(self):
+        if self.__stream is not None and self.__buffer:
+            self.__stream.write(self.__buffer)
+            self.__written += len(self.__buffer)
+            self.__buffer.clear()
+
+    def close(self):
+        if self.__stream is None:
+            return
+        self.flush()
+        self.__stream.close()
+        self.__stream = None
+
+
+class DrawLogReader:
+    """
+    Reads a draw log frame by frame, in chunks, so it never has to fit in memory.
+    """
+
+    @property
+    def Size(self) -> Tuple[int, int]:
+        return self.__size
+
+    def __init__(self, path: str, chunkSize: int = 1 << 20):
+        self.__stream: Optional[BinaryIO] = open(path, "rb")
+        magic, version, _, width, height = _HEADER.unpack(self.__stream.read(_HEADER.size))
+        if magic != _MAGIC or version not in _READABLE_VERSIONS:
+            raise ValueError(f"{path} is not a version {_VERSION} draw log")
+        self.__size = (width, height)
+        self.__chunkSize = chunkSize
+        self.__buffer = b""
+        self.__offset = 0
+        self.__structs: dict[int, struct.Struct] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args: object):
+        self.close()
+
+    def close(self):
+        if self.__stream is not None:
+            self.__stream.close()
+            self.__stream = None
+
+    def __need(self, count: int) -> bool:
+        available = len(self.__buffer) - self.__offset
+        if available >= count:
+            return True
+        if self.__stream is None:
+            return False
+        self.__buffer = self.__buffer[self.__offset:] + self.__stream.read(max(count - available, self.__chunkSize))
+        self.__offset = 0
+        return len(self.__buffer) >= count
+
+    def __take(self, count: int) -> bytes:
+        if not self.__need(count):
+            raise EOFError("Truncated draw log")
+        start = self.__offset
+        self.__offset += count
+        return self.__buffer[start:self.__offset]
+
+    def __iter__(self) -> Iterator[list[Command]]:
+        """
+        Yields the commands of every complete frame
+        """
+        commands: list[Command] = []
+        while self.__need(_RECORD.size):
+            op, count = _RECORD.unpack_from(self.__buffer, self.__offset)
+            self.__offset += _RECORD.size
+            unpacker = self.__structs.get(count)
+            if unpacker is None:
+                unpacker = self.__structs[count] = struct.Struct(f"<{count}f")
+            numbers = unpacker.unpack(self.__take(unpacker.size))
+            op = DrawOp(op)
+            if op == DrawOp.FRAME:
+                yield commands
+                commands = []
+                continue
+            extra: Union[None, str, bytes, np.ndarray] = None
+            columns = _WITH_ROWS.get(op)
+            if columns is not None:
+                (length,) = _LENGTH.unpack(self.__take(_LENGTH.size))
+                extra = np.frombuffer(self.__take(length * columns * 4), dtype="<f4").reshape(-1, columns)
+            elif op in _WITH_TEXT or op in _WITH_BYTES:
+                (length,) = _LENGTH.unpack(self.__take(_LENGTH.size))
+                extra = self.__take(length)
+                if op in _WITH_TEXT:
+                    extra = extra.decode()
+            commands.append((op, numbers, extra))
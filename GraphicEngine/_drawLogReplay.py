@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import os
+import time
+from typing import Any, Callable, Optional
+
+import numpy as np
+import pygame
+
+from GraphicEngine._drawLog import GRADIENT_KINDS, Command, DrawLogReader, DrawOp
+from GraphicEngine._paint import Gradient, Pattern
+from GraphicEngine._PygameGFX import PygameGFX
+from GraphicEngine._rollingStats import RollingStats
+
+_Apply = Callable[["_ReplaySketch", tuple[float, ...], Any], None]
+
+
+def _gradient(numbers: tuple[float, ...], stops: np.ndarray) -> Gradient:
+    return Gradient(
+        [tuple(int(value) for value in row[1:]) for row in stops],
+        GRADIENT_KINDS[int(numbers[0])],  # type: ignore
+        numbers[1],
+        [float(row[0]) for row in stops],
+        numbers[2],
+        bool(numbers[3]),
+    )
+
+
+def _pattern(sketch: _ReplaySketch, numbers: tuple[float, ...]) -> Pattern:
+    return Pattern(sketch.tiles[int(numbers[0])], (int(numbers[1]), int(numbers[2])))
+
+
+_COMMANDS: dict[DrawOp, _Apply] = {
+    DrawOp.BACKGROUND: lambda sketch, n, _: sketch.background(tuple(int(value) for value in n)),  # type: ignore
+    DrawOp.FILL: lambda sketch, n, _: sketch.fill(tuple(int(value) for value in n)),  # type: ignore
+    DrawOp.NO_FILL: lambda sketch, n, _: sketch.noFill(),
+    DrawOp.STROKE: lambda sketch, n, _: sketch.stroke(tuple(int(value) for value in n)),  # type: ignore
+    DrawOp.NO_STROKE: lambda sketch, n, _: sketch.noStroke(),
+    DrawOp.STROKE_WEIGHT: lambda sketch, n, _: sketch.strokeWeight(int(n[0])),
+    DrawOp.TRANSLATE: lambda sketch, n, _: sketch.translate(*n),
+    DrawOp.PUSH: lambda sketch, n, _: sketch.push(),
+    DrawOp.POP: lambda sketch, n, _: sketch.pop(),
+    DrawOp.ROTATE: lambda sketch, n, _: sketch.rotate(*n),
+    DrawOp.RECT: lambda sketch, n, _: sketch.rect(pygame.Rect(n[:4]), *(int(value) for value in n[4:])),
+    DrawOp.ELLIPSE: lambda sketch, n, _: sketch.ellipse(n),  # type: ignore
+    DrawOp.CIRCLE: lambda sketch, n, _: sketch.circle((n[0], n[1]), n[2]),
+    DrawOp.LINE: lambda sketch, n, _: sketch.line((n[0], n[1]), (n[2], n[3])),
+    DrawOp.POINT: lambda sketch, n, _: sketch.point((n[0], n[1])),
+    DrawOp.POLYGON: lambda sketch, n, points: sketch.polygon(points, bool(n[0])),  # type: ignore
+    DrawOp.POLYLINE: lambda sketch, n, points: sketch.polyline(points),  # type: ignore
+    DrawOp.TEXT: lambda sketch, n, text: sketch.text(text, n[0], n[1]),  # type: ignore
+    DrawOp.SET_FONT: lambda sketch, n, text: sketch.setFont(text, int(n[0])),  # type: ignore
+    DrawOp.FILL_GRADIENT: lambda sketch, n, stops: sketch.fill(_gradient(n, stops)),
+    DrawOp.BACKGROUND_GRADIENT: lambda sketch, n, stops: sketch.background(_gradient(n, stops)),
+    DrawOp.FILL_PATTERN: lambda sketch, n, _: sketch.fill(_pattern(sketch, n)),
+    DrawOp.BACKGROUND_PATTERN: lambda sketch, n, _: sketch.background(_pattern(sketch, n)),
+    DrawOp.LAYER: lambda sketch, n, name: sketch.setLayer(name, int(n[0]), bool(n[1]), bool(n[2])),
+    # arranged into the layer's name and its commands
+    DrawOp.LAYER_DRAW: lambda sketch, n, block: sketch.setLayerCommands(*block),
+    DrawOp.LAYER_REMOVE: lambda sketch, n, name: sketch.removeLayer(name),
+}
+
+# layer records logged while background() redrew the layers
+_BACKGROUNDS = frozenset((DrawOp.BACKGROUND, DrawOp.BACKGROUND_GRADIENT, DrawOp.BACKGROUND_PATTERN))
+_LAYER_UPDATES = frozenset((DrawOp.LAYER, DrawOp.LAYER_DRAW))
+
+
+class _ReplaySketch(PygameGFX):
+    def __init__(self, *args: Any, **kwargs: Any):
+        self.commands: list[Command] = []
+        self.tiles: dict[int, pygame.Surface] = {}
+        self.layerCommands: dict[str, list[Command]] = {}
+        super().__init__(*args, **kwargs)
+
+    def Setup(self):
+        pass
+
+    def Draw(self):
+        self.run(self.commands)
+
+    def run(self, commands: list[Command]):
+        for op, numbers, extra in commands:
+            _COMMANDS[op](self, numbers, extra)
+
+    def play(self, commands: list[Command]):
+        """
+        Sets the commands of the next frame. Pattern tiles are decoded right away,
+        every layer redraw becomes one LAYER_DRAW command holding the layer's name
+        and commands, and the layer records that follow a background are moved in
+        front of it, so the layers are set up before background() redraws them.
+        """
+        self.commands = []
+        # index of a background only followed by layer records so far
+        background: Optional[int] = None
+        block: Optional[list[Command]] = None
+        name = ""
+        for command in commands:
+            op, numbers, extra = command
+            if op == DrawOp.PATTERN_TILE:
+                size = (int(numbers[1]), int(numbers[2]))
+                self.tiles[int(numbers[0])] = pygame.image.frombytes(extra, size, "RGBA")  # type: ignore
+                continue
+            if block is not None:
+                if op != DrawOp.LAYER_END:
+                    block.append(command)
+                    continue
+                command = (DrawOp.LAYER_DRAW, (), (name, block))  # type: ignore
+                block = None
+            elif op == DrawOp.LAYER_DRAW:
+                block, name = [], extra  # type: ignore
+                continue
+            if op in _LAYER_UPDATES and background is not None:
+                self.commands.insert(background, command)
+                background += 1
+                continue
+            background = len(self.commands) if op in _BACKGROUNDS else None
+            self.commands.append(command)
+
+    def setLayer(self, name: str, z: int, opaque: bool, visible: bool):
+        try:
+            layer = self.layer(name)
+        except KeyError:
+            layer = None
+        if layer is None or (layer.Z, layer.Opaque) != (z, opaque):
+            layer = self.createLayer(name, lambda: self.run(self.layerCommands.get(name, [])), z, opaque)
+        layer.Visible = visible
+
+    def setLayerCommands(self, name: str, commands: list[Command]):
+        self.layerCommands[name] = commands
+        self.invalidateLayer(name)
+
+
+def replayDrawLog(path: str, frames: Optional[int] = None, **kwargs: object) -> RollingStats:
+    """
+    Replays a log written by PygameGFX.startDrawLog as fast as possible, headless
+    unless a video driver is set, and returns the time of every frame in ms.
+    kwargs go to PygameGFX (renderScale, opaque, ...), so engine settings can be compared
+    on the same workload.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    stats = RollingStats(window=1 << 20)
+    with DrawLogReader(path) as reader:
+        sketch = _ReplaySketch(*reader.Size, **kwargs)  # type: ignore
+        sketch._initialize()
+        for index, commands in enumerate(reader):
+            if frames is not None and index >= frames:
+                break
+            sketch.play(commands)
+            start = time.perf_counter()
+            sketch._renderFrame(index, index / 60)
+            pygame.display.flip()
+            stats.add((time.perf_counter() - start) * 1000)
+        sketch._shutdown()
+    return stats
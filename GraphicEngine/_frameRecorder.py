@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import queue
+import threading
+from typing import BinaryIO, Callable, Literal, Optional, Tuple, TypeVar
+
+import pygame
+
+import GraphicEngine._common as _common
+
+_Job = Tuple[pygame.Surface, str]
+_Result = TypeVar("_Result")
+
+
+class FrameRecorder:
+    """
+    Copies frames into pooled buffers and encodes them on a background thread.
+
+    capture() only does a memcpy of the surface into a free buffer and queues
+    it, the PNG encoding or raw RGB24 write happens on the encoder thread.
+    When all buffers are in flight, backpressure "drop" skips the frame and
+    counts it in Dropped, "block" waits for the encoder to free a buffer.
+    """
+
+    @property
+    def Captured(self) -> int:
+        return self.__captured
+
+    @property
+    def Dropped(self) -> int:
+        return self.__dropped
+
+    @property
+    def Written(self) -> int:
+        return self.__written
+
+    @property
+    def QueueDepth(self) -> int:
+        return self.__queue.qsize()
+
+    @property
+    def MaxQueueDepth(self) -> int:
+        return self.__maxQueueDepth
+
+    @property
+    def IsRecording(self) -> bool:
+        return self.__thread is not None
+
+    def __init__(
+        self,
+        output: str,
+        mode: Literal["frames"] | Literal["raw"] = "frames",
+        queueSize: int = 8,
+        backpressure: Literal["drop"] | Literal["block"] = "drop",
+    ):
+        self.__output = output
+        self.__mode = mode
+        self.__backpressure = backpressure
+        self.__poolSize = queueSize + 1
+        self.__allocated = 0
+        self.__free: queue.Queue[pygame.Surface] = queue.Queue()
+        self.__queue: queue.Queue[Optional[_Job]] = queue.Queue(queueSize)
+        self.__captured = 0
+        self.__dropped = 0
+        self.__written = 0
+        self.__maxQueueDepth = 0
+        self.__error: Optional[BaseException] = None
+        self.__stream: Optional[BinaryIO] = open(output, "wb") if mode == "raw" else None
+        self.__thread: Optional[threading.Thread] = threading.Thread(
+            target=self.__encode, name="FrameRecorder", daemon=True
+        )
+        self.__thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args: object):
+        self.close()
+
+    def __acquireBuffer(self, surface: pygame.Surface) -> Optional[pygame.Surface]:
+        try:
+            buffer = self.__free.get_nowait()
+        except queue.Empty:
+            if self.__allocated < self.__poolSize:
+                self.__allocated += 1
+                return surface.copy()
+            if self.__backpressure == "drop":
+                return None
+            buffer = self.__wait(lambda: self.__free.get(timeout=0.1))
+        if buffer.get_size() != surface.get_size() or buffer.get_bitsize() != surface.get_bitsize():
+            return surface.copy()
+        memoryview(buffer.get_buffer())[:] = memoryview(surface.get_buffer())
+        return buffer
+
+    def capture(self, surface: pygame.Surface, index: Optional[int] = None, fileName: Optional[str] = None) -> bool:
+        """
+        Queues a copy of surface, written to fileName or to the output pattern
+        formatted with index (the capture count by default).
+        Returns False when the frame was dropped.
+        """
+        if self.__thread is None:
+            raise RuntimeError("FrameRecorder is closed")
+        self.__raiseError()
+        buffer = self.__acquireBuffer(surface)
+        if buffer is None:
+            self.__dropped += 1
+            return False
+        if fileName is None:
+            fileName = _common.frameFileName(self.__output, self.__captured if index is None else index)
+        job = (buffer, fileName)
+        self.__wait(lambda: self.__queue.put(job, timeout=0.1))
+        self.__captured += 1
+        self.__maxQueueDepth = max(self.__maxQueueDepth, self.__queue.qsize())
+        return True
+
+    def __wait(self, operation: Callable[[], _Result]) -> _Result:
+        # retries a blocking queue operation while the encoder thread is alive
+        while True:
+            try:
+                return operation()
+            except (queue.Empty, queue.Full):
+                self.__raiseError()
+                if self.__thread is None or not self.__thread.is_alive():
+                    raise RuntimeError("FrameRecorder encoder thread stopped")
+
+    def __raiseError(self):
+        if self.__error is not None:
+            raise RuntimeError("FrameRecorder failed to write a frame") from self.__error
+
+    def __encode(self):
+        while True:
+            job = self.__queue.get()
+            if job is None:
+                return
+            buffer, fileName = job
+            # after the first error the remaining frames are only drained, so capture() never blocks
+            if self.__error is None:
+                try:
+                    if self.__stream is not None:
+                        self.__stream.write(pygame.image.tobytes(buffer, "RGB"))
+                    else:
+                        pygame.image.save(buffer, fileName)
+                    self.__written += 1
+                except Exception as error:
+                    self.__error = error
+            self.__free.put(buffer)
+
+    def close(self):
+        """
+        Waits until every queued frame is written and stops the encoder thread,
+        raises the first error the encoder ran into.
+        """
+        if self.__thread is None:
+            return
+        try:
+            self.__wait(lambda: self.__queue.put(None, timeout=0.1))
+            self.__thread.join()
+        except RuntimeError:
+            pass
+        self.__thread = None
+        if self.__stream is not None:
+            self.__stream.close()
+            self.__stream = None
+        self.__raiseError()
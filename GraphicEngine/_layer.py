@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+import pygame
+
+
+class Layer:
+    """
+    Named offscreen surface that keeps its content between frames.
+
+    draw is only called again after invalidate(). Opaque layers use the
+    display pixel format, translucent ones a SRCALPHA surface.
+    """
+
+    @property
+    def Name(self) -> str:
+        return self.__name
+
+    @property
+    def Z(self) -> int:
+        return self.__z
+
+    @property
+    def Opaque(self) -> bool:
+        return self.__opaque
+
+    @property
+    def Surface(self) -> pygame.Surface:
+        return self.__surface
+
+    @property
+    def IsDirty(self) -> bool:
+        return self.__dirty
+
+    @property
+    def Visible(self) -> bool:
+        return self.__visible
+
+    @Visible.setter
+    def Visible(self, value: bool):
+        if value != self.__visible:
+            self.__visible = value
+            self.__onChange(self)
+
+    def __init__(
+        self,
+        name: str,
+        size: Tuple[int, int],
+        draw: Callable[[], None],
+        z: int = -1,
+        opaque: bool = False,
+        onChange: Optional[Callable[[Layer], None]] = None,
+    ):
+        self.__name = name
+        self.__z = z
+        self.__opaque = opaque
+        self.__draw = draw
+        self.__visible = True
+        self.__onChange = onChange if onChange is not None else lambda layer: None
+        self.resize(size)
+
+    def resize(self, size: Tuple[int, int]):
+        if self.__opaque:
+            self.__surface = pygame.Surface(size).convert()
+        else:
+            self.__surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.invalidate()
+
+    def invalidate(self):
+        self.__dirty = True
+        self.__onChange(self)
+
+    def redraw(self):
+        self.__surface.fill((0, 0, 0, 0))
+        self.__draw()
+        self.__dirty = False
+
+
+class LayerStack:
+    """
+    Z-ordered layers split in two cached composites, the layers with z < 0
+    are shown under the sketch's DisplaySurface and the others over it.
+    """
+
+    @property
+    def IsEmpty(self) -> bool:
+        return not self.__layers
+
+    def __init__(self, size: Tuple[int, int]):
+        self.__size = size
+        self.__layers: dict[str, Layer] = {}
+        self.__below: list[Layer] = []
+        self.__above: list[Layer] = []
+        self.__belowSurface: Optional[pygame.Surface] = None
+        self.__aboveSurface: Optional[pygame.Surface] = None
+        self.__belowBuffer: Optional[pygame.Surface] = None
+        self.__aboveBuffer: Optional[pygame.Surface] = None
+        self.__belowDirty = False
+        self.__aboveDirty = False
+        # composite scaled to the target size, per side, kept until the composite is rebuilt
+        self.__scaled: Dict[str, pygame.Surface] = {}
+
+    def __iter__(self) -> Iterator[Layer]:
+        return iter(self.__below + self.__above)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.__layers
+
+    def __getitem__(self, name: str) -> Layer:
+        return self.__layers[name]
+
+    def __markChanged(self, layer: Layer):
+        if layer.Z < 0:
+            self.__belowDirty = True
+        else:
+            self.__aboveDirty = True
+
+    def add(self, name: str, draw: Callable[[], None], z: int = -1, opaque: bool = False) -> Layer:
+        layer = Layer(name, self.__size, draw, z, opaque, self.__markChanged)
+        self.__layers[name] = layer
+        self.__sort()
+        return layer
+
+    def remove(self, name: str):
+        if self.__layers.pop(name, None) is not None:
+            self.__sort()
+
+    def resize(self, size: Tuple[int, int]):
+        self.__size = size
+        self.__belowSurface = self.__aboveSurface = None
+        self.__belowBuffer = self.__aboveBuffer = None
+        self.__scaled.clear()
+        for layer in self.__layers.values():
+            layer.resize(size)
+
+    def __sort(self):
+        ordered = sorted(self.__layers.values(), key=lambda layer: layer.Z)
+        self.__below = [layer for layer in ordered if layer.Z < 0]
+        self.__above = [layer for layer in ordered if layer.Z >= 0]
+        self.__belowDirty = self.__aboveDirty = True
+
+    def update(self, redraw: Callable[[Layer], None]):
+        """
+        Redraws the dirty layers through redraw and rebuilds the affected composites.
+        """
+        for layer in self.__layers.values():
+            if layer.IsDirty and layer.Visible:
+                redraw(layer)
+        if self.__belowDirty:
+            self.__belowSurface, self.__belowBuffer = self.__compose(self.__below, self.__belowBuffer)
+            self.__belowDirty = False
+            self.__scaled.pop("below", None)
+        if self.__aboveDirty:
+            self.__aboveSurface, self.__aboveBuffer = self.__compose(self.__above, self.__aboveBuffer)
+            self.__aboveDirty = False
+            self.__scaled.pop("above", None)
+
+    def __compose(
+        self, layers: list[Layer], buffer: Optional[pygame.Surface]
+    ) -> Tuple[Optional[pygame.Surface], Optional[pygame.Surface]]:
+        visible = [layer for layer in layers if layer.Visible]
+        if not visible:
+            return None, buffer
+        if len(visible) == 1:
+            return visible[0].Surface, buffer
+        opaque = visible[0].Opaque
+        if buffer is None or bool(buffer.get_flags() & pygame.SRCALPHA) == opaque:
+            buffer = pygame.Surface(self.__size).convert() if opaque else pygame.Surface(self.__size, pygame.SRCALPHA)
+        elif not opaque:
+            buffer.fill((0, 0, 0, 0))
+        buffer.blits([(layer.Surface, (0, 0)) for layer in visible], False)
+        return buffer, buffer
+
+    def blitBelow(self, target: pygame.Surface):
+        self.__blit("below", self.__belowSurface, target)
+
+    def blitAbove(self, target: pygame.Surface):
+        self.__blit("above", self.__aboveSurface, target)
+
+    def __blit(self, side: str, surface: Optional[pygame.Surface], target: pygame.Surface):
+        if surface is None:
+            return
+        size = target.get_size()
+        if surface.get_size() != size:
+            scaled = self.__scaled.get(side)
+            if scaled is None or scaled.get_size() != size:
+                scaled = self.__scaled[side] = pygame.transform.scale(surface, size)
+            surface = scaled
+        target.blit(surface, (0, 0))
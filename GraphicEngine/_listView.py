@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Sequence
+
+import numpy as np
+import pygame
+
+import GraphicEngine._common as _common
+
+
+class ListViewAbstract:
+    """
+    Scrollable list or table bound to any sequence of rows, including a NumPy
+    (structured) array with millions of entries.
+
+    Only the rows in view are formatted and rendered. Row surfaces are kept in
+    a small LRU pool and recycled, cell text surfaces are cached by their
+    text. Scrolling shifts the composed view and only draws the rows that
+    came into view. Feed it the window events through handleEvent().
+    """
+
+    @property
+    def RowCount(self) -> int:
+        return len(self.__data)
+
+    @property
+    def Selected(self) -> Optional[int]:
+        return self.__selected
+
+    @Selected.setter
+    def Selected(self, row: Optional[int]):
+        if row is not None:
+            row = min(max(row, 0), len(self.__data) - 1) if len(self.__data) else None
+        if row == self.__selected:
+            return
+        changed = [index for index in (self.__selected, row) if index is not None]
+        self.__selected = row
+        self.__redrawRows(changed)
+        if row is not None:
+            self.scrollToRow(row)
+            if self.__onSelect is not None:
+                self.__onSelect(row)
+
+    @property
+    def FirstVisibleRow(self) -> int:
+        return self.__scrollY // self.__rowHeight
+
+    @property
+    def Rendered(self) -> int:
+        """
+        Rows rendered for the last show(), rows taken from the pool are not counted
+        """
+        return self.__lastRendered
+
+    def __init__(
+        self,
+        surface: pygame.Surface,
+        rect: pygame.Rect,
+        data: Sequence[Any] | np.ndarray,
+        columns: Optional[Sequence[str]] = None,
+        columnWidths: Optional[Sequence[int]] = None,
+        formatters: Optional[dict[str, Callable[[Any], str]]] = None,
+        font: Optional[pygame.font.Font] = None,
+        background: _common.ColorValue = (255, 255, 255),
+        alternate: _common.ColorValue = (0xF2, 0xF2, 0xF2),
+        foreground: _common.ColorValue = (0, 0, 0),
+        selection: _common.ColorValue = (0xB4, 0xD5, 0xFE),
+        header: _common.ColorValue = (0xDC, 0xDC, 0xDC),
+        onSelect: Optional[Callable[[int], None]] = None,
+        padx: int = 4,
+    ):
+        """
+        columns name the cells of a row: fields of a structured array, keys of
+        mappings, or labels for the items of sequence rows. Without columns
+        every row is shown as a single cell.
+        """
+        self.__surface = surface
+        self.__rect = rect
+        self.__font = font if font else pygame.font.SysFont("", 16)
+        self.__rowHeight = self.__font.get_linesize() + 2
+        self.__background = background
+        self.__alternate = alternate
+        self.__foreground = foreground
+        self.__selectionColor = selection
+        self.__headerColor = header
+        self.__formatters = formatters or {}
+        self.__onSelect = onSelect
+        self.__padx = padx
+        self.__textCache: OrderedDict[str, pygame.Surface] = OrderedDict()
+        self.__rowCache: OrderedDict[int, pygame.Surface] = OrderedDict()
+        self.__focused = False
+        self.__rendered = 0
+        self.__lastRendered = 0
+        self.__fullRedraw = True
+        if columns is None and isinstance(data, np.ndarray) and data.dtype.names:
+            columns = list(data.dtype.names)
+        self.__columns = list(columns) if columns is not None else None
+        count = len(self.__columns) if self.__columns else 1
+        self.__columnWidths = list(columnWidths) if columnWidths else [rect.width // count] * count
+        headerHeight = self.__rowHeight if self.__columns else 0
+        self.__bodyRect = pygame.Rect(rect.left, rect.top + headerHeight, rect.width, rect.height - headerHeight)
+        self.__body = pygame.Surface(self.__bodyRect.size)
+        self.__headerSurface = self.__renderHeader() if self.__columns else None
+        self.__selected: Optional[int] = None
+        self.setData(data)
+
+    @property
+    def __rowPoolSize(self) -> int:
+        return 2 * (self.__bodyRect.height // self.__rowHeight + 2)
+
+    def setData(self, data: Sequence[Any] | np.ndarray):
+        self.__data = data
+        self.__scrollY = 0
+        self.__selected = None
+        self.refresh()
+
+    def refresh(self, rows: Optional[Sequence[int]] = None):
+        """
+        Renders the given rows (all by default) again after their data changed
+        """
+        if rows is None:
+            self.__rowCache.clear()
+            self.__fullRedraw = True
+        else:
+            self.__redrawRows(rows)
+
+    def __redrawRows(self, rows: Sequence[int]):
+        for row in rows:
+            self.__rowCache.pop(row, None)
+        if not self.__fullRedraw:
+            self.__blitRows([row for row in rows if self.__isVisible(row)])
+
+    def __isVisible(self, row: int) -> bool:
+        top = row * self.__rowHeight - self.__scrollY
+        return top < self.__bodyRect.height and top + self.__rowHeight > 0
+
+    def __cellText(self, row: Any, column: int) -> str:
+        if self.__columns is None:
+            value = row
+        else:
+            name = self.__columns[column]
+            if isinstance(row, np.void) or isinstance(row, dict):
+                value = row[name]
+            else:
+                value = row[column]
+            formatter = self.__formatters.get(name)
+            if formatter is not None:
+                return formatter(value)
+        if isinstance(value, (float, np.floating)):
+            return f"{value:.6g}"
+        if isinstance(value, bytes):
+            return value.decode(errors="replace")
+        return str(value)
+
+    def __renderText(self, text: str) -> pygame.Surface:
+        surface = self.__textCache.get(text)
+        if surface is not None:
+            self.__textCache.move_to_end(text)
+            return surface
+        surface = self.__font.render(text, True, self.__foreground)
+        self.__textCache[text] = surface
+        if len(self.__textCache) > 4 * self.__rowPoolSize * len(self.__columnWidths):
+            self.__textCache.popitem(last=False)
+        return surface
+
+    def __renderCells(self, surface: pygame.Surface, texts: Sequence[str]):
+        left = 0
+        for text, width in zip(texts, self.__columnWidths):
+            if text:
+                label = self.__renderText(text)
+                area = pygame.Rect(0, 0, max(width - 2 * self.__padx, 0), label.get_height())
+                surface.blit(label, (left + self.__padx, (self.__rowHeight - label.get_height()) // 2), area)
+            left += width
+
+    def __renderHeader(self) -> pygame.Surface:
+        surface = pygame.Surface((self.__rect.width, self.__rowHeight))
+        surface.fill(self.__headerColor)  # type: ignore
+        self.__renderCells(surface, self.__columns or [])
+        return surface
+
+    def __rowSurface(self, row: int) -> pygame.Surface:
+        surface = self.__rowCache.get(row)
+        if surface is not None:
+            self.__rowCache.move_to_end(row)
+            return surface
+        if len(self.__rowCache) >= self.__rowPoolSize:
+            _, surface = self.__rowCache.popitem(last=False)
+        else:
+            surface = pygame.Surface((self.__rect.width, self.__rowHeight))
+        color = self.__selectionColor if row == self.__selected else self.__alternate if row % 2 else self.__background
+        surface.fill(color)  # type: ignore
+        record = self.__data[row]
+        self.__renderCells(surface, [self.__cellText(record, column) for column in range(len(self.__columnWidths))])
+        self.__rowCache[row] = surface
+        self.__rendered += 1
+        return surface
+
+    def __blitRows(self, rows: Sequence[int]):
+        for row in rows:
+            self.__body.blit(self.__rowSurface(row), (0, row * self.__rowHeight - self.__scrollY))
+
+    def __drawStrip(self, top: int, height: int):
+        strip = pygame.Rect(0, top, self.__bodyRect.width, height)
+        self.__body.fill(self.__background, strip)  # type: ignore
+        self.__body.set_clip(strip)
+        first = max((self.__scrollY + top) // self.__rowHeight, 0)
+        last = min((self.__scrollY + top + height - 1) // self.__rowHeight, len(self.__data) - 1)
+        self.__blitRows(range(first, last + 1))
+        self.__body.set_clip(None)
+
+    def scroll(self, pixels: int):
+        maxScroll = max(len(self.__data) * self.__rowHeight - self.__bodyRect.height, 0)
+        scrollY = min(max(self.__scrollY + pixels, 0), maxScroll)
+        delta = scrollY - self.__scrollY
+        if not delta:
+            return
+        self.__scrollY = scrollY
+        height = self.__bodyRect.height
+        if self.__fullRedraw or abs(delta) >= height:
+            self.__fullRedraw = True
+            return
+        self.__body.scroll(0, -delta)
+        if delta > 0:
+            self.__drawStrip(height - delta, delta)
+        else:
+            self.__drawStrip(0, -delta)
+
+    def scrollToRow(self, row: int):
+        top = row * self.__rowHeight
+        if top < self.__scrollY:
+            self.scroll(top - self.__scrollY)
+        elif top + self.__rowHeight > self.__scrollY + self.__bodyRect.height:
+            self.scroll(top + self.__rowHeight - self.__bodyRect.height - self.__scrollY)
+
+    def handleEvent(self, event: pygame.event.Event) -> bool:
+        """
+        Applies wheel, click and arrow key events, returns True when the list used it
+        """
+        match event.type:
+            case pygame.MOUSEWHEEL if self.__rect.collidepoint(pygame.mouse.get_pos()):
+                self.scroll(-3 * event.y * self.__rowHeight)
+                return True
+            case pygame.MOUSEBUTTONDOWN if event.button == 1:
+                self.__focused = self.__bodyRect.collidepoint(event.pos)
+                if self.__focused:
+                    row = (event.pos[1] - self.__bodyRect.top + self.__scrollY) // self.__rowHeight
+                    if row < len(self.__data):
+                        self.Selected = row
+                return self.__focused
+            case pygame.KEYDOWN if self.__focused:
+                page = max(self.__bodyRect.height // self.__rowHeight - 1, 1)
+                steps = {pygame.K_UP: -1, pygame.K_DOWN: 1, pygame.K_PAGEUP: -page, pygame.K_PAGEDOWN: page}
+                if event.key in steps:
+                    self.Selected = (self.__selected if self.__selected is not None else -1) + steps[event.key]
+                    return True
+                if event.key in (pygame.K_HOME, pygame.K_END):
+                    self.Selected = 0 if event.key == pygame.K_HOME else len(self.__data) - 1
+                    return True
+        return False
+
+    def show(self):
+        if self.__fullRedraw:
+            self.__fullRedraw = False
+            self.__drawStrip(0, self.__bodyRect.height)
+        self.__lastRendered, self.__rendered = self.__rendered, 0
+        if self.__headerSurface is not None:
+            self.__surface.blit(self.__headerSurface, self.__rect.topleft)
+        self.__surface.blit(self.__body, self.__bodyRect)
+
+
+if __name__ == "__main__":
+    help(ListViewAbstract)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import math
+import multiprocessing
+import os
+from typing import Any, Literal, Optional
+
+import pygame
+
+import GraphicEngine._common as _common
+from GraphicEngine._PygameGFX import PygameGFX
+
+_sketch: Optional[PygameGFX] = None
+
+
+def _startWorker(sketchType: type[PygameGFX], args: tuple[Any, ...], kwargs: dict[str, Any]):
+    global _sketch
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    # SDL turns SIGTERM into a QUIT event, which would keep the pool from terminating workers
+    os.environ["SDL_NO_SIGNAL_HANDLERS"] = "1"
+    _sketch = sketchType(*args, **kwargs)
+    _sketch._initialize()
+
+
+def _renderChunk(frames: range, frameRange: range, output: str, mode: str) -> int:
+    sketch = _sketch
+    if sketch is None:
+        raise RuntimeError("Offline render worker was not initialized")
+    fps = sketch.fps or 60
+    stream = open(output, "r+b") if mode == "raw" else None
+    try:
+        for frame in frames:
+            sketch._renderFrame(frame, frame / fps)
+            if stream is None:
+                pygame.image.save(sketch.BackgroundSurface, _common.frameFileName(output, frame))
+            else:
+                data = pygame.image.tobytes(sketch.BackgroundSurface, "RGB")
+                stream.seek(frameRange.index(frame) * len(data))
+                stream.write(data)
+    finally:
+        if stream is not None:
+            stream.close()
+    return len(frames)
+
+
+def renderOffline(
+    sketchType: type[PygameGFX],
+    frames: int | range,
+    output: str,
+    mode: Literal["frames"] | Literal["raw"] = "frames",
+    workers: Optional[int] = None,
+    chunkSize: Optional[int] = None,
+    args: tuple[Any, ...] = (),
+    kwargs: Optional[dict[str, Any]] = None,
+) -> int:
+    """
+    Renders frames of a sketch headless, split over a process pool.
+
+    Every worker process gets its own dummy display and its own instance of
+    sketchType(*args, **kwargs) on which Setup() is called once. Frames are
+    rendered with frameCount = frame and frameTime = frame / fps, so Draw()
+    has to depend only on those to give the same picture in every worker.
+
+    mode "frames" writes one image per frame to output, which is a pattern
+    like "render/frame-#####.png". mode "raw" writes every frame as packed
+    RGB24 to the single file output, the n-th frame of frames at offset
+    n * width * height * 3.
+    Returns the number of rendered frames.
+    """
+    frameRange = frames if isinstance(frames, range) else range(frames)
+    if not len(frameRange):
+        return 0
+    if mode == "frames" and "#" not in output:
+        raise ValueError(f"Output pattern {output!r} needs a run of '#' for the frame number")
+    if mode == "raw":
+        open(output, "wb").close()
+    workerCount = min(workers or os.cpu_count() or 1, len(frameRange))
+    size = chunkSize or math.ceil(len(frameRange) / workerCount)
+    chunks = [(frameRange[index:index + size], frameRange, output, mode) for index in range(0, len(frameRange), size)]
+    context = multiprocessing.get_context("spawn")
+    pool = context.Pool(workerCount, _startWorker, (sketchType, args, kwargs or {}))
+    try:
+        rendered = sum(pool.starmap(_renderChunk, chunks))
+        pool.close()
+    except BaseException:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+    return rendered
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from OpenGL.GL import (GL_COLOR_BUFFER_BIT,  # type: ignore
+                       GL_DEPTH_BUFFER_BIT, GL_DEPTH_TEST, GL_LESS,  # type: ignore
+                       GL_LINE_SMOOTH, GL_LINE_SMOOTH_HINT, GL_NICEST,  # type: ignore
+                       GL_SMOOTH, glClear, glClearColor, glClearDepth,  # type: ignore
+                       glDepthFunc, glEnable, glHint, glRotatef, glShadeModel,  # type: ignore
+                       glTranslatef)  # type: ignore
+from OpenGL.GLU import gluPerspective  # type: ignore
+
+
+def initialize():
+    glClearDepth(1.0)
+    glDepthFunc(GL_LESS)  # type: ignore
+    glEnable(GL_DEPTH_TEST)  # type: ignore
+    glShadeModel(GL_SMOOTH)  # type: ignore
+
+
+def perspective(fieldOfView: float, aspectRatio: float, near: float, far: float):
+    gluPerspective(fieldOfView, aspectRatio, near, far)
+
+
+def translate(x: float, y: float, z: float):
+    glTranslatef(x, y, z)
+
+
+def rotate(angle: float, x: float, y: float, z: float):
+    glRotatef(angle, x, y, z)
+
+
+def background(r: int, g: int, b: int, a: int):
+    glClearColor(r / 255, g / 255, b / 255, a / 255)
+    glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)  # type: ignore
+    glEnable(GL_LINE_SMOOTH)  # type: ignore
+    glHint(GL_LINE_SMOOTH_HINT, GL_NICEST)  # type: ignore
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import math
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Hashable, Literal, Optional, Sequence, Tuple
+
+import numpy as np
+import pygame
+
+import GraphicEngine._common as _common
+
+_Stops = Tuple[Tuple[float, Tuple[int, int, int, int]], ...]
+
+
+class Gradient:
+    """
+    Linear, radial or conic color ramp across the bounding box of a shape.
+
+    colors are spread evenly unless positions (0..1) are given. offset shifts
+    the ramp, with repeat the ramp wraps around instead of clamping, so an
+    animated gradient only changes offset and reuses the cached ramp and field.
+    """
+
+    @property
+    def Key(self) -> Hashable:
+        """
+        Identity of the gradient without its offset
+        """
+        return self.__key
+
+    @property
+    def Offset(self) -> float:
+        return self.__offset
+
+    @property
+    def FirstColor(self) -> Tuple[int, int, int, int]:
+        return self.__stops[0][1]
+
+    @property
+    def Stops(self) -> _Stops:
+        return self.__stops
+
+    @property
+    def Kind(self) -> str:
+        return self.__kind
+
+    @property
+    def Angle(self) -> float:
+        return self.__angle
+
+    @property
+    def Repeat(self) -> bool:
+        return self.__repeat
+
+    def __init__(
+        self,
+        colors: Sequence[_common.ColorValue],
+        kind: Literal["linear"] | Literal["radial"] | Literal["conic"] = "linear",
+        angle: float = 0.0,
+        positions: Optional[Sequence[float]] = None,
+        offset: float = 0.0,
+        repeat: bool = False,
+    ):
+        if len(colors) < 2:
+            raise ValueError("A gradient needs at least two colors")
+        if positions is None:
+            positions = [index / (len(colors) - 1) for index in range(len(colors))]
+        elif len(positions) != len(colors):
+            raise ValueError("A gradient needs one position per color")
+        self.__stops: _Stops = tuple((float(position), _common.toRGBA(color)) for position, color in zip(positions, colors))
+        self.__kind = kind
+        self.__angle = round(angle % 360, 4)
+        self.__offset = round(offset % 1 if repeat else offset, 4)
+        self.__repeat = repeat
+        self.__key = ("gradient", kind, self.__angle, self.__stops, repeat)
+
+    def render(self, size: Tuple[int, int]) -> pygame.Surface:
+        field = _field(self.__kind, size, self.__angle)
+        if self.__offset:
+            field = field + self.__offset
+        if self.__repeat:
+            field = field % 1.0
+        indices = np.clip(field * 255, 0, 255).astype(np.uint8)
+        pixels = _ramp(self.__stops)[indices]
+        return pygame.image.frombytes(pixels.tobytes(), size, "RGBA")
+
+
+class Pattern:
+    """
+    Surface tiled across the shape, starting at offset.
+    """
+
+    @property
+    def Key(self) -> Hashable:
+        """
+        Identity of the pattern without its offset
+        """
+        return ("pattern", self.__tile)
+
+    @property
+    def Offset(self) -> Tuple[int, int]:
+        return self.__offset
+
+    @property
+    def Tile(self) -> pygame.Surface:
+        return self.__tile
+
+    @property
+    def FirstColor(self) -> Tuple[int, int, int, int]:
+        return tuple(self.__tile.get_at((0, 0)))  # type: ignore
+
+    def __init__(self, tile: pygame.Surface, offset: Tuple[int, int] = (0, 0)):
+        self.__tile = tile
+        width, height = tile.get_size()
+        self.__offset = (offset[0] % width, offset[1] % height)
+
+    def render(self, size: Tuple[int, int]) -> pygame.Surface:
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        width, height = self.__tile.get_size()
+        surface.blits([
+            (self.__tile, (x, y))
+            for y in range(-self.__offset[1], size[1], height)
+            for x in range(-self.__offset[0], size[0], width)
+        ], False)
+        return surface
+
+
+Paint = Gradient | Pattern
+
+
+@lru_cache(maxsize=32)
+def _ramp(stops: _Stops) -> np.ndarray:
+    """
+    256 RGBA entries interpolated between the stops
+    """
+    positions = [position for position, _ in stops]
+    samples = np.linspace(0.0, 1.0, 256)
+    return np.stack([
+        np.rint(np.interp(samples, positions, [color[channel] for _, color in stops]))
+        for channel in range(4)
+    ], axis=-1).astype(np.uint8)
+
+
+@lru_cache(maxsize=8)
+def _field(kind: str, size: Tuple[int, int], angle: float) -> np.ndarray:
+    """
+    Ramp position 0..1 of every pixel, shaped (height, width)
+    """
+    width, height = size
+    ys, xs = np.mgrid[0:height, 0:width].astype(np.float32)
+    xs = (xs + 0.5) / width - 0.5
+    ys = (ys + 0.5) / height - 0.5
+    radians = math.radians(angle)
+    if kind == "radial":
+        field = np.hypot(xs, ys) * 2
+    elif kind == "conic":
+        field = ((np.arctan2(ys, xs) - radians) / (2 * math.pi)) % 1.0
+    else:
+        dx, dy = math.cos(radians), math.sin(radians)
+        extent = abs(dx) + abs(dy)
+        field = (xs * dx + ys * dy) / extent + 0.5
+    field.flags.writeable = False
+    return field
+
+
+class PaintCache:
+    """
+    Paints rendered per size, and masked to a shape, kept in a cache bounded
+    by the memory of its surfaces with the least recently used entries
+    dropped first.
+
+    Entries are keyed without the paint's offset. A pattern is rendered once
+    a tile larger and offset by handing out a subsurface of it. A gradient's
+    offset shifts its ramp, so an animated gradient replaces its own entry
+    instead of adding one per frame.
+    """
+
+    @property
+    def Size(self) -> int:
+        return len(self.__entries)
+
+    @property
+    def Bytes(self) -> int:
+        return self.__bytes
+
+    def __init__(self, maxBytes: int = 128 * 1024 * 1024):
+        self.__maxBytes = maxBytes
+        self.__bytes = 0
+        self.__entries: OrderedDict[Hashable, Tuple[Hashable, pygame.Surface]] = OrderedDict()
+
+    def clear(self):
+        self.__entries.clear()
+        self.__bytes = 0
+
+    def __lookup(self, key: Hashable, variant: Hashable, create: Callable[[], pygame.Surface]) -> pygame.Surface:
+        entry = self.__entries.get(key)
+        if entry is not None:
+            self.__entries.move_to_end(key)
+            if entry[0] == variant:
+                return entry[1]
+            self.__bytes -= self.__sizeOf(entry[1])
+        surface = create()
+        self.__entries[key] = (variant, surface)
+        self.__bytes += self.__sizeOf(surface)
+        # the newest entry is kept even when it alone is over the budget
+        while self.__bytes > self.__maxBytes and len(self.__entries) > 1:
+            self.__bytes -= self.__sizeOf(self.__entries.popitem(last=False)[1][1])
+        return surface
+
+    @staticmethod
+    def __sizeOf(surface: pygame.Surface) -> int:
+        return surface.get_width() * surface.get_height() * 4
+
+    def get(self, paint: Paint, size: Tuple[int, int]) -> pygame.Surface:
+        if isinstance(paint, Pattern):
+            tileWidth, tileHeight = paint.Tile.get_size()
+            tiled = self.__lookup(
+                (paint.Key, size), None,
+                lambda: self.__convert(Pattern(paint.Tile).render((size[0] + tileWidth, size[1] + tileHeight))),
+            )
+            return tiled.subsurface((paint.Offset, size))
+        return self.__lookup((paint.Key, size), paint.Offset, lambda: self.__convert(paint.render(size)))
+
+    def masked(
+        self, paint: Paint, size: Tuple[int, int], shape: Hashable, drawMask: Callable[[pygame.Surface], None]
+    ) -> pygame.Surface:
+        """
+        Returns the paint limited to a shape, drawMask draws the shape in opaque
+        white on a transparent surface of size.
+        """
+        def create() -> pygame.Surface:
+            mask = pygame.Surface(size, pygame.SRCALPHA)
+            drawMask(mask)
+            mask.blit(self.get(paint, size), (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+            return self.__convert(mask)
+        return self.__lookup((paint.Key, size, shape), paint.Offset, create)
+
+    @staticmethod
+    def __convert(surface: pygame.Surface) -> pygame.Surface:
+        return surface.convert_alpha() if pygame.display.get_surface() is not None else surface
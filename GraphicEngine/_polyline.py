@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Hashable, Sequence, Tuple, Union
+
+import numpy as np
+import pygame
+
+import GraphicEngine._common as _common
+
+PointArray = Union[np.ndarray, Sequence[_common.Coordinate]]
+
+
+def asPointArray(points: PointArray) -> np.ndarray:
+    """
+    Returns points as a (n, 2) float array, without copying float arrays.
+    """
+    if isinstance(points, np.ndarray):
+        return points.reshape(-1, 2).astype(np.float64, copy=False)
+    return np.array([(point[0], point[1]) for point in points], dtype=np.float64).reshape(-1, 2)
+
+
+def decimateColumns(points: np.ndarray, left: float, right: float) -> np.ndarray:
+    """
+    Level of detail for a trace sorted by x, drawn in screen coordinates.
+
+    Points outside [left, right) are cut (keeping one neighbour on each side)
+    and every pixel column is reduced to its first, min, max and last point,
+    which rasterizes to the same vertical extents as the full trace. Aliased
+    lines give the same pixels, antialiased ones differ in the edge shading.
+    Traces that are not sorted by x or that are already sparse are returned as is.
+    """
+    if len(points) < 8:
+        return points
+    xs = points[:, 0]
+    if np.any(xs[1:] < xs[:-1]):
+        return points
+    start = max(int(np.searchsorted(xs, left, "left")) - 1, 0)
+    stop = min(int(np.searchsorted(xs, right, "right")) + 1, len(points))
+    points = points[start:stop]
+    xs = points[:, 0]
+    ys = points[:, 1]
+    columns = np.floor(xs).astype(np.int64)
+    starts = np.flatnonzero(np.diff(columns)) + 1
+    if len(points) <= 4 * (len(starts) + 1):
+        return points
+    starts = np.concatenate(([0], starts))
+    ends = np.concatenate((starts[1:], [len(points)])) - 1
+    reduced = np.empty((len(starts), 4, 2), dtype=np.float64)
+    reduced[:, 0] = points[starts]
+    reduced[:, 1, 0] = xs[starts]
+    reduced[:, 1, 1] = np.minimum.reduceat(ys, starts)
+    reduced[:, 2, 0] = xs[starts]
+    reduced[:, 2, 1] = np.maximum.reduceat(ys, starts)
+    reduced[:, 3] = points[ends]
+    return reduced.reshape(-1, 2)
+
+
+class PolygonCache:
+    """
+    Rasterized polygons keyed by a caller chosen key, so static shapes are
+    only scanline filled once and then blitted. Bounded, least recently used
+    entries are dropped first.
+    """
+
+    @property
+    def Size(self) -> int:
+        return len(self.__entries)
+
+    def __init__(self, maxSize: int = 64):
+        self.__maxSize = maxSize
+        self.__entries: OrderedDict[Hashable, Tuple[pygame.Surface, Tuple[int, int]]] = OrderedDict()
+
+    def clear(self):
+        self.__entries.clear()
+
+    def get(
+        self, key: Hashable, points: np.ndarray, color: _common.ColorValue, width: int, closed: bool = True
+    ) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """
+        Returns the polygon rendered on a SRCALPHA surface and the surface's offset,
+        filled for width 0, otherwise an outline drawn like Canvas.polygon draws it
+        """
+        entryKey = (key, tuple(pygame.Color(color)), width, closed)  # type: ignore
+        entry = self.__entries.get(entryKey)
+        if entry is not None:
+            self.__entries.move_to_end(entryKey)
+            return entry
+        low = np.floor(points.min(axis=0)).astype(int) - width - 1
+        high = np.ceil(points.max(axis=0)).astype(int) + width + 2
+        surface = pygame.Surface((int(high[0] - low[0]), int(high[1] - low[1])), pygame.SRCALPHA)
+        localPoints = (points - low).tolist()
+        if width == 0:
+            pygame.draw.polygon(surface, color, localPoints)  # type: ignore
+        elif width == 1:
+            # aalines blends with what is under it, so the coverage drawn on black becomes the alpha
+            coverage = pygame.Surface(surface.get_size())
+            pygame.draw.aalines(coverage, (255, 255, 255), closed, localPoints)
+            rgba = pygame.Color(color)  # type: ignore
+            surface.fill((rgba.r, rgba.g, rgba.b, 0))
+            alpha = pygame.surfarray.pixels_alpha(surface)
+            alpha[:] = pygame.surfarray.array_red(coverage).astype(np.uint16) * rgba.a // 255
+            del alpha
+        else:
+            pygame.draw.lines(surface, color, closed, localPoints, width)  # type: ignore
+        entry = (surface, (int(low[0]), int(low[1])))
+        self.__entries[entryKey] = entry
+        if len(self.__entries) > self.__maxSize:
+            self.__entries.popitem(last=False)
+        return entry
+
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import time
+from abc import ABC, abstractmethod
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+import pygame
+
+from GraphicEngine._rollingStats import RollingStats
+
+
+def _scratch(existing: Optional[pygame.Surface], like: pygame.Surface, size: Tuple[int, int]) -> pygame.Surface:
+    """
+    Returns existing when it still has size and the pixel format of like, else a new surface
+    """
+    if (
+        existing is not None and existing.get_size() == size
+        and existing.get_bitsize() == like.get_bitsize() and existing.get_masks() == like.get_masks()
+    ):
+        return existing
+    return pygame.Surface(size, like.get_flags() & pygame.SRCALPHA, like)
+
+
+class _Pyramid:
+    """
+    Halved copies of a frame made with smoothscale, the cheap way to a wide blur.
+    """
+
+    def __init__(self):
+        self.__levels: list[pygame.Surface] = []
+
+    def down(self, surface: pygame.Surface, levels: int) -> list[pygame.Surface]:
+        width, height = surface.get_size()
+        source = surface
+        for index in range(levels):
+            size = (max(width >> (index + 1), 1), max(height >> (index + 1), 1))
+            if index == len(self.__levels):
+                self.__levels.append(_scratch(None, surface, size))
+            self.__levels[index] = _scratch(self.__levels[index], surface, size)
+            pygame.transform.smoothscale(source, size, self.__levels[index])
+            source = self.__levels[index]
+        return self.__levels[:levels]
+
+    def up(self, levels: list[pygame.Surface], target: pygame.Surface):
+        for index in range(len(levels) - 1, 0, -1):
+            pygame.transform.smoothscale(levels[index], levels[index - 1].get_size(), levels[index - 1])
+        pygame.transform.smoothscale(levels[0], target.get_size(), target)
+        # every smoothscale enlargement moves the image half a destination pixel right and down
+        shift = round((2 ** len(levels) - 1) / 2)
+        target.scroll(-shift, -shift)
+        # the right and bottom shift pixels are left from before the scroll, they repeat the last column and row
+        width, height = target.get_size()
+        if 0 < shift < min(width, height):
+            edge = (width - shift, 0, shift, height)
+            pygame.transform.scale(target.subsurface((width - shift - 1, 0, 1, height)), edge[2:], target.subsurface(edge))
+            edge = (0, height - shift, width, shift)
+            pygame.transform.scale(target.subsurface((0, height - shift - 1, width, 1)), edge[2:], target.subsurface(edge))
+
+
+class PostFilter(ABC):
+    """
+    A step of the post-processing chain, changes the composited frame in place.
+    Buffers are allocated on the first frame and reused while the size stays.
+    """
+
+    @property
+    def Name(self) -> str:
+        return type(self).__name__
+
+    @abstractmethod
+    def apply(self, surface: pygame.Surface):
+        ...
+
+
+class Blur(PostFilter):
+    """
+    Blur of roughly 2 ** levels pixels, down and up a smoothscale pyramid.
+    """
+
+    def __init__(self, levels: int = 3):
+        self.__levels = levels
+        self.__pyramid = _Pyramid()
+
+    def apply(self, surface: pygame.Surface):
+        self.__pyramid.up(self.__pyramid.down(surface, self.__levels), surface)
+
+
+class Bloom(PostFilter):
+    """
+    Glow around bright areas: the part above threshold is taken at half size,
+    stretched back to 0..255 and scaled by intensity, blurred through the
+    pyramid and added to the frame.
+    """
+
+    def __init__(self, threshold: int = 200, intensity: float = 1.0, levels: int = 4):
+        self.__threshold = threshold
+        self.__levels = max(levels, 1)
+        self.__pyramid = _Pyramid()
+        self.__brightPyramid = _Pyramid()
+        self.__glow: Optional[pygame.Surface] = None
+        self.__work: Optional[np.ndarray] = None
+        # 8.8 fixed point gain, limited so the product stays within uint16
+        span = max(255 - threshold, 1)
+        self.__gain = min(round(256 * intensity * 255 / span), 65535 // span)
+
+    def apply(self, surface: pygame.Surface):
+        bright = self.__pyramid.down(surface, 1)[0]
+        pixels = pygame.surfarray.pixels3d(bright)
+        if self.__work is None or self.__work.shape != pixels.shape:
+            self.__work = np.empty(pixels.shape, np.uint16)
+        work = self.__work
+        np.maximum(pixels, self.__threshold, out=work)
+        work -= self.__threshold
+        work *= self.__gain
+        work >>= 8
+        np.minimum(work, 255, out=work)
+        pixels[...] = work
+        del pixels
+        self.__glow = _scratch(self.__glow, surface, surface.get_size())
+        self.__brightPyramid.up([bright] + self.__brightPyramid.down(bright, self.__levels - 1), self.__glow)
+        surface.blit(self.__glow, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
+
+
+class Vignette(PostFilter):
+    """
+    Darkens the corners, strength 0..1 at the corners, starting at radius
+    (relative to the half diagonal). The mask is built once per size.
+    """
+
+    def __init__(self, strength: float = 0.5, radius: float = 0.5):
+        self.__strength = strength
+        self.__radius = radius
+        self.__mask: Optional[pygame.Surface] = None
+
+    def apply(self, surface: pygame.Surface):
+        if self.__mask is None or self.__mask.get_size() != surface.get_size():
+            width, height = surface.get_size()
+            xs = (np.arange(width) + 0.5) / width * 2 - 1
+            ys = (np.arange(height) + 0.5) / height * 2 - 1
+            distance = np.hypot(xs[:, None], ys[None, :]) / np.sqrt(2)
+            falloff = np.clip((distance - self.__radius) / max(1 - self.__radius, 1e-6), 0, 1)
+            shade = np.rint(255 * (1 - self.__strength * falloff ** 2)).astype(np.uint8)
+            self.__mask = pygame.surfarray.make_surface(np.repeat(shade[:, :, None], 3, axis=2))
+        surface.blit(self.__mask, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
+
+
+class ColorGrade(PostFilter):
+    """
+    Per channel curve (brightness, contrast, gamma and gain) applied through
+    lookup tables, plus desaturation, 0 keeps the colors and 1 is grayscale.
+    """
+
+    def __init__(
+        self,
+        brightness: float = 0.0,
+        contrast: float = 1.0,
+        gamma: float = 1.0,
+        gain: Tuple[float, float, float] = (1.0, 1.0, 1.0),
+        desaturate: float = 0.0,
+    ):
+        self.__desaturate = desaturate
+        self.__gray: Optional[pygame.Surface] = None
+        self.__channel: Optional[np.ndarray] = None
+        values = np.linspace(0.0, 1.0, 256)
+        curve = ((values ** (1 / gamma)) - 0.5) * contrast + 0.5 + brightness
+        self.__luts = [np.rint(np.clip(curve * channelGain, 0, 1) * 255).astype(np.uint8) for channelGain in gain]
+        self.__identity = all(np.array_equal(lut, np.arange(256)) for lut in self.__luts)
+
+    def apply(self, surface: pygame.Surface):
+        if not self.__identity:
+            pixels = pygame.surfarray.pixels3d(surface)
+            if self.__channel is None or self.__channel.shape != pixels.shape[:2]:
+                self.__channel = np.empty(pixels.shape[:2], np.uint8)
+            for channel, lut in enumerate(self.__luts):
+                # a contiguous scratch is faster for take than the strided channel view
+                np.take(lut, pixels[..., channel], out=self.__channel, mode="clip")
+                pixels[..., channel] = self.__channel
+            del pixels
+        if self.__desaturate > 0:
+            self.__gray = _scratch(self.__gray, surface, surface.get_size())
+            pygame.transform.grayscale(surface, self.__gray)
+            self.__gray.set_alpha(round(255 * min(self.__desaturate, 1.0)))
+            surface.blit(self.__gray, (0, 0))
+
+
+class PostProcessChain:
+    """
+    Filters run in order on the composited frame, each one timed in ms.
+    """
+
+    @property
+    def IsEmpty(self) -> bool:
+        return not self.__filters
+
+    @property
+    def Stats(self) -> dict[str, RollingStats]:
+        return self.__stats
+
+    def __init__(self):
+        self.__filters: list[Tuple[str, PostFilter]] = []
+        self.__stats: dict[str, RollingStats] = {}
+
+    def __iter__(self) -> Iterator[PostFilter]:
+        return iter(postFilter for _, postFilter in self.__filters)
+
+    def add(self, postFilter: PostFilter, name: Optional[str] = None) -> PostFilter:
+        base = name = name or postFilter.Name
+        index = len(self.__filters)
+        while name in self.__stats:
+            name = f"{base}{index}"
+            index += 1
+        self.__filters.append((name, postFilter))
+        self.__stats[name] = RollingStats()
+        return postFilter
+
+    def remove(self, postFilter: PostFilter):
+        for name, existing in self.__filters:
+            if existing is postFilter:
+                self.__filters.remove((name, existing))
+                del self.__stats[name]
+                return
+
+    def clear(self):
+        self.__filters.clear()
+        self.__stats.clear()
+
+    def apply(self, surface: pygame.Surface):
+        for name, postFilter in self.__filters:
+            start = time.perf_counter()
+            postFilter.apply(surface)
+            self.__stats[name].add((time.perf_counter() - start) * 1000)
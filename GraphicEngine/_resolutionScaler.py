@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from GraphicEngine.constrain import constrain
+
+
+class ResolutionScaler:
+    """
+    Picks the render scale from measured frame times.
+
+    Frame times are averaged over window frames. Above highWater * budget the
+    scale steps down, below lowWater * budget it steps up, in between it is
+    kept, so the scale does not oscillate around the budget.
+    """
+
+    @property
+    def Scale(self) -> float:
+        return self.__scale
+
+    @property
+    def AverageFrameTime(self) -> float:
+        return self.__average
+
+    def __init__(
+        self,
+        budget: float,
+        scale: float = 1.0,
+        minScale: float = 0.5,
+        maxScale: float = 1.0,
+        step: float = 0.1,
+        lowWater: float = 0.7,
+        highWater: float = 0.95,
+        window: int = 30,
+    ):
+        self.__budget = budget
+        self.__minScale = minScale
+        self.__maxScale = maxScale
+        self.__scale = constrain(scale, minScale, maxScale)
+        self.__step = step
+        self.__lowWater = lowWater
+        self.__highWater = highWater
+        self.__window = window
+        self.__total = 0.0
+        self.__count = 0
+        self.__average = 0.0
+
+    def update(self, frameTime: float) -> bool:
+        """
+        Adds the frame time (in the same unit as budget), returns True when the scale changed
+        """
+        self.__total += frameTime
+        self.__count += 1
+        if self.__count < self.__window:
+            return False
+        self.__average = self.__total / self.__count
+        self.__total = 0.0
+        self.__count = 0
+        scale = self.__scale
+        if self.__average > self.__highWater * self.__budget:
+            scale = round(constrain(scale - self.__step, self.__minScale, self.__maxScale), 4)
+        elif self.__average < self.__lowWater * self.__budget:
+            scale = round(constrain(scale + self.__step, self.__minScale, self.__maxScale), 4)
+        if scale == self.__scale:
+            return False
+        self.__scale = scale
+        return True
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from collections import deque
+
+
+class RollingStats:
+    """
+    Summary of the last window values, e.g. frame durations or input latencies in ms.
+    """
+
+    @property
+    def Count(self) -> int:
+        return len(self.__values)
+
+    @property
+    def Last(self) -> float:
+        return self.__values[-1] if self.__values else 0.0
+
+    @property
+    def Mean(self) -> float:
+        return sum(self.__values) / len(self.__values) if self.__values else 0.0
+
+    @property
+    def Min(self) -> float:
+        return min(self.__values, default=0.0)
+
+    @property
+    def Max(self) -> float:
+        return max(self.__values, default=0.0)
+
+    def __init__(self, window: int = 120):
+        self.__values: deque[float] = deque(maxlen=window)
+
+    def __repr__(self) -> str:
+        return (
+            f"RollingStats(count={self.Count}, mean={self.Mean:.2f}, "
+            f"p95={self.percentile(95):.2f}, max={self.Max:.2f})"
+        )
+
+    def add(self, value: float):
+        self.__values.append(value)
+
+    def clear(self):
+        self.__values.clear()
+
+    def percentile(self, percent: float) -> float:
+        """
+        Nearest rank percentile of the values in the window
+        """
+        if not self.__values:
+            return 0.0
+        ordered = sorted(self.__values)
+        return ordered[min(len(ordered) - 1, max(0, round(percent / 100 * len(ordered)) - 1))]
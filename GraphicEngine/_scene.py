@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import math
+from typing import Any, Callable, Iterator, Tuple
+
+import pygame
+
+Bounds = Tuple[float, float, float, float]
+
+
+class SceneItem:
+    """
+    Entry of a Scene, Bounds is (x, y, width, height) in world coordinates.
+    """
+    __slots__ = ("Bounds", "Data", "Order", "_cells")
+
+    def __init__(self, bounds: Bounds, data: Any, order: int):
+        self.Bounds = bounds
+        self.Data = data
+        self.Order = order
+        self._cells: Tuple[int, int, int, int] = (0, 0, -1, -1)
+
+
+class Scene:
+    """
+    2D items kept in a uniform grid, so a frame only visits the items that
+    intersect the viewport. Items spanning several cells are listed in each of
+    them. Items are drawn in the order they were added.
+    """
+
+    @property
+    def Count(self) -> int:
+        return len(self.__items)
+
+    @property
+    def Drawn(self) -> int:
+        """
+        Items drawn by the last draw()
+        """
+        return self.__drawn
+
+    @property
+    def Culled(self) -> int:
+        """
+        Items skipped by the last draw()
+        """
+        return len(self.__items) - self.__drawn
+
+    def __init__(self, cellSize: float = 256):
+        self.__cellSize = cellSize
+        self.__cells: dict[Tuple[int, int], set[SceneItem]] = {}
+        self.__items: set[SceneItem] = set()
+        self.__order = 0
+        self.__drawn = 0
+
+    def __iter__(self) -> Iterator[SceneItem]:
+        return iter(self.__items)
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __cellRange(self, bounds: Bounds) -> Tuple[int, int, int, int]:
+        x, y, width, height = bounds
+        size = self.__cellSize
+        return (
+            math.floor(x / size), math.floor(y / size),
+            math.floor((x + max(width, 0)) / size), math.floor((y + max(height, 0)) / size),
+        )
+
+    def __link(self, item: SceneItem):
+        left, top, right, bottom = item._cells = self.__cellRange(item.Bounds)
+        for cellX in range(left, right + 1):
+            for cellY in range(top, bottom + 1):
+                self.__cells.setdefault((cellX, cellY), set()).add(item)
+
+    def __unlink(self, item: SceneItem):
+        left, top, right, bottom = item._cells
+        for cellX in range(left, right + 1):
+            for cellY in range(top, bottom + 1):
+                cell = self.__cells[(cellX, cellY)]
+                cell.discard(item)
+                if not cell:
+                    del self.__cells[(cellX, cellY)]
+
+    def add(self, bounds: Bounds, data: Any = None) -> SceneItem:
+        item = SceneItem(bounds, data, self.__order)
+        self.__order += 1
+        self.__items.add(item)
+        self.__link(item)
+        return item
+
+    def move(self, item: SceneItem, bounds: Bounds):
+        """
+        Updates the bounds, the grid is only touched when the item changes cells
+        """
+        item.Bounds = bounds
+        if self.__cellRange(bounds) != item._cells:
+            self.__unlink(item)
+            self.__link(item)
+
+    def remove(self, item: SceneItem):
+        if item in self.__items:
+            self.__items.remove(item)
+            self.__unlink(item)
+
+    def clear(self):
+        self.__items.clear()
+        self.__cells.clear()
+        self.__drawn = 0
+
+    def query(self, viewport: pygame.Rect | Bounds) -> list[SceneItem]:
+        """
+        Items whose bounds intersect viewport, in the order they were added
+        """
+        x, y, width, height = viewport
+        left, top, right, bottom = self.__cellRange((x, y, width, height))
+        if (right - left + 1) * (bottom - top + 1) > len(self.__cells):
+            cells = [cell for key, cell in self.__cells.items() if left <= key[0] <= right and top <= key[1] <= bottom]
+        else:
+            cells = [cell for key in (
+                (cellX, cellY) for cellX in range(left, right + 1) for cellY in range(top, bottom + 1)
+            ) if (cell := self.__cells.get(key)) is not None]
+        found: set[SceneItem] = set()
+        for cell in cells:
+            found.update(cell)
+        visible = [
+            item for item in found
+            if item.Bounds[0] <= x + width and item.Bounds[0] + item.Bounds[2] >= x
+            and item.Bounds[1] <= y + height and item.Bounds[1] + item.Bounds[3] >= y
+        ]
+        visible.sort(key=lambda item: item.Order)
+        return visible
+
+    def draw(self, viewport: pygame.Rect | Bounds, drawItem: Callable[[SceneItem], None]) -> int:
+        """
+        Calls drawItem for every item in viewport, returns how many were drawn
+        """
+        visible = self.query(viewport)
+        for item in visible:
+            drawItem(item)
+        self.__drawn = len(visible)
+        return self.__drawn
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import threading
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+_HEADER_SIZE = 128
+_MAX_DIMENSIONS = 8
+_DTYPE_OFFSET = 96
+# int64 header fields
+_PUBLISHED = 0
+_WRITING = 1
+_DIMENSIONS = 2
+_SHAPE = 3
+
+_registerLock = threading.Lock()
+
+
+def _openSharedMemory(name: Optional[str], size: int) -> SharedMemory:
+    if size:
+        return SharedMemory(name=name, create=True, size=size)
+    try:
+        # attaching must not register the block with this process's resource tracker,
+        # which would unlink it when this process exits
+        return SharedMemory(name=name, track=False)  # type: ignore
+    except TypeError:
+        pass
+    # before 3.13 attaching always registers the block. Unregistering it afterwards is
+    # wrong for spawned children, they share the creator's tracker and would drop the
+    # creator's registration, so the registration is skipped instead
+    with _registerLock:
+        register = resource_tracker.register
+        resource_tracker.register = lambda name, rtype: None
+        try:
+            return SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+def _attach(blockType: type[_SharedBlock], name: str) -> _SharedBlock:
+    return blockType(name=name)  # type: ignore
+
+
+class _SharedBlock:
+    """
+    Shared memory block with a header holding two counters, the shape and the dtype,
+    so other processes can attach by name alone.
+    """
+
+    @property
+    def Name(self) -> str:
+        return self._memory.name
+
+    def __init__(self, shape: Optional[Sequence[int]], dtype: DTypeLike, name: Optional[str], copies: int):
+        if shape is not None:
+            dataType = np.dtype(dtype)
+            shape = tuple(int(size) for size in shape)
+            if len(shape) > _MAX_DIMENSIONS or len(dataType.str) > _HEADER_SIZE - _DTYPE_OFFSET:
+                raise ValueError("Shape or dtype does not fit in the shared memory header")
+            self._memory = _openSharedMemory(name, _HEADER_SIZE + copies * int(np.prod(shape)) * dataType.itemsize)
+            self._header = np.ndarray((_DTYPE_OFFSET // 8,), np.int64, self._memory.buf)
+            self._header[:] = 0
+            self._header[_DIMENSIONS] = len(shape)
+            self._header[_SHAPE:_SHAPE + len(shape)] = shape
+            self._memory.buf[_DTYPE_OFFSET:_DTYPE_OFFSET + len(dataType.str)] = dataType.str.encode()
+            self._owner = True
+        elif name is not None:
+            self._memory = _openSharedMemory(name, 0)
+            self._header = np.ndarray((_DTYPE_OFFSET // 8,), np.int64, self._memory.buf)
+            shape = tuple(int(size) for size in self._header[_SHAPE:_SHAPE + self._header[_DIMENSIONS]])
+            dataType = np.dtype(bytes(self._memory.buf[_DTYPE_OFFSET:_HEADER_SIZE]).rstrip(b"\0").decode())
+            self._owner = False
+        else:
+            raise ValueError("Either shape (to create) or name (to attach) is required")
+        self._shape: Tuple[int, ...] = shape
+        self._dtype = dataType
+        self._data = np.ndarray((copies * shape[0],) + shape[1:], dataType, self._memory.buf, _HEADER_SIZE)
+
+    def __reduce__(self):
+        # sent to another process it attaches to the same block
+        return (_attach, (type(self), self.Name))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args: object):
+        self.close()
+
+    def close(self):
+        """
+        Detaches from the block, the creating side also frees it
+        """
+        if self._memory is None:
+            return
+        del self._header, self._data
+        self._memory.close()
+        if self._owner:
+            try:
+                self._memory.unlink()
+            except FileNotFoundError:
+                # already removed by another process
+                pass
+        self._memory = None  # type: ignore
+
+
+class SharedArray(_SharedBlock):
+    """
+    Double buffered array in shared memory for one producer process.
+
+    The producer writes into the back buffer and publishes it, readers get a
+    read-only view of the latest published buffer without copying. A view stays
+    valid until the producer starts writing the buffer after the next one,
+    isValid(sequence) tells whether that already happened (a sequence lock).
+    Create with a shape, attach from other processes with the Name (or pass
+    the object itself to the process).
+    """
+
+    @property
+    def Shape(self) -> Tuple[int, ...]:
+        return self._shape
+
+    @property
+    def Sequence(self) -> int:
+        """
+        Number of published updates
+        """
+        return int(self._header[_PUBLISHED])
+
+    def __init__(
+        self,
+        shape: Optional[Sequence[int]] = None,
+        dtype: DTypeLike = np.float64,
+        name: Optional[str] = None,
+    ):
+        super().__init__(shape, dtype, name, 2)
+        self._buffers = (self._data[:self._shape[0]], self._data[self._shape[0]:])
+
+    def close(self):
+        self._buffers = ()
+        super().close()
+
+    def beginWrite(self) -> np.ndarray:
+        """
+        Returns the back buffer (holding the update before the latest one), publish() makes it current
+        """
+        sequence = int(self._header[_PUBLISHED]) + 1
+        self._header[_WRITING] = sequence
+        return self._buffers[sequence % 2]
+
+    def publish(self):
+        self._header[_PUBLISHED] = self._header[_WRITING]
+
+    def write(self, values: np.ndarray | Sequence[float]):
+        self.beginWrite()[...] = values
+        self.publish()
+
+    def read(self) -> Tuple[int, np.ndarray]:
+        """
+        Returns the sequence and a read-only view of the latest published values
+        """
+        while True:
+            sequence = int(self._header[_PUBLISHED])
+            view = self._buffers[sequence % 2].view()
+            if self.isValid(sequence):
+                view.flags.writeable = False
+                return sequence, view
+
+    def isValid(self, sequence: int) -> bool:
+        """
+        False once the producer started overwriting the values read at sequence
+        """
+        return int(self._header[_WRITING]) < sequence + 2
+
+
+class SharedRingBuffer(_SharedBlock):
+    """
+    Ring buffer of samples in shared memory for one producer process.
+
+    Every sample is stored twice, at its slot and one capacity further, so
+    any window of up to capacity samples is a contiguous view that readers
+    get without copying. The view stays valid until the producer wraps around
+    onto it, which isValid() checks.
+    """
+
+    @property
+    def Capacity(self) -> int:
+        return self._shape[0]
+
+    @property
+    def Position(self) -> int:
+        """
+        Total number of samples appended
+        """
+        return int(self._header[_PUBLISHED])
+
+    def __init__(
+        self,
+        capacity: Optional[int] = None,
+        channels: int = 1,
+        dtype: DTypeLike = np.float64,
+        name: Optional[str] = None,
+    ):
+        shape = None if capacity is None else (capacity,) if channels == 1 else (capacity, channels)
+        super().__init__(shape, dtype, name, 2)
+
+    def append(self, samples: np.ndarray | Sequence[float] | Sequence[Sequence[float]]):
+        """
+        Adds samples, shaped (n,) for a single channel or (n, channels)
+        """
+        values = np.asarray(samples, dtype=self._dtype).reshape((-1,) + self._shape[1:])
+        capacity = self._shape[0]
+        position = int(self._header[_PUBLISHED])
+        end = position + len(values)
+        values = values[-capacity:]
+        self._header[_WRITING] = end
+        start = (end - len(values)) % capacity
+        first = min(len(values), capacity - start)
+        for offset in (0, capacity):
+            self._data[offset + start:offset + start + first] = values[:first]
+            self._data[offset:offset + len(values) - first] = values[first:]
+        self._header[_PUBLISHED] = end
+
+    def read(self, count: Optional[int] = None) -> Tuple[int, np.ndarray]:
+        """
+        Returns the position and a read-only view of the latest count samples (all by default)
+        """
+        position = int(self._header[_PUBLISHED])
+        count = min(position, self._shape[0] if count is None else count, self._shape[0])
+        return position, self.__view(position, count)
+
+    def readSince(self, position: int) -> Tuple[int, np.ndarray]:
+        """
+        Returns the new position and a read-only view of the samples appended
+        after position, limited to the latest capacity samples
+        """
+        current = int(self._header[_PUBLISHED])
+        count = min(current - position, self._shape[0])
+        return current, self.__view(current, count)
+
+    def __view(self, position: int, count: int) -> np.ndarray:
+        start = (position - count) % self._shape[0]
+        view = self._data[start:start + count].view()
+        view.flags.writeable = False
+        return view
+
+    def isValid(self, position: int, count: int) -> bool:
+        """
+        False once the producer started overwriting the count samples read at position
+        """
+        return int(self._header[_WRITING]) <= position - count + self._shape[0]
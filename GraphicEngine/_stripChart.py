@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+import pygame
+
+import GraphicEngine._common as _common
+
+
+class StripChartAbstract:
+    """
+    Scrolling chart of the latest samples of one or more channels.
+
+    Samples live in a fixed size ring buffer. show() scrolls the cached chart
+    surface and rasterizes only the columns completed since the last frame,
+    every column covering samplesPerPixel samples drawn as their min/max span.
+    The history is redrawn only when the vertical scale changes.
+    """
+
+    __defaultColors: Tuple[_common.ColorValue, ...] = (
+        (0x1F, 0x77, 0xB4), (0xFF, 0x7F, 0x0E), (0x2C, 0xA0, 0x2C), (0xD6, 0x27, 0x28),
+        (0x94, 0x67, 0xBD), (0x8C, 0x56, 0x4B), (0xE3, 0x77, 0xC2), (0x7F, 0x7F, 0x7F),
+    )
+
+    @property
+    def Channels(self) -> int:
+        return self.__channels
+
+    @property
+    def Capacity(self) -> int:
+        return self.__capacity
+
+    @property
+    def SampleCount(self) -> int:
+        return self.__written
+
+    @property
+    def Range(self) -> Tuple[float, float]:
+        return self.__low, self.__high
+
+    def __init__(
+        self,
+        surface: pygame.Surface,
+        rect: pygame.Rect,
+        channels: int = 1,
+        samplesPerPixel: int = 1,
+        colors: Optional[Sequence[_common.ColorValue]] = None,
+        background: _common.ColorValue = (0, 0, 0),
+        yRange: Optional[Tuple[float, float]] = None,
+    ):
+        self.__surface = surface
+        self.__rect = rect
+        self.__channels = channels
+        self.__samplesPerPixel = samplesPerPixel
+        self.__colors = list(colors) if colors else [
+            self.__defaultColors[index % len(self.__defaultColors)] for index in range(channels)
+        ]
+        self.__background = background
+        self.__autoscale = yRange is None
+        self.__low, self.__high = yRange if yRange is not None else (np.inf, -np.inf)
+        self.__capacity = rect.width * samplesPerPixel
+        self.__buffer = np.zeros((self.__capacity, channels), dtype=np.float64)
+        self.__written = 0
+        self.__drawn = 0
+        self.__lastValues = np.full(channels, np.nan)
+        self.__redrawAll = True
+        self.__chartSurface = pygame.Surface(rect.size)
+
+    def append(self, samples: np.ndarray | Sequence[float] | Sequence[Sequence[float]]):
+        """
+        Adds samples, shaped (n,) for a single channel or (n, channels)
+        """
+        values = np.asarray(samples, dtype=np.float64).reshape(-1, self.__channels)
+        if not len(values):
+            return
+        if self.__autoscale:
+            low, high = float(np.nanmin(values)), float(np.nanmax(values))
+            if low < self.__low or high > self.__high:
+                self.setRange(min(low, self.__low), max(high, self.__high), True)
+        self.__written += len(values)
+        values = values[-self.__capacity:]
+        start = (self.__written - len(values)) % self.__capacity
+        first = min(len(values), self.__capacity - start)
+        self.__buffer[start:start + first] = values[:first]
+        self.__buffer[:len(values) - first] = values[first:]
+
+    def setRange(self, low: float, high: float, autoscale: bool = False):
+        """
+        Sets the vertical scale, with autoscale the range only grows (with some margin)
+        """
+        if autoscale:
+            margin = (high - low) * 0.1 or 1.0
+            low, high = low - margin, high + margin
+        self.__autoscale = autoscale
+        if (low, high) != (self.__low, self.__high):
+            self.__low, self.__high = low, high
+            self.__redrawAll = True
+
+    def rescale(self):
+        """
+        Fits the vertical scale to the samples in the buffer
+        """
+        count = min(self.__written, self.__capacity)
+        if count:
+            self.setRange(float(np.nanmin(self.__buffer[:count])), float(np.nanmax(self.__buffer[:count])), True)
+
+    def __samples(self, start: int, stop: int) -> np.ndarray:
+        first = start % self.__capacity
+        last = first + stop - start
+        if last <= self.__capacity:
+            return self.__buffer[first:last]
+        return np.concatenate((self.__buffer[first:], self.__buffer[:last - self.__capacity]))
+
+    def __rasterize(self, samples: np.ndarray, left: int):
+        height = self.__rect.height
+        blocks = samples.reshape(-1, self.__samplesPerPixel, self.__channels)
+        previous = np.concatenate((self.__lastValues[None], blocks[:-1, -1]))
+        self.__lastValues = blocks[-1, -1].copy()
+        low = np.fmin(blocks.min(axis=1), previous)
+        high = np.fmax(blocks.max(axis=1), previous)
+        scale = (height - 1) / ((self.__high - self.__low) or 1.0)
+        top = np.clip(np.rint((self.__high - high) * scale), 0, height - 1)
+        bottom = np.clip(np.rint((self.__high - low) * scale), 0, height - 1)
+        rows = np.arange(height)
+        pixels = pygame.surfarray.pixels2d(self.__chartSurface)
+        columns = pixels[left:left + len(blocks)]
+        for channel in range(self.__channels):
+            mask = (rows >= top[:, channel, None]) & (rows <= bottom[:, channel, None])
+            columns[mask] = self.__chartSurface.map_rgb(self.__colors[channel])  # type: ignore
+        del columns, pixels
+
+    def show(self):
+        width = self.__rect.width
+        available = self.__written - self.__written % self.__samplesPerPixel
+        newColumns = (available - self.__drawn) // self.__samplesPerPixel
+        if self.__redrawAll or newColumns >= width:
+            self.__chartSurface.fill(self.__background)  # type: ignore
+            start = max(available - self.__capacity, 0)
+            self.__lastValues = np.full(self.__channels, np.nan)
+            if available > start:
+                columns = (available - start) // self.__samplesPerPixel
+                self.__rasterize(self.__samples(start, available), width - columns)
+            self.__redrawAll = False
+        elif newColumns:
+            self.__chartSurface.scroll(-newColumns, 0)
+            self.__chartSurface.fill(self.__background, pygame.Rect(width - newColumns, 0, newColumns, self.__rect.height))  # type: ignore
+            self.__rasterize(self.__samples(self.__drawn, available), width - newColumns)
+        self.__drawn = available
+        self.__surface.blit(self.__chartSurface, self.__rect)
@@ -0,0 +1,342 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import pygame
+
+import GraphicEngine._common as _common
+
+Position = Tuple[int, int]
+
+
+class TextEditorAbstract:
+    """
+    Multiline text box for long documents.
+
+    Text is kept as a list of lines, every line is rendered once into a cached
+    surface (keyed by its content, LRU bounded) and show() only composes the
+    lines inside the scroll viewport, so an edit costs the same for ten or ten
+    thousand lines. Feed it the window events through handleEvent().
+    """
+
+    @property
+    def Text(self) -> str:
+        return "\n".join(self.__lines)
+
+    @property
+    def LineCount(self) -> int:
+        return len(self.__lines)
+
+    @property
+    def Cursor(self) -> Position:
+        """
+        (line, column) of the cursor
+        """
+        return self.__cursor
+
+    @property
+    def Selection(self) -> Optional[Tuple[Position, Position]]:
+        """
+        Ordered (start, end) of the selection, None without one
+        """
+        if self.__anchor is None or self.__anchor == self.__cursor:
+            return None
+        return min(self.__anchor, self.__cursor), max(self.__anchor, self.__cursor)
+
+    @property
+    def SelectedText(self) -> str:
+        selection = self.Selection
+        if selection is None:
+            return ""
+        (startLine, startColumn), (endLine, endColumn) = selection
+        if startLine == endLine:
+            return self.__lines[startLine][startColumn:endColumn]
+        return "\n".join(
+            [self.__lines[startLine][startColumn:]] + self.__lines[startLine + 1:endLine] + [self.__lines[endLine][:endColumn]]
+        )
+
+    @property
+    def FirstVisibleLine(self) -> int:
+        return self.__firstLine
+
+    @property
+    def Focused(self) -> bool:
+        return self.__focused
+
+    @Focused.setter
+    def Focused(self, value: bool):
+        if value != self.__focused:
+            self.__focused = value
+            self.__dirty = True
+
+    def __init__(
+        self,
+        surface: pygame.Surface,
+        rect: pygame.Rect,
+        text: str = "",
+        background: _common.ColorValue = (255, 255, 255),
+        foreground: _common.ColorValue = (0, 0, 0),
+        selection: _common.ColorValue = (0xB4, 0xD5, 0xFE),
+        font: Optional[pygame.font.Font] = None,
+        padx: int = 4,
+        pady: int = 2,
+        cacheSize: int = 512,
+    ):
+        self.__surface = surface
+        self.__rect = rect
+        self.__background = background
+        self.__foreground = foreground
+        self.__selectionColor = selection
+        self.__font = font if font else pygame.font.SysFont("", 16)
+        self.__padx = padx
+        self.__pady = pady
+        self.__lineHeight = self.__font.get_linesize()
+        self.__cacheSize = cacheSize
+        self.__lineCache: OrderedDict[str, pygame.Surface] = OrderedDict()
+        self.__drawSurf = pygame.Surface(rect.size)
+        self.__focused = False
+        self.__dragging = False
+        self.setText(text)
+
+    @property
+    def __visibleLines(self) -> int:
+        return max((self.__rect.height - 2 * self.__pady) // self.__lineHeight, 1)
+
+    def setText(self, text: str):
+        self.__lines = text.split("\n")
+        self.__cursor: Position = (0, 0)
+        self.__anchor: Optional[Position] = None
+        self.__firstLine = 0
+        self.__scrollX = 0
+        self.__dirty = True
+
+    def line(self, index: int) -> str:
+        return self.__lines[index]
+
+    def __renderLine(self, text: str) -> pygame.Surface:
+        surface = self.__lineCache.get(text)
+        if surface is not None:
+            self.__lineCache.move_to_end(text)
+            return surface
+        surface = self.__font.render(text, True, self.__foreground)
+        self.__lineCache[text] = surface
+        if len(self.__lineCache) > self.__cacheSize:
+            self.__lineCache.popitem(last=False)
+        return surface
+
+    def __clamp(self, position: Position) -> Position:
+        line = min(max(position[0], 0), len(self.__lines) - 1)
+        return line, min(max(position[1], 0), len(self.__lines[line]))
+
+    def setCursor(self, line: int, column: int, select: bool = False):
+        """
+        Moves the cursor, with select the selection is extended to it
+        """
+        if select and self.__anchor is None:
+            self.__anchor = self.__cursor
+        elif not select:
+            self.__anchor = None
+        self.__cursor = self.__clamp((line, column))
+        self.__dirty = True
+        self.__scrollToCursor()
+
+    def selectAll(self):
+        self.__anchor = (0, 0)
+        self.__cursor = (len(self.__lines) - 1, len(self.__lines[-1]))
+        self.__dirty = True
+        self.__scrollToCursor()
+
+    def scroll(self, lines: int):
+        """
+        Scrolls the view without moving the cursor
+        """
+        first = min(max(self.__firstLine + lines, 0), max(len(self.__lines) - self.__visibleLines, 0))
+        if first != self.__firstLine:
+            self.__firstLine = first
+            self.__dirty = True
+
+    def __scrollToCursor(self):
+        line, column = self.__cursor
+        if line < self.__firstLine:
+            self.__firstLine = line
+        elif line >= self.__firstLine + self.__visibleLines:
+            self.__firstLine = line - self.__visibleLines + 1
+        x = self.__font.size(self.__lines[line][:column])[0]
+        width = self.__rect.width - 2 * self.__padx
+        if x < self.__scrollX:
+            self.__scrollX = max(x - width // 4, 0)
+        elif x > self.__scrollX + width:
+            self.__scrollX = x - width + width // 4
+
+    def __deleteSelection(self) -> bool:
+        selection = self.Selection
+        self.__anchor = None
+        if selection is None:
+            return False
+        (startLine, startColumn), (endLine, endColumn) = selection
+        self.__lines[startLine:endLine + 1] = [self.__lines[startLine][:startColumn] + self.__lines[endLine][endColumn:]]
+        self.__cursor = (startLine, startColumn)
+        return True
+
+    def insert(self, text: str):
+        """
+        Inserts text at the cursor, replacing the selection
+        """
+        self.__deleteSelection()
+        line, column = self.__cursor
+        current = self.__lines[line]
+        parts = text.split("\n")
+        if len(parts) == 1:
+            self.__lines[line] = current[:column] + text + current[column:]
+            self.__cursor = (line, column + len(text))
+        else:
+            parts[0] = current[:column] + parts[0]
+            end = len(parts[-1])
+            parts[-1] += current[column:]
+            self.__lines[line:line + 1] = parts
+            self.__cursor = (line + len(parts) - 1, end)
+        self.__dirty = True
+        self.__scrollToCursor()
+
+    def deleteBackward(self):
+        if not self.__deleteSelection():
+            line, column = self.__cursor
+            if column > 0:
+                current = self.__lines[line]
+                self.__lines[line] = current[:column - 1] + current[column:]
+                self.__cursor = (line, column - 1)
+            elif line > 0:
+                previous = self.__lines[line - 1]
+                self.__lines[line - 1:line + 1] = [previous + self.__lines[line]]
+                self.__cursor = (line - 1, len(previous))
+        self.__dirty = True
+        self.__scrollToCursor()
+
+    def deleteForward(self):
+        if not self.__deleteSelection():
+            line, column = self.__cursor
+            current = self.__lines[line]
+            if column < len(current):
+                self.__lines[line] = current[:column] + current[column + 1:]
+            elif line < len(self.__lines) - 1:
+                self.__lines[line:line + 2] = [current + self.__lines[line + 1]]
+        self.__dirty = True
+        self.__scrollToCursor()
+
+    def __positionAt(self, point: _common.Coordinate) -> Position:
+        line = self.__firstLine + int((point[1] - self.__rect.top - self.__pady) // self.__lineHeight)
+        line = min(max(line, 0), len(self.__lines) - 1)
+        x = point[0] - self.__rect.left - self.__padx + self.__scrollX
+        text = self.__lines[line]
+        low, high = 0, len(text)
+        while low < high:
+            middle = (low + high) // 2
+            if self.__font.size(text[:middle + 1])[0] - self.__font.size(text[middle])[0] / 2 < x:
+                low = middle + 1
+            else:
+                high = middle
+        return line, low
+
+    def handleEvent(self, event: pygame.event.Event) -> bool:
+        """
+        Applies a key, text or mouse event, returns True when the editor used it
+        """
+        match event.type:
+            case pygame.MOUSEBUTTONDOWN if event.button == 1:
+                self.Focused = self.__rect.collidepoint(event.pos)
+                if self.__focused:
+                    self.__dragging = True
+                    self.setCursor(*self.__positionAt(event.pos), select=bool(pygame.key.get_mods() & pygame.KMOD_SHIFT))
+                return self.__focused
+            case pygame.MOUSEBUTTONUP if event.button == 1:
+                self.__dragging = False
+                return False
+            case pygame.MOUSEMOTION if self.__dragging:
+                self.setCursor(*self.__positionAt(event.pos), select=True)
+                return True
+            case pygame.MOUSEWHEEL if self.__rect.collidepoint(pygame.mouse.get_pos()):
+                self.scroll(-3 * event.y)
+                return True
+            case pygame.TEXTINPUT if self.__focused:
+                self.insert(event.text)
+                return True
+            case pygame.KEYDOWN if self.__focused:
+                return self.__handleKey(event.key, event.mod)
+        return False
+
+    def __handleKey(self, key: int, mod: int) -> bool:
+        line, column = self.__cursor
+        select = bool(mod & pygame.KMOD_SHIFT)
+        match key:
+            case pygame.K_LEFT:
+                if column == 0 and line > 0:
+                    self.setCursor(line - 1, len(self.__lines[line - 1]), select)
+                else:
+                    self.setCursor(line, column - 1, select)
+            case pygame.K_RIGHT:
+                if column == len(self.__lines[line]) and line < len(self.__lines) - 1:
+                    self.setCursor(line + 1, 0, select)
+                else:
+                    self.setCursor(line, column + 1, select)
+            case pygame.K_UP:
+                self.setCursor(line - 1, column, select)
+            case pygame.K_DOWN:
+                self.setCursor(line + 1, column, select)
+            case pygame.K_PAGEUP:
+                self.setCursor(line - self.__visibleLines, column, select)
+            case pygame.K_PAGEDOWN:
+                self.setCursor(line + self.__visibleLines, column, select)
+            case pygame.K_HOME:
+                self.setCursor(0 if mod & pygame.KMOD_CTRL else line, 0, select)
+            case pygame.K_END:
+                target = len(self.__lines) - 1 if mod & pygame.KMOD_CTRL else line
+                self.setCursor(target, len(self.__lines[target]), select)
+            case pygame.K_BACKSPACE:
+                self.deleteBackward()
+            case pygame.K_DELETE:
+                self.deleteForward()
+            case pygame.K_RETURN | pygame.K_KP_ENTER:
+                self.insert("\n")
+            case pygame.K_TAB:
+                self.insert("    ")
+            case pygame.K_a if mod & pygame.KMOD_CTRL:
+                self.selectAll()
+            case _:
+                return False
+        return True
+
+    def __compose(self):
+        surface = self.__drawSurf
+        surface.fill(self.__background)  # type: ignore
+        selection = self.Selection
+        top = self.__pady
+        left = self.__padx - self.__scrollX
+        last = min(self.__firstLine + self.__visibleLines + 1, len(self.__lines))
+        for index in range(self.__firstLine, last):
+            text = self.__lines[index]
+            if selection is not None and selection[0][0] <= index <= selection[1][0]:
+                start = selection[0][1] if index == selection[0][0] else 0
+                end = selection[1][1] if index == selection[1][0] else len(text)
+                startX = self.__font.size(text[:start])[0]
+                endX = self.__font.size(text[:end])[0] + (0 if index == selection[1][0] else self.__font.size(" ")[0])
+                surface.fill(self.__selectionColor, pygame.Rect(left + startX, top, endX - startX, self.__lineHeight))  # type: ignore
+            if text:
+                surface.blit(self.__renderLine(text), (left, top))
+            top += self.__lineHeight
+        if self.__focused:
+            line, column = self.__cursor
+            if self.__firstLine <= line < last:
+                x = left + self.__font.size(self.__lines[line][:column])[0]
+                y = self.__pady + (line - self.__firstLine) * self.__lineHeight
+                pygame.draw.line(surface, self.__foreground, (x, y), (x, y + self.__lineHeight - 1))  # type: ignore
+        self.__dirty = False
+
+    def show(self):
+        if self.__dirty:
+            self.__compose()
+        self.__surface.blit(self.__drawSurf, self.__rect)
+
+
+if __name__ == "__main__":
+    help(TextEditorAbstract)
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+import pygame
+
+import GraphicEngine._common as _common
+
+
+class TileMap:
+    """
+    Grid of tile ids (Tiles[row, column], negative ids are empty) drawn from
+    pre-rendered chunks of chunkSize x chunkSize tiles.
+
+    Chunks are display format surfaces rendered on first sight and kept in a
+    bounded LRU cache, changing a tile only re-renders its chunk. Evicted
+    chunk surfaces are reused for the next chunk that is rendered.
+    """
+
+    @property
+    def Tiles(self) -> np.ndarray:
+        """
+        Read-only view of the ids, change them with setTile or setRegion
+        """
+        view = self.__ids.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def TileSize(self) -> Tuple[int, int]:
+        return self.__tileSize
+
+    @property
+    def CachedChunks(self) -> int:
+        return len(self.__chunks)
+
+    @property
+    def Rendered(self) -> int:
+        """
+        Chunks rendered by the last draw()
+        """
+        return self.__rendered
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        tiles: Sequence[pygame.Surface],
+        chunkSize: int = 16,
+        maxChunks: int = 256,
+        background: Optional[_common.ColorValue] = (0, 0, 0),
+    ):
+        """
+        tiles[id] is the image of id, all of the same size. Without background
+        chunks keep per pixel alpha, so empty tiles show what is under the map.
+        """
+        self.__ids = np.array(ids, dtype=np.int32)
+        self.__tiles = list(tiles)
+        self.__tileSize: Tuple[int, int] = self.__tiles[0].get_size()
+        self.__chunkSize = chunkSize
+        self.__maxChunks = maxChunks
+        self.__background = background
+        self.__chunks: OrderedDict[Tuple[int, int], pygame.Surface] = OrderedDict()
+        self.__dirty: set[Tuple[int, int]] = set()
+        self.__scale = 1.0
+        self.__scaledTiles = self.__tiles
+        self.__scaledTileSize = self.__tileSize
+        self.__rendered = 0
+
+    def setTile(self, column: int, row: int, tileId: int):
+        if self.__ids[row, column] != tileId:
+            self.__ids[row, column] = tileId
+            self.__dirty.add((column // self.__chunkSize, row // self.__chunkSize))
+
+    def setRegion(self, column: int, row: int, ids: np.ndarray):
+        """
+        Writes a (rows, columns) block of ids with its top left tile at column, row
+        """
+        block = np.asarray(ids, dtype=np.int32)
+        rows, columns = block.shape
+        target = self.__ids[row:row + rows, column:column + columns]
+        changed = np.argwhere(target != block[:target.shape[0], :target.shape[1]])
+        if not len(changed):
+            return
+        target[...] = block[:target.shape[0], :target.shape[1]]
+        for chunkRow, chunkColumn in set(map(tuple, (changed + (row, column)) // self.__chunkSize)):
+            self.__dirty.add((int(chunkColumn), int(chunkRow)))
+
+    def setTileImage(self, tileId: int, image: pygame.Surface):
+        """
+        Replaces the image of tileId, every cached chunk is rendered again
+        """
+        self.__tiles[tileId] = image
+        self.__setScale(self.__scale, True)
+
+    def clearCache(self):
+        self.__chunks.clear()
+        self.__dirty.clear()
+
+    def __setScale(self, scale: float, force: bool = False):
+        if scale == self.__scale and not force:
+            return
+        self.__scale = scale
+        width, height = self.__tileSize
+        self.__scaledTileSize = (max(round(width * scale), 1), max(round(height * scale), 1))
+        if self.__scaledTileSize == self.__tileSize:
+            self.__scaledTiles = self.__tiles
+        else:
+            self.__scaledTiles = [pygame.transform.scale(tile, self.__scaledTileSize) for tile in self.__tiles]
+        self.clearCache()
+
+    def __newChunkSurface(self, size: Tuple[int, int], limit: int) -> pygame.Surface:
+        if len(self.__chunks) >= limit:
+            _, surface = self.__chunks.popitem(last=False)
+            if surface.get_size() == size:
+                return surface
+        surface = pygame.Surface(size, 0 if self.__background is not None else pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert() if self.__background is not None else surface.convert_alpha()
+        return surface
+
+    def __renderChunk(self, key: Tuple[int, int], surface: Optional[pygame.Surface], limit: int) -> pygame.Surface:
+        column, row = key[0] * self.__chunkSize, key[1] * self.__chunkSize
+        ids = self.__ids[row:row + self.__chunkSize, column:column + self.__chunkSize]
+        width, height = self.__scaledTileSize
+        size = (self.__chunkSize * width, self.__chunkSize * height)
+        if surface is None or surface.get_size() != size:
+            surface = self.__newChunkSurface(size, limit)
+        surface.fill(self.__background if self.__background is not None else (0, 0, 0, 0))  # type: ignore
+        rows, columns = np.nonzero(ids >= 0)
+        tiles = self.__scaledTiles
+        surface.blits([
+            (tiles[tileId], (x * width, y * height))
+            for tileId, x, y in zip(ids[rows, columns].tolist(), columns.tolist(), rows.tolist())
+        ], False)
+        self.__rendered += 1
+        return surface
+
+    def draw(self, surface: pygame.Surface, offset: Tuple[float, float] = (0, 0), scale: float = 1.0):
+        """
+        Draws the chunks visible on surface, with the map's origin at offset
+        (in the unscaled units) and tiles enlarged by scale
+        """
+        self.__setScale(scale)
+        self.__rendered = 0
+        width, height = self.__scaledTileSize
+        chunkWidth, chunkHeight = self.__chunkSize * width, self.__chunkSize * height
+        originX, originY = round(offset[0] * scale), round(offset[1] * scale)
+        rows, columns = self.__ids.shape
+        chunkColumns = -(-columns // self.__chunkSize)
+        chunkRows = -(-rows // self.__chunkSize)
+        first = (max(-originX // chunkWidth, 0), max(-originY // chunkHeight, 0))
+        last = (
+            min((surface.get_width() - originX - 1) // chunkWidth, chunkColumns - 1),
+            min((surface.get_height() - originY - 1) // chunkHeight, chunkRows - 1),
+        )
+        # chunks drawn this frame must not be recycled, even with a small cache
+        limit = max(self.__maxChunks, (last[0] - first[0] + 1) * (last[1] - first[1] + 1))
+        blits: list[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        for chunkRow in range(first[1], last[1] + 1):
+            for chunkColumn in range(first[0], last[0] + 1):
+                key = (chunkColumn, chunkRow)
+                chunk = self.__chunks.get(key)
+                if chunk is None or key in self.__dirty:
+                    chunk = self.__renderChunk(key, chunk, limit)
+                    self.__dirty.discard(key)
+                    self.__chunks[key] = chunk
+                self.__chunks.move_to_end(key)
+                blits.append((chunk, (originX + chunkColumn * chunkWidth, originY + chunkRow * chunkHeight)))
+        surface.blits(blits, False)
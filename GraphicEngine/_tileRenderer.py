@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, Sequence, Tuple
+
+import pygame
+
+import GraphicEngine._common as _common
+
+DrawFunction = Callable[..., Any]
+Command = Tuple[pygame.Rect, int, DrawFunction, Tuple[Any, ...]]
+
+# How a command may be distributed over the tiles: drawn once on the whole
+# target, drawn inside a single tile only, or split over every touched tile
+_WHOLE = 0
+_SINGLE_TILE = 1
+_SPLIT = 2
+
+
+def _isIntegral(*values: float) -> bool:
+    return all(float(value).is_integer() for value in values)
+
+
+def _pointsBounds(points: Sequence[_common.Coordinate], margin: int) -> pygame.Rect:
+    xs = [point[0] for point in points]
+    ys = [point[1] for point in points]
+    left = int(min(xs)) - margin - 1
+    top = int(min(ys)) - margin - 1
+    return pygame.Rect(left, top, int(max(xs)) - left + margin + 2, int(max(ys)) - top + margin + 2)
+
+
+def _movePoints(points: Sequence[_common.Coordinate], dx: int, dy: int):
+    return [(point[0] - dx, point[1] - dy) for point in points]
+
+
+def _fill(surface: pygame.Surface, dx: int, dy: int, color: _common.ColorValue, rect: pygame.Rect):
+    surface.fill(color, rect.move(-dx, -dy).clip(surface.get_rect()))  # type: ignore
+
+
+def _blit(surface: pygame.Surface, dx: int, dy: int, source: pygame.Surface, x: int, y: int,
+          area: Optional[pygame.Rect], specialFlags: int):
+    surface.blit(source, (x - dx, y - dy), area, specialFlags)
+
+
+def _rect(surface: pygame.Surface, dx: int, dy: int, color: _common.ColorValue, rect: pygame.Rect,
+          width: int, borderRadius: int):
+    pygame.draw.rect(surface, color, rect.move(-dx, -dy), width, borderRadius)  # type: ignore
+
+
+def _ellipse(surface: pygame.Surface, dx: int, dy: int, color: _common.ColorValue, rect: pygame.Rect, width: int):
+    pygame.draw.ellipse(surface, color, rect.move(-dx, -dy), width)  # type: ignore
+
+
+def _circle(surface: pygame.Surface, dx: int, dy: int, color: _common.ColorValue, x: float, y: float,
+            radius: float, width: int):
+    pygame.draw.circle(surface, color, (x - dx, y - dy), radius, width)  # type: ignore
+
+
+def _line(surface: pygame.Surface, dx: int, dy: int, color: _common.ColorValue,
+          start: _common.Coordinate, end: _common.Coordinate, width: int):
+    pygame.draw.line(surface, color, (start[0] - dx, start[1] - dy), (end[0] - dx, end[1] - dy), width)  # type: ignore
+
+
+def _aaline(surface: pygame.Surface, dx: int, dy: int, color: _common.ColorValue,
+            start: _common.Coordinate, end: _common.Coordinate):
+    pygame.draw.aaline(surface, color, (start[0] - dx, start[1] - dy), (end[0] - dx, end[1] - dy))  # type: ignore
+
+
+def _lines(surface: pygame.Surface, dx: int, dy: int, color: _common.ColorValue, closed: bool,
+           points: Sequence[_common.Coordinate], width: int):
+    pygame.draw.lines(surface, color, closed, _movePoints(points, dx, dy), width)  # type: ignore
+
+
+def _aalines(surface: pygame.Surface, dx: int, dy: int, color: _common.ColorValue, closed: bool,
+             points: Sequence[_common.Coordinate]):
+    pygame.draw.aalines(surface, color, closed, _movePoints(points, dx, dy))  # type: ignore
+
+
+def _polygon(surface: pygame.Surface, dx: int, dy: int, color: _common.ColorValue,
+             points: Sequence[_common.Coordinate], width: int):
+    pygame.draw.polygon(surface, color, _movePoints(points, dx, dy), width)  # type: ignore
+
+
+class TileRenderer:
+    """
+    Batches draw commands and rasterizes them tile by tile on a thread pool.
+
+    Every command is binned by its bounding box to the tiles it touches and
+    the tiles (subsurfaces of the target) are drawn concurrently, each one
+    replaying its commands in submission order. Primitives whose rasterization
+    depends on the clip rect (lines, polygons, outlined or rounded rects) are
+    only given to a tile when they fit inside it, and antialiased lines (whose
+    edge shading changes with the clip rect) are never given to a tile. Those
+    are drawn on the whole target between two parallel passes, so
+    the output is identical to drawing the batch with ``workers=1``.
+    """
+
+    @property
+    def Surface(self) -> pygame.Surface:
+        return self.__surface
+
+    @property
+    def Workers(self) -> int:
+        return self.__workers
+
+    @property
+    def TileCount(self) -> int:
+        return len(self.__tiles)
+
+    @property
+    def PendingCommands(self) -> int:
+        return len(self.__commands)
+
+    def __init__(
+        self,
+        surface: pygame.Surface,
+        tileSize: Tuple[int, int] = (128, 128),
+        workers: Optional[int] = None,
+    ):
+        self.__surface = surface
+        self.__tileWidth, self.__tileHeight = tileSize
+        self.__workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.__columns = -(-surface.get_width() // self.__tileWidth)
+        self.__rows = -(-surface.get_height() // self.__tileHeight)
+        self.__tiles: list[Tuple[int, int, pygame.Surface]] = []
+        bounds = surface.get_rect()
+        for row in range(self.__rows):
+            for column in range(self.__columns):
+                tileRect = pygame.Rect(
+                    column * self.__tileWidth, row * self.__tileHeight, self.__tileWidth, self.__tileHeight
+                ).clip(bounds)
+                self.__tiles.append((tileRect.x, tileRect.y, surface.subsurface(tileRect)))
+        self.__commands: list[Command] = []
+        self.__executor = ThreadPoolExecutor(self.__workers) if self.__workers > 1 else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args: Any):
+        self.flush()
+        self.close()
+
+    def close(self):
+        if self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
+
+    def __add(self, bounds: pygame.Rect, mode: int, function: DrawFunction, *args: Any):
+        self.__commands.append((bounds, mode, function, args))
+
+    def fill(self, color: _common.ColorValue, rect: Optional[pygame.Rect] = None):
+        fillRect = self.__surface.get_rect() if rect is None else pygame.Rect(rect)
+        self.__add(fillRect, _SPLIT, _fill, color, fillRect)
+
+    def blit(
+        self,
+        source: pygame.Surface,
+        dest: _common.Coordinate,
+        area: Optional[pygame.Rect] = None,
+        specialFlags: int = 0,
+    ):
+        x, y = int(dest[0]), int(dest[1])
+        size = source.get_size() if area is None else pygame.Rect(area).size
+        self.__add(pygame.Rect((x, y), size), _SPLIT, _blit, source, x, y, area, specialFlags)
+
+    def rect(self, color: _common.ColorValue, rect: pygame.Rect, width: int = 0, borderRadius: int = -1):
+        drawRect = pygame.Rect(rect)
+        if width == 0 and borderRadius <= 0:
+            mode = _SPLIT
+        elif 2 * borderRadius <= min(drawRect.size):
+            mode = _SINGLE_TILE
+        else:
+            # pygame draws oversized corner radii outside of the rect
+            mode = _WHOLE
+        self.__add(drawRect.inflate(2, 2), mode, _rect, color, drawRect, width, borderRadius)
+
+    def ellipse(self, color: _common.ColorValue, rect: pygame.Rect, width: int = 0):
+        drawRect = pygame.Rect(rect)
+        self.__add(drawRect.inflate(2, 2), _SPLIT, _ellipse, color, drawRect, width)
+
+    def circle(self, color: _common.ColorValue, center: _common.Coordinate, radius: float, width: int = 0):
+        x, y = center[0], center[1]
+        extent = int(radius) + 2
+        mode = _SPLIT if _isIntegral(x, y, radius) else _SINGLE_TILE
+        self.__add(pygame.Rect(int(x) - extent, int(y) - extent, 2 * extent + 1, 2 * extent + 1),
+                   mode, _circle, color, x, y, radius, width)
+
+    def line(self, color: _common.ColorValue, start: _common.Coordinate, end: _common.Coordinate, width: int = 1):
+        self.__add(_pointsBounds((start, end), width), _SINGLE_TILE, _line, color, start, end, width)
+
+    def aaline(self, color: _common.ColorValue, start: _common.Coordinate, end: _common.Coordinate):
+        self.__add(_pointsBounds((start, end), 1), _WHOLE, _aaline, color, start, end)
+
+    def lines(self, color: _common.ColorValue, closed: bool, points: Sequence[_common.Coordinate], width: int = 1):
+        self.__add(_pointsBounds(points, width), _SINGLE_TILE, _lines, color, closed, list(points), width)
+
+    def aalines(self, color: _common.ColorValue, closed: bool, points: Sequence[_common.Coordinate]):
+        self.__add(_pointsBounds(points, 1), _WHOLE, _aalines, color, closed, list(points))
+
+    def polygon(self, color: _common.ColorValue, points: Sequence[_common.Coordinate], width: int = 0):
+        self.__add(_pointsBounds(points, width), _SINGLE_TILE, _polygon, color, list(points), width)
+
+    def __drawTile(self, tile: Tuple[int, int, pygame.Surface], commands: list[Command]):
+        x, y, surface = tile
+        for _, _, function, args in commands:
+            function(surface, x, y, *args)
+
+    def __drawPass(self, bins: dict[int, list[Command]]):
+        if not bins:
+            return
+        if self.__executor is None or len(bins) == 1:
+            for index, commands in bins.items():
+                self.__drawTile(self.__tiles[index], commands)
+            return
+        futures = [
+            self.__executor.submit(self.__drawTile, self.__tiles[index], commands)
+            for index, commands in bins.items()
+        ]
+        for future in futures:
+            future.result()
+
+    def flush(self):
+        """
+        Rasterizes and clears the pending batch.
+        """
+        commands, self.__commands = self.__commands, []
+        if self.__executor is None:
+            for _, _, function, args in commands:
+                function(self.__surface, 0, 0, *args)
+            return
+        bounds = self.__surface.get_rect()
+        bins: dict[int, list[Command]] = {}
+        for commandBounds, mode, function, args in commands:
+            # whole target commands may draw outside of their bounds, so they are never skipped
+            clipped = commandBounds.clip(bounds)
+            if mode != _WHOLE and (not clipped.width or not clipped.height):
+                continue
+            firstColumn = clipped.left // self.__tileWidth
+            lastColumn = (clipped.right - 1) // self.__tileWidth
+            firstRow = clipped.top // self.__tileHeight
+            lastRow = (clipped.bottom - 1) // self.__tileHeight
+            spansTiles = firstColumn != lastColumn or firstRow != lastRow
+            if mode == _WHOLE or (spansTiles and mode == _SINGLE_TILE):
+                self.__drawPass(bins)
+                bins = {}
+                function(self.__surface, 0, 0, *args)
+                continue
+            command = (commandBounds, mode, function, args)
+            for row in range(firstRow, lastRow + 1):
+                for column in range(firstColumn, lastColumn + 1):
+                    bins.setdefault(row * self.__columns + column, []).append(command)
+        self.__drawPass(bins)
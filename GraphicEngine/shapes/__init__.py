@@ -1,4 +1,3 @@
-from GraphicEngine.shapes._cube import Cube
 from GraphicEngine.shapes._rect import Rect
 from GraphicEngine.shapes._line import Line
 from GraphicEngine.shapes._ellipse import Ellipse
@@ -6,9 +5,19 @@ from GraphicEngine.shapes._circle import Circle
 from GraphicEngine.shapes._arc import Arc
 from GraphicEngine.shapes._pixel import Pixel
 from GraphicEngine.shapes._text import Text
+from GraphicEngine.shapes._direct import ScratchPool, directDraw, scratchPool, setDirectDraw
+
+
+def __getattr__(name: str):
+    # Cube needs PyOpenGL, which is only imported once Cube is used
+    if name == "Cube":
+        from GraphicEngine.shapes._cube import Cube
+        return Cube
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 if __name__ == "__main__":
-    help(Cube)
+    help(__getattr__("Cube"))
     help(Rect)
     help(Line)
     help(Ellipse)
@@ -16,3 +25,5 @@ if __name__ == "__main__":
     help(Arc)
     help(Pixel)
     help(Text)
+    help(setDirectDraw)
+    help(ScratchPool)
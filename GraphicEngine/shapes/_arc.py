@@ -1,5 +1,6 @@
 from __future__ import annotations
 import GraphicEngine._common as _common
+from GraphicEngine.shapes._direct import render
 import pygame
 
 
@@ -11,6 +12,9 @@ def Arc(
     stopAngle: float,
     width: int = 1,
 ):
-    surface = pygame.Surface(rect.size, pygame.SRCALPHA)
-    pygame.draw.arc(surface, color, surface.get_rect(), startAngle, stopAngle, width)
-    display.blit(surface, rect)
+    rect = pygame.Rect(rect)
+
+    def draw(surface: pygame.Surface, color: _common.ColorValue, origin: tuple[int, int]):
+        pygame.draw.arc(surface, color, rect.move(-origin[0], -origin[1]), startAngle, stopAngle, width)
+    # pygame can set pixels one past the rect's right and bottom edges
+    render(display, rect.inflate(2, 2), color, draw)
@@ -1,5 +1,7 @@
 from __future__ import annotations
+from math import ceil, floor
 import GraphicEngine._common as _common
+from GraphicEngine.shapes._direct import render
 import pygame
 
 
@@ -19,6 +21,9 @@ def Circle(
             v1 = pygame.Vector2(0, 0)
         return v1
     vect = getVector2d(center)
-    surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-    pygame.draw.circle(surface, color, (radius, radius), radius, width)
-    display.blit(surface, (vect.x - radius, vect.y - radius))
+    left, top = floor(vect.x - radius), floor(vect.y - radius)
+    bounds = pygame.Rect(left, top, ceil(vect.x + radius) - left + 1, ceil(vect.y + radius) - top + 1)
+
+    def draw(surface: pygame.Surface, color: _common.ColorValue, origin: tuple[int, int]):
+        pygame.draw.circle(surface, color, (vect.x - origin[0], vect.y - origin[1]), radius, width)
+    render(display, bounds, color, draw)
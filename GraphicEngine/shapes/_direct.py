@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, Tuple
+
+import pygame
+
+import GraphicEngine._common as _common
+
+# draw(surface, color, origin), origin is the position of surface on the display
+DrawCall = Callable[[pygame.Surface, _common.ColorValue, Tuple[int, int]], None]
+
+
+class ScratchPool:
+    """
+    Reusable SRCALPHA surfaces for shapes that need alpha blending.
+
+    Sizes are rounded up to power of two buckets and get() hands out a
+    cleared subsurface of the bucket's surface, so a shape allocates nothing
+    once its bucket exists. The least recently used buckets are dropped
+    beyond maxSurfaces.
+    """
+
+    @property
+    def Allocated(self) -> int:
+        return len(self.__surfaces)
+
+    def __init__(self, maxSurfaces: int = 8):
+        self.__maxSurfaces = maxSurfaces
+        self.__surfaces: OrderedDict[Tuple[int, int], pygame.Surface] = OrderedDict()
+
+    def get(self, size: Tuple[int, int]) -> pygame.Surface:
+        width, height = max(int(size[0]), 1), max(int(size[1]), 1)
+        bucket = (1 << (width - 1).bit_length(), 1 << (height - 1).bit_length())
+        surface = self.__surfaces.get(bucket)
+        if surface is None:
+            surface = pygame.Surface(bucket, pygame.SRCALPHA)
+            self.__surfaces[bucket] = surface
+            if len(self.__surfaces) > self.__maxSurfaces:
+                self.__surfaces.popitem(last=False)
+        else:
+            self.__surfaces.move_to_end(bucket)
+        scratch = surface.subsurface((0, 0, width, height))
+        scratch.fill((0, 0, 0, 0))
+        return scratch
+
+    def clear(self):
+        self.__surfaces.clear()
+
+
+class _State(threading.local):
+    def __init__(self):
+        self.direct = False
+        self.clip: Optional[pygame.Rect] = None
+        self.pool = ScratchPool()
+
+
+_state = _State()
+
+
+def setDirectDraw(enabled: bool = True, clip: Optional[_common.RectValue] = None):
+    """
+    With enabled the shape functions draw straight onto the target surface,
+    limited to clip (and the surface's own clip). Only translucent colors go
+    through a pooled scratch surface. The mode is set per thread.
+    """
+    _state.direct = enabled
+    _state.clip = pygame.Rect(clip) if clip is not None else None  # type: ignore
+
+
+@contextmanager
+def directDraw(clip: Optional[_common.RectValue] = None) -> Iterator[ScratchPool]:
+    """
+    Enables the direct draw mode inside the with block, yields the thread's scratch pool
+    """
+    previous = (_state.direct, _state.clip)
+    setDirectDraw(True, clip)
+    try:
+        yield _state.pool
+    finally:
+        _state.direct, _state.clip = previous
+
+
+def scratchPool() -> ScratchPool:
+    return _state.pool
+
+
+def render(display: pygame.Surface, bounds: pygame.Rect, color: _common.ColorValue, draw: DrawCall):
+    """
+    Runs draw for a shape covering bounds, on a temporary surface blitted to
+    display or, in the direct draw mode, on display itself. Either way the
+    shape is drawn over the part of bounds inside display's clip, so pygame
+    clips it at the same edges as when drawing on display.
+    """
+    previous = display.get_clip()
+    clip = previous if not _state.direct or _state.clip is None else previous.clip(_state.clip)
+    area = bounds.clip(clip)
+    if not area.width or not area.height:
+        return
+    # pygame truncates float coordinates towards zero, so a temporary surface must not
+    # start past 0 on a side where the shape reaches negative coordinates
+    origin = (max(bounds.left, 0), max(bounds.top, 0))
+    local = area.move(-origin[0], -origin[1])
+    if not _state.direct:
+        _drawBlended(display, pygame.Surface(local.bottomright, pygame.SRCALPHA), origin, local, color, draw)
+        return
+    rgba = _common.toRGBA(color)
+    if rgba[3] < 255:
+        _drawBlended(display, _state.pool.get(local.bottomright), origin, local, rgba, draw)
+        return
+    display.set_clip(area)
+    try:
+        draw(display, rgba, (0, 0))
+    finally:
+        display.set_clip(previous)
+
+
+def _drawBlended(
+    display: pygame.Surface,
+    surface: pygame.Surface,
+    origin: Tuple[int, int],
+    local: pygame.Rect,
+    color: _common.ColorValue,
+    draw: DrawCall,
+):
+    # clipped like display would be, so pygame rasterizes the same pixels
+    surface.set_clip(local)
+    draw(surface, color, origin)
+    surface.set_clip(None)
+    display.blit(surface, local.move(origin), local)
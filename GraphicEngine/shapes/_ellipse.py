@@ -1,13 +1,14 @@
 from __future__ import annotations
 import GraphicEngine._common as _common
+from GraphicEngine.shapes._direct import render
 import pygame
 
 
 def Ellipse(
     display: pygame.Surface, rect: pygame.Rect, color: _common.ColorValue, width: int = 0
 ):
-    surface = pygame.Surface(rect.size, pygame.SRCALPHA)
-    pygame.draw.ellipse(
-        surface, color, pygame.Rect(0, 0, rect.size[0], rect.size[1]), width
-    )
-    display.blit(surface, rect)
+    rect = pygame.Rect(rect)
+
+    def draw(surface: pygame.Surface, color: _common.ColorValue, origin: tuple[int, int]):
+        pygame.draw.ellipse(surface, color, rect.move(-origin[0], -origin[1]), width)
+    render(display, rect, color, draw)
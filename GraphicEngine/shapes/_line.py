@@ -1,7 +1,8 @@
 from __future__ import annotations
 import pygame
 import GraphicEngine._common as _common
-from math import ceil
+from math import ceil, floor
+from GraphicEngine.shapes._direct import render
 
 
 def Line(
@@ -29,12 +30,13 @@ def Line(
         return v1, v2
 
     start, end = getVector2d(startPos, endPos)
-    rectWidth = ceil(abs(start.x - end.x))
-    rectHeight = ceil(abs(start.y - end.y))
-    if rectWidth == 0:
-        rectWidth = 1
-    if rectHeight == 0:
-        rectHeight = 1
-    surface = pygame.Surface((rectWidth, rectHeight), pygame.SRCALPHA)
-    pygame.draw.line(surface, color, (0, 0), (surface.get_rect().size), width)
-    display.blit(surface, start)
+    # thick lines spread up to width / 2 around the segment, one pixel margin for rounding
+    margin = width // 2 + 1
+    left, top = floor(min(start.x, end.x)) - margin, floor(min(start.y, end.y)) - margin
+    bounds = pygame.Rect(
+        left, top, ceil(max(start.x, end.x)) + margin - left + 1, ceil(max(start.y, end.y)) + margin - top + 1
+    )
+
+    def draw(surface: pygame.Surface, color: _common.ColorValue, origin: tuple[int, int]):
+        pygame.draw.line(surface, color, start - origin, end - origin, width)
+    render(display, bounds, color, draw)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 import GraphicEngine._common as _common
+from GraphicEngine.shapes._direct import render
 import pygame
 
 
@@ -14,16 +15,18 @@ def Rect(
     borderBottomLeftRadius: int = -1,
     borderBottmRightRadius: int = -1,
 ):
-    surface = pygame.Surface(rect.size, pygame.SRCALPHA)
-    pygame.draw.rect(
-        surface,
-        color,
-        pygame.Rect(0, 0, rect.width, rect.height),
-        width,
-        borderRadius,
-        borderTopLeftRadius,
-        borderTopRightRadius,
-        borderBottomLeftRadius,
-        borderBottmRightRadius,
-    )
-    display.blit(surface, rect)
+    rect = pygame.Rect(rect)
+
+    def draw(surface: pygame.Surface, color: _common.ColorValue, origin: tuple[int, int]):
+        pygame.draw.rect(
+            surface,
+            color,
+            rect.move(-origin[0], -origin[1]),
+            width,
+            borderRadius,
+            borderTopLeftRadius,
+            borderTopRightRadius,
+            borderBottomLeftRadius,
+            borderBottmRightRadius,
+        )
+    render(display, rect, color, draw)
@@ -0,0 +1,122 @@
+"""
+RunAsync() against a local stand-in server: a socket reader, a CPU bound task
+stepping through cooperate() and an async Draw() share the event loop.
+
+    python benchmarks/asyncLoop.py [frames]
+
+Exits with status 1 when the reader is starved (samples wait longer than
+MAX_DELAY_MS to be read), gets nothing while Draw() is suspended, or when the
+frame rate drops below MIN_FPS_SHARE of the target.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from GraphicEngine import PygameGFX  # noqa: E402
+
+FPS = 60
+SAMPLE_INTERVAL = 0.002
+BUSY_STEP = 0.001
+# a third of the frame period, a task hogging the loop until the frame deadline shows up as ~16 ms
+MAX_DELAY_MS = 1000 / FPS / 3
+MIN_FPS_SHARE = 0.9
+
+
+async def sendSamples(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    # every sample carries the time it was sent
+    try:
+        while True:
+            writer.write(f"{time.perf_counter()}\n".encode())
+            await writer.drain()
+            await asyncio.sleep(SAMPLE_INTERVAL)
+    except (ConnectionError, asyncio.CancelledError):
+        pass
+    finally:
+        writer.close()
+
+
+class Sketch(PygameGFX):
+    def __init__(self, frames: int):
+        self.frames = frames
+        self.delays: list[float] = []
+        self.readDuringDraw = 0
+        self.busySteps = 0
+        self.drawing = False
+        super().__init__(320, 240, fps=FPS)
+
+    async def Setup(self):
+        self.server = await asyncio.start_server(sendSamples, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        self.createTask(self.read(port))
+        self.createTask(self.busy())
+
+    async def read(self, port: int):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            while line := await reader.readline():
+                self.delays.append((time.perf_counter() - float(line)) * 1000)
+                self.readDuringDraw += self.drawing
+        finally:
+            writer.close()
+
+    async def busy(self):
+        while True:
+            start = time.perf_counter()
+            while time.perf_counter() - start < BUSY_STEP:
+                pass
+            self.busySteps += 1
+            await self.cooperate()
+
+    async def Draw(self):
+        self.drawing = True
+        # stands in for a frame waiting on data, the other tasks run meanwhile
+        await asyncio.sleep(0.004)
+        self.drawing = False
+        self.background((16, 16, 16))
+        self.fill((200, 120, 40))
+        self.circle((160, 120), 40)
+        if self.frameCount + 1 >= self.frames:
+            self.server.close()
+            self.Stop()
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 240
+    sketch = Sketch(frames)
+    start = time.perf_counter()
+    asyncio.run(sketch.RunAsync())
+    fps = frames / (time.perf_counter() - start)
+    # the first samples wait for the connection to be set up
+    delays = sorted(sketch.delays[10:])
+    p95 = delays[int(len(delays) * 0.95)] if delays else float("inf")
+    print(f"frames               {frames:>8} at {fps:.1f} fps (target {FPS})")
+    print(f"samples read         {len(sketch.delays):>8}, {sketch.readDuringDraw} while Draw() was suspended")
+    print(f"read delay           {statistics.median(delays) if delays else float('inf'):>8.2f} ms median, "
+          f"{p95:.2f} ms p95 (max {MAX_DELAY_MS:.1f} ms)")
+    print(f"busy task steps      {sketch.busySteps:>8}")
+    failed = False
+    if p95 > MAX_DELAY_MS:
+        print("the socket reader was starved")
+        failed = True
+    if not sketch.readDuringDraw:
+        print("nothing was read while Draw() was suspended")
+        failed = True
+    if fps < FPS * MIN_FPS_SHARE:
+        print("rendering was held back")
+        failed = True
+    if not sketch.busySteps:
+        print("the busy task never ran")
+        failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Package import time and first frame latency, each measured in a fresh interpreter.
+
+    python benchmarks/startup.py [runs]
+
+Exits with status 1 when the package's own import time, relative to importing
+pygame and numpy in the same run, is over IMPORT_BUDGET or when importing
+the package pulls in OpenGL, so it can guard against heavy imports creeping
+back into the package.
+"""
+from __future__ import annotations
+
+import os
+import statistics
+import subprocess
+import sys
+
+# share of the pygame and numpy import time the package may add on top, measured at
+# 0.15-0.25 with and without full CPU load, importing OpenGL raises it to ~0.8
+IMPORT_BUDGET = 0.5
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_IMPORT = """
+import time
+start = time.perf_counter()
+import GraphicEngine
+elapsed = time.perf_counter() - start
+import sys
+print(elapsed * 1000, "OpenGL" in sys.modules)
+"""
+
+# the dependencies every import of the package needs
+_BASELINE = """
+import time
+start = time.perf_counter()
+import numpy
+import pygame
+print((time.perf_counter() - start) * 1000)
+"""
+
+_FIRST_FRAME = """
+import time
+start = time.perf_counter()
+import pygame
+from GraphicEngine import PygameGFX
+
+class Sketch(PygameGFX):
+    def Setup(self):
+        pass
+
+    def Draw(self):
+        self.background((16, 16, 16))
+        self.fill((200, 120, 40))
+        self.circle((160, 120), 40)
+
+sketch = Sketch(320, 240, fps=60)
+sketch._initialize()
+sketch._renderFrame(0, 0.0)
+pygame.display.flip()
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def run(code: str) -> list[str]:
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, (_ROOT, env.get("PYTHONPATH"))))
+    output = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    return output.stdout.split("\n")[-2].split()
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 9
+    imports: list[list[str]] = []
+    overheads: list[float] = []
+    for _ in range(runs):
+        # interleaved, so both sides see the same machine load
+        baseline = float(run(_BASELINE)[0])
+        imports.append(run(_IMPORT))
+        overheads.append(float(imports[-1][0]) / baseline - 1)
+    importTime = statistics.median(float(result[0]) for result in imports)
+    overhead = statistics.median(overheads)
+    openGLLoaded = any(result[1] == "True" for result in imports)
+    firstFrame = statistics.median(float(run(_FIRST_FRAME)[0]) for _ in range(runs))
+    print(f"import GraphicEngine {importTime:>8.1f} ms")
+    print(f"  over pygame, numpy {overhead:>8.0%}    (budget {IMPORT_BUDGET:.0%})")
+    print(f"first frame          {firstFrame:>8.1f} ms")
+    print(f"OpenGL imported      {openGLLoaded}")
+    failed = False
+    if overhead > IMPORT_BUDGET:
+        print("import time over budget")
+        failed = True
+    if openGLLoaded:
+        print("OpenGL must only be imported when a sketch uses it")
+        failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Scaling curve of TileRenderer across worker counts.
+
+    python benchmarks/tileRenderer.py [width] [height] [commands]
+"""
+from __future__ import annotations
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame  # noqa: E402
+
+from GraphicEngine import TileRenderer  # noqa: E402
+
+
+def drawBatch(renderer: TileRenderer, width: int, height: int, commands: int, sprite: pygame.Surface):
+    rng = random.Random(0)
+    renderer.fill((16, 16, 16, 255))
+    for _ in range(commands):
+        x, y = rng.randrange(width), rng.randrange(height)
+        color = (rng.randrange(256), rng.randrange(256), rng.randrange(256), rng.randrange(64, 256))
+        # next to a tile edge, where clipping differences show
+        edgeX, edgeY = x - x % 128 + rng.randrange(-3, 4), y - y % 128 + rng.randrange(-3, 4)
+        match rng.randrange(7):
+            case 0:
+                renderer.fill(color, pygame.Rect(x, y, rng.randrange(8, 256), rng.randrange(8, 256)))
+            case 1:
+                renderer.blit(sprite, (x, y))
+            case 2:
+                renderer.circle(color, (x, y), rng.randrange(4, 64))
+            case 3:
+                renderer.rect(color, pygame.Rect(x, y, rng.randrange(8, 128), rng.randrange(8, 128)))
+            case 4:
+                # thick and rounded, with oversized radii and rects partly off the target
+                rect = pygame.Rect(
+                    edgeX - rng.randrange(16), edgeY - rng.randrange(16), rng.randrange(2, 64), rng.randrange(2, 64)
+                )
+                renderer.rect(color, rect, rng.choice((1, 3, 5)), rng.choice((-1, 4, 12, 40)))
+            case 5:
+                start = (edgeX + rng.random(), edgeY + rng.random())
+                end = (start[0] + rng.uniform(-40, 40), start[1] + rng.uniform(-40, 40))
+                renderer.line(color, start, end, rng.choice((1, 2, 5)))
+            case _:
+                points = [(edgeX + rng.randrange(-40, 40), edgeY + rng.randrange(-40, 40)) for _ in range(3)]
+                renderer.aalines(color, rng.random() < 0.5, points)
+    renderer.flush()
+
+
+def main():
+    width = int(sys.argv[1]) if len(sys.argv) > 1 else 3840
+    height = int(sys.argv[2]) if len(sys.argv) > 2 else 2160
+    commands = int(sys.argv[3]) if len(sys.argv) > 3 else 5000
+    pygame.init()
+    sprite = pygame.Surface((128, 128), pygame.SRCALPHA)
+    sprite.fill((200, 120, 40, 160))
+    reference = pygame.Surface((width, height), pygame.SRCALPHA)
+    with TileRenderer(reference, workers=1) as renderer:
+        drawBatch(renderer, width, height, commands, sprite)
+    expected = pygame.image.tobytes(reference, "RGBA")
+
+    workerCounts = sorted({1, 2, 4, 8, 16, os.cpu_count() or 1})
+    baseline = 0.0
+    print(f"{width}x{height}, {commands} commands")
+    print(f"{'workers':>8} {'ms/batch':>10} {'speedup':>8} identical")
+    for workers in workerCounts:
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        with TileRenderer(surface, workers=workers) as renderer:
+            drawBatch(renderer, width, height, commands, sprite)
+            start = time.perf_counter()
+            for _ in range(5):
+                drawBatch(renderer, width, height, commands, sprite)
+            elapsed = (time.perf_counter() - start) / 5
+        baseline = baseline or elapsed
+        identical = pygame.image.tobytes(surface, "RGBA") == expected
+        print(f"{workers:>8} {elapsed * 1000:>10.1f} {baseline / elapsed:>8.2f} {identical}")
+
+
+if __name__ == "__main__":
+    main()